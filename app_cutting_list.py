@@ -1,18 +1,24 @@
+import logging
 import os
-import subprocess
 import sys
+from collections import Counter, defaultdict
+from bisect import bisect_left
+from functools import lru_cache, partial
 from typing import Any
 
+import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QStackedWidget, QWidget, QVBoxLayout,
     QHBoxLayout, QLabel, QPushButton, QLineEdit, QDialog,
     QFormLayout, QComboBox, QGridLayout, QCheckBox, QTextEdit, QFrame,
     QSizePolicy, QGroupBox, QStyle, QStyleOption, QMessageBox, QFileDialog,
-    QInputDialog, QDialogButtonBox
+    QInputDialog, QDialogButtonBox, QProgressDialog
 )
-from PyQt6.QtGui import QIcon, QColor, QPen, QPainter, QPaintEvent
-from PyQt6.QtCore import (Qt, pyqtSignal as Signal, QEvent, QPointF,
-                          QTimer)
+from PyQt6.QtGui import (QIcon, QColor, QPen, QPainter, QPaintEvent, QPixmap, QPolygonF, QCursor,
+                         QDesktopServices)
+from PyQt6.QtCore import (Qt, pyqtSignal as Signal, QEvent, QPointF, QLineF,
+                          QTimer, QStringListModel, QSignalBlocker, QObject, QMetaObject, QSignalMapper, QUrl,
+                          QThread)
 
 from constants import (FOOTING_IMAGE_WIDTH, RSB_IMAGE_WIDTH,
                        BAR_DIAMETERS, STIRRUP_ROW_IMAGE_WIDTH,
@@ -20,7 +26,7 @@ from constants import (FOOTING_IMAGE_WIDTH, RSB_IMAGE_WIDTH,
                        DEBUG_MODE, LOGO_MAP)
 from excel_writer import (process_rebar_input, add_sheet_cutting_list,
                           add_sheet_purchase_plan, add_sheet_cutting_plan,
-                          delete_blank_worksheets, add_concrete_plan_to_workbook)
+                          add_concrete_plan_to_workbook, save_workbook, requires_splicing)
 from rebar_calculations import compile_rebar
 from rebar_optimizer import find_optimized_cutting_plan
 from utils import (HoverButton, HoverLabel, resource_path,
@@ -29,9 +35,209 @@ from utils import (HoverButton, HoverLabel, resource_path,
                    parse_spacing_string, get_bar_dia, make_scrollable,
                    LinkSpinboxes, toggle_obj_visibility,
                    GlobalWheelEventFilter, is_widget_empty,
-                   style_invalid_input, get_dia_code, BlankDoubleSpinBox)
+                   style_invalid_input, get_dia_code, BlankDoubleSpinBox, configure_logging)
 from openpyxl import Workbook
 
+log = logging.getLogger(__name__)
+
+# Image paths used by the foundation dialog, resolved once at import
+_FOOTING_IMAGES = {
+    '1': resource_path('images/label_1ped.png'),
+    '2': resource_path('images/label_2ped.png'),
+    '3': resource_path('images/label_3ped.png'),
+    '4': resource_path('images/label_4ped.png')
+}
+_FOOTING_IMAGE_FALLBACK = resource_path('images/label_0ped.png')
+_TOP_BAR_IMAGE = resource_path('images/top_bar.png')
+_BOT_BAR_IMAGE = resource_path('images/bot_bar.png')
+_NO_TOP_BAR_IMAGE = resource_path('images/no_top_bar.png')
+_VERT_BAR_IMAGE = resource_path('images/vert_bar.png')
+_PERIM_BAR_IMAGES = {
+    '1': resource_path('images/perim_bar_1.png'),
+    '2': resource_path('images/perim_bar_2.png'),
+    '3': resource_path('images/perim_bar_3.png'),
+    '4': resource_path('images/perim_bar_4.png'),
+    '5': resource_path('images/perim_bar_5.png'),
+}
+_PERIM_BAR_IMAGE_FALLBACK = resource_path('images/perim_bar_0.png')
+_STIRRUP_IMAGES = {
+    'Outer': resource_path('images/stirrup_outer.png'),
+    'Diamond': resource_path('images/stirrup_diamond.png'),
+    'Tall': resource_path('images/stirrup_tall.png'),
+    'Wide': resource_path('images/stirrup_wide.png'),
+    'Octagon': resource_path('images/stirrup_octagon.png'),
+    'Vertical': resource_path('images/stirrup_flat_tall.png'),
+    'Horizontal': resource_path('images/stirrup_flat_wide.png'),
+}
+_STIRRUP_IMAGE_FALLBACK = resource_path('images/stirrup_none.png')
+_STIRRUP_TYPES = tuple(_STIRRUP_IMAGES)  # Stirrup type combo entries, in display order
+
+# Rich text shown by the foundation dialog info popups
+# NOTE: You should update the text to reflect the actual standard you are using.
+# For example, ACI 318 or a local building code.
+_HOOK_INFO_HTML = (
+    '<b>Hook Calculation Method</b>'
+    '<ul><li><b>Automatic:</b> Calculates the required hook length '
+    'based on ACI 318-25 Table 25.3.1 Standard 90° hook geometry for '
+    'development of deformed bars in tension (<i>12d</i><sub>b</sub>) </li>'
+    '<li><b>Manual:</b> Allows you to enter a custom, pre-calculated '
+    'length for the hook.</li></ul>'
+)
+_SPACING_HEADER_INFO_HTML = (
+    """<b>Stirrup Placement Guide</b><br><br>
+This section controls the vertical position and distribution of the stirrup bundles along the pedestal.
+<br><br>
+It's a two-step process:
+<ol>
+    <li><b>Start From:</b> First, select your 'zero' reference point from which all measurements will begin.</li>
+    <li><b>Spacing:</b> Next, enter the series of spacing values. The first value positions the first stirrup relative to your chosen start point.</li>
+</ol>
+Use the diagram on the left to visually confirm that the stirrup placement matches your input."""
+)
+_SPACING_EXTENT_INFO_HTML = (
+    """<b>Spacing Start Point</b><br><br>
+This sets the <b>'zero' reference point</b> for the first measurement in the 'Spacing' field.
+<hr>
+<ul>
+    <li><b>From Face of Pad:</b> 'Zero' is the top face of the footing (pad).</li>
+    <li><b>From Bottom Bar:</b> 'Zero' is at the elevation of the bottom rebar.</li>
+    <li><b>From Top (to Face of Pad):</b> 'Zero' is the top of the pedestal, measuring downwards. Spacing will only be applied within the concrete pedestal.</li>
+</ul>"""
+)
+_BUNDLE_INFO_HTML = (
+    """<b>Understanding the Stirrup Bundle</b><br><br>
+This section defines the combination of stirrups that will be installed together as a single unit.
+<ul>
+    <li><b>Forms One Set:</b> All stirrup shapes you add (e.g., an Outer, a Tall) are considered one complete set.</li>
+    <li><b>Installed as a Group:</b> At each specified height, all stirrups in the set are installed as a single, tightly packed group.</li>
+    <li><b>Spacing Applies to the Group:</b> The spacing you define (e.g., <code>5@100</code>) dictates the vertical distance from the center of one group to the center of the next.</li>
+</ul>
+Think of it as designing a 'kit' of stirrups that gets repeated along the height of the pedestal."""
+)
+_SPACING_INFO_HTML = (
+    """<b>Stirrup Spacing Guide</b><br><br>
+Defines stirrup locations relative to your chosen 'Start From' point.
+
+<hr>
+
+<b>Key Principle:</b>
+<p>The <u>first spacing value</u> in your list always positions the <u>first stirrup</u>.</p>
+
+<b>Example: </b> <b><code>5@100, rest@150</code></b></p>
+<ul>
+    <li>The <b>first</b> of the 5 stirrups is placed <b>100mm</b> from the start point.</li>
+    <li>The next 4 are also 100mm apart. The remaining are 150mm apart.</li>"""
+)
+
+# Detail panel text for a disabled rebar section
+_NOT_USED_HTML = "<i><font color='#A7A6A6'>Not Used</font></i>"
+
+# QSS classes of the market lengths grid cells
+_GRID_CORNER_CELL = 'grid-cell header-cell header-corner-cell'
+_GRID_COLUMN_HEADER_CELL = 'grid-cell header-cell header-column-cell'
+_GRID_ROW_HEADER_CELL = 'grid-cell header-cell header-row-cell'
+_GRID_ALT_ROW_HEADER_CELL = 'grid-cell header-cell alternate-row-cell header-row-cell'
+_GRID_ROW_CELL = 'grid-cell non-header-cell'
+_GRID_ALT_ROW_CELL = 'grid-cell alternate-row-cell non-header-cell'
+# (row header, row background) classes, indexed by grid row % 2; odd rows are the alternate ones
+_GRID_ROW_CLASSES = ((_GRID_ROW_HEADER_CELL, _GRID_ROW_CELL), (_GRID_ALT_ROW_HEADER_CELL, _GRID_ALT_ROW_CELL))
+
+
+def _detail_table_html(rows: list[tuple[str, str]], notes: tuple[str, ...] = ()) -> str:
+    """
+    Builds the HTML table shown by one section of the foundation detail panel.
+
+    Args:
+        rows: (label, value) pairs; values may contain markup.
+        notes: Extra lines listed below the rows, across both columns.
+
+    Returns:
+        The HTML for the section's rich-text label.
+    """
+    html = ['<table cellspacing="0" cellpadding="0">']
+    for label, value in rows:
+        html.append(f'<tr><td valign="top" style="padding: 3px 0 4px 13px;">{label}</td>'
+                    f'<td style="padding: 3px 0 4px 27px;">{value}</td></tr>')
+    for note in notes:
+        html.append(f'<tr><td colspan="2" style="padding-left: 23px;">{note}</td></tr>')
+    html.append('</table>')
+    return ''.join(html)
+
+def _form_label(text: str, label_class: type[QLabel] = QLabel) -> QLabel:
+    """
+    Creates a label styled as a form field label.
+
+    Args:
+        text: The label text.
+        label_class: QLabel or a subclass such as HoverLabel.
+
+    Returns:
+        The new label.
+    """
+    label = label_class(text)
+    label.setProperty('class', 'form-label')
+    return label
+
+def _freeze(value: Any) -> Any:
+    """Converts nested dicts and lists into hashable tuples, with dict items sorted by key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _rebar_signature(data: dict) -> tuple:
+    """
+    Returns a hashable key of everything in a foundation's data that affects its rebars, i.e. all but its name.
+
+    Args:
+        data: The foundation data, as from FoundationItem.data.
+
+    Returns:
+        Equal tuples for foundations whose compiled rebars are identical.
+    """
+    return _freeze({key: value for key, value in data.items() if key != 'name'})
+
+def _compile_grouped_rebars(data: dict) -> list[dict[str, Any]]:
+    """Compiles a foundation's rebars and groups them for the cutting list."""
+    return process_rebar_input(compile_rebar(data))
+
+@lru_cache(maxsize=None)
+def _foundation_dialog_icon() -> QIcon:
+    """Returns the window icon shared by every foundation dialog, loaded on first use (needs a QApplication)."""
+    return QIcon(resource_path('images/logo.png'))
+
+@lru_cache(maxsize=None)
+def _shared_list_model(items: tuple[str, ...]) -> QStringListModel:
+    """
+    Returns a read-only list model for the given items, shared by every combo box that lists them.
+
+    Args:
+        items: The combo box entries, e.g. the available bar diameters.
+
+    Returns:
+        A QStringListModel owned by the application instance.
+    """
+    return QStringListModel(list(items), QApplication.instance())
+
+@lru_cache(maxsize=256)
+def _parse_spacing_cached(text: str) -> tuple:
+    """
+    Parses a stirrup spacing string, memoizing the result per raw text.
+
+    Args:
+        text: The raw spacing text, e.g. '1@50, 5@100, rest@150'.
+
+    Returns:
+        A tuple of (quantity, spacing) pairs, or an empty tuple if the text is blank or invalid.
+    """
+    if not text:
+        return ()
+    try:
+        return tuple(parse_spacing_string(text))
+    except (TypeError, ValueError):
+        return ()
+
 class DrawStirrup(QWidget):
     def __init__(self, width: int, parent: QWidget | None = None) -> None:
         """
@@ -42,7 +248,6 @@ class DrawStirrup(QWidget):
             parent: The parent widget, if any.
         """
         super().__init__(parent)
-        width += 0
         self.setFixedWidth(width)
         self.setMaximumHeight(int(1.6 * width))
 
@@ -52,10 +257,23 @@ class DrawStirrup(QWidget):
         self.pad_t = 300
         self.cc = 75
         self.extent = 'From Face of Pad'
-        self.spacing = []
+        self.spacing = ()
+        self._spacing_text = ''  # Stripped text self.spacing was parsed from
         self.bot_bar_diameter = 10
         self.vert_bar_diameter = 16
         self.stirrup_qty = 0
+        self._last_state = None  # Inputs used for the last redraw, to skip redundant repaints
+        self._last_key = None  # Inputs and height the stirrup quantity was last counted for
+        self._stirrup_ys: list[float] | None = None  # Stirrup positions from the last count, if kept for painting
+        self._geometry_dirty = True  # Rebuild the cached outline/bar coordinates on the next paint
+        self._pts = None
+        self._bg_cache: QPixmap | None = None  # Pre-rendered outline and bars
+
+        # Pens, built once instead of on every paint
+        self._light_dark_pen = QPen(QColor('#666666'), 0.5)
+        self._top_bottom_bar_pen = QPen(QColor('#9F9F9F9F'), 1.5)
+        self._vert_bar_pen = QPen(QColor('#999999'), 2)
+        self._stirrups_pen = QPen(QColor('#FF3333'), 2)
 
     def update_dimensions(self, footing_details, extent, spacing, bot_bar_diameter, vert_bar_diameter):
         """Updates the drawing dimensions from the input widgets and triggers a repaint."""
@@ -69,28 +287,49 @@ class DrawStirrup(QWidget):
         self.vert_bar_diameter = get_bar_dia(vert_bar_diameter_str.strip(), 'ph')
         self.extent = extent.currentText()
 
-        if len(spacing.toPlainText()) == 0:
-            self.spacing = []
-        else:
-            try:
-                self.spacing = parse_spacing_string(spacing.toPlainText())
-            except (TypeError, ValueError):
-                self.spacing = []
-        self._recalculate_quantity() # Recalculate the quantity immediately whenever dimensions change.
+        # Stripped like in validation, so both share one parse of the same text
+        spacing_text = spacing.toPlainText().strip()
+        if spacing_text != self._spacing_text:  # Usually another input triggered the update
+            self._spacing_text = spacing_text
+            self.spacing = _parse_spacing_cached(spacing_text)
+
+        # Skip the recalculation and repaint entirely if nothing relevant changed
+        state = (self.ped_h, self.ped_bx, self.pad_t, self.cc, self.extent,
+                 self.spacing, self.bot_bar_diameter, self.vert_bar_diameter)
+        if state == self._last_state:
+            return
+        if self._last_state is None or state[:4] != self._last_state[:4]:
+            self._geometry_dirty = True  # The outline only depends on the dimensions, not on the stirrups
+        self._last_state = state
+
+        if not self.isVisible():
+            return  # Counted on demand by get_qty, or painted in full when the widget is shown
+        # Recalculate the quantity immediately whenever dimensions change, keeping the positions for the repaint
+        self._recalculate_quantity(collect_ys=True)
         self.update()  # Crucial: schedules a repaint which calls paintEvent
 
-    def _recalculate_quantity(self):
+    def _recalculate_quantity(self, collect_ys: bool = False) -> None:
         """
         Calculates the stirrup quantity without performing any drawing.
         This allows the value to be updated even if the widget is not visible.
+
+        Args:
+            collect_ys: Whether to also keep the stirrup positions for paintEvent.
         """
-        # This logic is a subset of paintEvent, focused only on calculation.
+        # The count depends on the drawing scale too, hence the height in the key
+        key = (self.ped_h, self.ped_bx, self.pad_t, self.cc, self.extent, self.spacing,
+               self.bot_bar_diameter, self.vert_bar_diameter, self.height())
+        if key == self._last_key and (self._stirrup_ys is not None or not collect_ys):
+            return
+        self._last_key = key
+
         real_h = self.ped_h
         real_bx = self.ped_bx
         real_t = self.pad_t
 
-        if real_h + real_t == 0 or real_bx == 0:
+        if real_h + real_t == 0 or real_bx == 0 or not self.spacing:
             self.stirrup_qty = 0
+            self._stirrup_ys = [] if collect_ys else None
             return
 
         # Simplified scale calculation (only what's needed for Y-axis)
@@ -115,29 +354,29 @@ class DrawStirrup(QWidget):
             start_y = vbar_y2
             target_y = y2
 
-        actual_count = 0
+        actual_count, last_y, ys = self._walk_stirrups(self.spacing, start_y, target_y, scale, collect_ys=collect_ys)
         if self.extent in ['From Face of Pad', 'From Bottom Bar']:
-            _, count, last_y = self.loop_stirrup(self.spacing, start_y=start_y, target_y=target_y,
-                                                 left_x=0, right_x=0, scale=scale)  # xs don't matter for count
-            actual_count += count
+            # Add Topmost Stirrup if remaining gap >= concrete cover
             if (actual_count > 0) and (last_y - vbar_y2 >= px_cc):
+                if collect_ys:
+                    ys.append(vbar_y2)
                 actual_count += 1
-        else:  # From Top
-            _, count, _ = self.loop_stirrup(self.spacing, start_y=start_y, target_y=target_y,
-                                            left_x=0, right_x=0, scale=scale)
-            actual_count += count
 
+        self._stirrup_ys = ys
         self.stirrup_qty = actual_count
 
-    def paintEvent(self, event: QPaintEvent) -> None:
-        """
-        Handles the repaint event to draw the footing and stirrups on the widget.
+    def resizeEvent(self, event) -> None:
+        """Marks the cached geometry and stirrup count as stale since the drawing scale depends on the widget size."""
+        self._geometry_dirty = True
+        self._last_key = None
+        super().resizeEvent(event)
 
-        Args:
-            event: The paint event.
+    def _rebuild_geometry(self) -> None:
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)  # Makes the lines smooth
+        Recomputes the outline and bar coordinates, which only depend on the
+        dimension inputs and the widget size, so paintEvent can reuse them.
+        """
+        self._geometry_dirty = False
 
         # Get the dimensions of the widget
         padding = 2
@@ -151,8 +390,9 @@ class DrawStirrup(QWidget):
 
         real_height = real_h + real_t
         if real_height == 0 or real_bx == 0:
-            painter.end()  # Ensure the painter is properly closed
-            return  # Stop drawing
+            self._pts = None  # Nothing to draw
+            self._render_background()
+            return
         px_height = c_height - 2 * padding
         px_bx = (c_width - 2 * padding) / 2
         scale = px_height / real_height
@@ -161,14 +401,6 @@ class DrawStirrup(QWidget):
         px_h = real_h * scale
         px_cc = real_cc * scale
 
-        # Define the pen for drawing the lines
-        light_dark_pen = QPen(QColor('#666666'), 0.5)
-        top_bottom_bar_pen = QPen(QColor('#9F9F9F9F'), 1.5)
-        vert_bar_pen = QPen(QColor('#999999'), 2)
-        stirrups_pen = QPen(QColor('#FF3333'), 2)
-        painter.setPen(light_dark_pen)
-
-        # Define the three points of the triangle
         x1 = padding
         x2 = px_bx/2 + x1
         x3 = px_bx + x2
@@ -186,126 +418,160 @@ class DrawStirrup(QWidget):
         p7 = QPointF(x4, y2)
         p8 = QPointF(x4, y1)
         cc_y = QPointF(0, px_cc)
+        self._pts = (p1, p2, p3, p4, p5, p6, p7, p8)
+        # Pad top, pedestal and pad top again; the pad sides (p1-p2, p7-p8) are left open
+        self._outline_poly = QPolygonF([p2, p3, p4, p5, p6, p7])
 
-        # Draw the lines connecting the points
-        # painter.drawLine(p1, p2)
-        painter.drawLine(p2, p3)
-        painter.drawLine(p3, p4)
-        painter.drawLine(p4, p5)
-        painter.drawLine(p5, p6)
-        painter.drawLine(p6, p7)
-        # painter.drawLine(p7, p8)
-        painter.drawLine(p8, p1)
-
-        # Draw Top Bottom Bar
-        painter.setPen(top_bottom_bar_pen)
-        painter.drawLine(p1 - cc_y, p8 - cc_y)
-        painter.drawLine(p2 + cc_y, p7 + cc_y)
+        # Top and bottom bars
+        self._top_bottom_bar_lines = [QLineF(p1 - cc_y, p8 - cc_y), QLineF(p2 + cc_y, p7 + cc_y)]
 
-        # Draw Vertical Bar
+        # Vertical bars
         vbar_x1 = x1 + real_cc * scale_x
         vbar_x2 = x2 + real_cc * scale_x
         vbar_x3 = x3 - real_cc * scale_x
         vbar_x4 = x4 - real_cc * scale_x
         vbar_y1 = y1 - px_cc - 2.5
         vbar_y2 = y3 + px_cc
+        self._vert_bar_lines = [
+            QLineF(vbar_x1, vbar_y1, vbar_x2, vbar_y1),
+            QLineF(vbar_x2, vbar_y1, vbar_x2, vbar_y2),
+            QLineF(vbar_x3, vbar_y1, vbar_x4, vbar_y1),
+            QLineF(vbar_x3, vbar_y1, vbar_x3, vbar_y2),
+        ]
 
-        painter.setPen(vert_bar_pen)
-        painter.drawLine(QPointF(vbar_x1, vbar_y1), QPointF(vbar_x2, vbar_y1))
-        painter.drawLine(QPointF(vbar_x2, vbar_y1), QPointF(vbar_x2, vbar_y2))
-        painter.drawLine(QPointF(vbar_x3, vbar_y1), QPointF(vbar_x4, vbar_y1))
-        painter.drawLine(QPointF(vbar_x3, vbar_y1), QPointF(vbar_x3, vbar_y2))
+        # Stirrup line ends; their heights come from _recalculate_quantity
+        self._stirrup_xs = (vbar_x2, vbar_x3)
 
-        painter.setPen(stirrups_pen)
+        self._render_background()
 
-        if self.extent == 'From Face of Pad':
-            start_y = y2
-            target_y = vbar_y2
-        elif self.extent == 'From Bottom Bar':
-            start_y = (y1 - px_cc - scale * (2*self.bot_bar_diameter + self.vert_bar_diameter))
-            target_y = vbar_y2
-        else:  # From Top
-            start_y = vbar_y2
-            target_y = y2
-        actual_count = 0
+    def _render_background(self) -> None:
+        """
+        Paints the static part of the drawing (outline, top/bottom bars and vertical bars)
+        into a pixmap so that repaints only need to blit it and draw the stirrups.
+        """
+        dpr = self.devicePixelRatioF()
+        self._bg_cache = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        self._bg_cache.setDevicePixelRatio(dpr)
+        self._bg_cache.fill(Qt.GlobalColor.transparent)  # Let the page background show through
+        if self._pts is None:
+            return
 
-        if self.extent in ['From Face of Pad', 'From Bottom Bar']:
-            lines, count, last_y = self.loop_stirrup(self.spacing, start_y=start_y, target_y=target_y,
-                                                     left_x=vbar_x2, right_x=vbar_x3, scale=scale)
-            for p1, p2 in lines:
-                painter.drawLine(p1, p2)
-            actual_count += count
+        painter = QPainter(self._bg_cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)  # Makes the lines smooth
+        painter.setPen(self._light_dark_pen)
 
-            # Add Topmost Stirrup if remaining gap >= concrete cover
-            if (actual_count > 0) and (last_y - vbar_y2 >= px_cc):
-                painter.drawLine(QPointF(vbar_x2, vbar_y2), QPointF(vbar_x3, vbar_y2))
-                actual_count += 1
+        # Draw the lines connecting the points
+        p1, p8 = self._pts[0], self._pts[7]
+        painter.drawPolyline(self._outline_poly)
+        painter.drawLine(p8, p1)
 
-        else:  # From Top
-            lines, count, last_y = self.loop_stirrup(self.spacing, start_y=start_y, target_y=target_y,
-                                                     left_x=vbar_x2, right_x=vbar_x3, scale=scale)
-            for p1, p2 in lines:
-                painter.drawLine(p1, p2)
-            actual_count += count
+        # Draw Top Bottom Bar
+        painter.setPen(self._top_bottom_bar_pen)
+        painter.drawLines(self._top_bottom_bar_lines)
+
+        # Draw Vertical Bar
+        painter.setPen(self._vert_bar_pen)
+        painter.drawLines(self._vert_bar_lines)
+
+        painter.end()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        Handles the repaint event to draw the footing and stirrups on the widget.
+
+        Args:
+            event: The paint event.
+        """
+        if self._geometry_dirty:
+            self._rebuild_geometry()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_cache)
+        if self._pts is None:
+            painter.end()  # Ensure the painter is properly closed
+            return  # Stop drawing
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)  # Makes the lines smooth
+        painter.setPen(self._stirrups_pen)
+
+        # Usually a no-op: update_dimensions already counted the stirrups and kept their positions
+        self._recalculate_quantity(collect_ys=True)
+        if self._stirrup_ys:
+            x1, x2 = self._stirrup_xs
+            painter.drawLines([QLineF(x1, y, x2, y) for y in self._stirrup_ys])  # All stirrups in one call
 
-        self.stirrup_qty = actual_count
         painter.end()
 
     @staticmethod
-    def loop_stirrup(spacing_list: list[tuple[int | str, float]], start_y: float, target_y: float, left_x: float,
-                     right_x: float, scale: float) -> tuple[list[tuple[QPointF, QPointF]], int, float]:
+    def _walk_stirrups(spacing_list: list[tuple[int | str, float]], start_y: float, target_y: float, scale: float,
+                       collect_ys: bool = True) -> tuple[int, float, list[float] | None]:
         """
-        Calculates the line coordinates for stirrups based on a spacing list.
+        Walks the spacing list from start_y towards target_y and places the stirrups.
 
         Args:
             spacing_list: A list of (quantity, spacing) tuples.
-            start_y: The starting vertical coordinate for drawing.
+            start_y: The starting vertical coordinate.
             target_y: The ending vertical coordinate.
-            left_x: The starting horizontal coordinate.
-            right_x: The ending horizontal coordinate.
             scale: The drawing scale factor.
+            collect_ys: Whether to return the stirrup positions; counting alone allocates nothing per stirrup.
 
         Returns:
-            A tuple containing the list of lines to draw, the total count of stirrups,
-            and the last y-coordinate drawn.
+            A tuple containing the total count of stirrups, the last y-coordinate reached,
+            and the y-coordinate of each stirrup (None if not collected).
         """
         count = 0
         current_y = start_y
-        lines = []
+        ys = [] if collect_ys else None
+        add_y = ys.append if collect_ys else None
+        downwards = target_y < start_y
         for qty, spacing in spacing_list:
             spacing = spacing * scale
             if isinstance(qty, int):
-                for _ in range(qty):
-                    if target_y < start_y:
+                # Stepping stops at the first stirrup past the target, which still moves current_y
+                if downwards:
+                    for _ in range(qty):
                         current_y -= spacing
                         if current_y < target_y:
                             break
-                    else:
+                        if add_y:
+                            add_y(current_y)
+                        count += 1
+                else:
+                    for _ in range(qty):
                         current_y += spacing
                         if current_y > target_y:
                             break
-                    lines.append((QPointF(left_x, current_y), QPointF(right_x, current_y)))
-                    count += 1
-            elif qty == 'rest':
-                if target_y < start_y:
-                    while current_y - spacing >= target_y:
-                        current_y -= spacing
-                        lines.append((QPointF(left_x, current_y), QPointF(right_x, current_y)))
+                        if add_y:
+                            add_y(current_y)
                         count += 1
+            elif qty == 'rest' and spacing > 0:
+                # Fill the rest in one go. accumulate repeats the same float steps a loop would take, so the
+                # positions (and the fit test against target_y) match stepping one stirrup at a time exactly;
+                # the estimate gets two extra steps of margin and the overshoot is cut off afterwards
+                n_max = max(0, int(abs(target_y - current_y) // spacing) + 2)
+                steps = np.full(n_max + 1, spacing)
+                steps[0] = current_y
+                if downwards:
+                    rest_ys = np.subtract.accumulate(steps)[1:]
+                    n = int(np.count_nonzero(rest_ys >= target_y))
                 else:
-                    while current_y + spacing <= target_y:
-                        current_y += spacing
-                        lines.append((QPointF(left_x, current_y), QPointF(right_x, current_y)))
-                        count += 1
-        return lines, count, current_y
+                    rest_ys = np.add.accumulate(steps)[1:]
+                    n = int(np.count_nonzero(rest_ys <= target_y))
+                if n:
+                    if collect_ys:
+                        ys.extend(rest_ys[:n].tolist())
+                    current_y = float(rest_ys[n - 1])
+                    count += n
+        return count, current_y, ys
 
     def get_qty(self) -> int:
         """
-        Returns the calculated quantity of stirrups from the last paint event.
+        Returns the quantity of stirrups for the current inputs, counting them first if they changed since.
 
         Returns:
             The total number of stirrups.
         """
+        self._recalculate_quantity()
         return self.stirrup_qty
 
 class FoundationDetailsDialog(QDialog):
@@ -313,12 +579,12 @@ class FoundationDetailsDialog(QDialog):
     A modal dialog with multiple pages to enter or edit details for a foundation type.
     """
     def __init__(self, existing_details: dict = None, parent=None,
-                 existing_names: list[str] = None):
+                 existing_names: set[str] | list[str] = None):
         """Initializes the multi-page dialog."""
         super().__init__(parent)
         self.setWindowTitle('Foundation Details')
         self.setModal(True)
-        self.setWindowIcon(QIcon(resource_path('images/logo.png')))
+        self.setWindowIcon(_foundation_dialog_icon())
         self.setGeometry(100, 100, 500, 650)
         self.setMinimumWidth(500)
         self.setMinimumHeight(650)
@@ -338,8 +604,11 @@ class FoundationDetailsDialog(QDialog):
         self.stirrup_canvas = None
         self.stirrup_rows_layout = None
         self.remove_stirrup_button = None
+        self._stirrup_rows: list[dict[str, Any]] = []  # Same list as self.widgets['Stirrups']['Types']
+        self._stirrup_row_pool: list[dict[str, Any]] = []  # Hidden rows kept for reuse by add_stirrup_row
+        self._redraw_connections: list[QMetaObject.Connection] = []  # Live redraw trigger connections
         self.info_popup = InfoPopup(self)
-        self.existing_names = existing_names if existing_names is not None else []
+        self.existing_names = set(existing_names) if existing_names is not None else set()  # Own copy
 
         # Redraw debounce
         self.debounce_timer = QTimer(self)
@@ -347,11 +616,34 @@ class FoundationDetailsDialog(QDialog):
         self.debounce_timer.setSingleShot(True)
         # noinspection PyUnresolvedReferences
         self.debounce_timer.timeout.connect(self.update_stirrup_drawing)
+        # Spin boxes and combo boxes redraw on the next event loop pass; signals emitted in the same pass
+        # (e.g. a value change and its text change) still collapse into a single redraw
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setInterval(0)
+        self._redraw_timer.setSingleShot(True)
+        # noinspection PyUnresolvedReferences
+        self._redraw_timer.timeout.connect(self.update_stirrup_drawing)
 
         # Create pages and add them to the stacked widget
         self.create_footing_page()
         self.create_rsb_page()
 
+        # Widget groups reused by validation and by the redraw signal wiring
+        self._footing_validate_widgets = tuple(
+            self.widgets[key] for key in ('name', 'n_footing', 'cc', 'bx', 'by', 'h', 'Bx', 'By', 't'))
+        # Input widgets of each RSB section; the stirrup 'Types' row list is not part of the plan
+        self._rsb_validate_plan = {
+            section_name: tuple(widget for key, widget in self.widgets[section_name].items() if key != 'Types')
+            for section_name in self.group_box
+        }
+        self._get_data_plan = self._build_get_data_plan()
+        self._redraw_dimension_widgets = (self.widgets['h'], self.widgets['bx'], self.widgets['t'], self.widgets['cc'])
+        self._redraw_rebar_widgets = (
+            self.widgets['Bottom Bar']['Diameter'],
+            self.widgets['Vertical Bar']['Diameter'],
+            self.widgets['Stirrups']['Extent']
+        )
+
         # Connect signals after all widgets have been created
         self.connect_stirrup_redraw_signals()
 
@@ -360,12 +652,9 @@ class FoundationDetailsDialog(QDialog):
 
         # Pre-fill fields if editing existing data
         if existing_details:
-            # If editing, remove its own name from the list of names to check against
-            current_name = existing_details.get('name', '')
-            if current_name in self.existing_names:
-                self.existing_names.remove(current_name)
+            # If editing, remove its own name from the names to check against
+            self.existing_names.discard(existing_details.get('name', ''))
             self.populate_data(existing_details)
-            self.update_stirrup_drawing()
         else:
             self.add_stirrup_row()
 
@@ -394,7 +683,7 @@ class FoundationDetailsDialog(QDialog):
         self.widgets['name'] = name
 
         # Image
-        footing_img = get_img(resource_path('images/label_1ped.png'), FOOTING_IMAGE_WIDTH, FOOTING_IMAGE_WIDTH)
+        footing_img = get_img(_FOOTING_IMAGES['1'], FOOTING_IMAGE_WIDTH, FOOTING_IMAGE_WIDTH)
         content_layout.addWidget(footing_img)
         content_layout.addSpacing(10)
 
@@ -404,120 +693,38 @@ class FoundationDetailsDialog(QDialog):
         form_layout.setSpacing(0)
         form_layout.setColumnStretch(2, 1)  # Allow the column (2) to stretch, keeping other columns fixed
 
-        # Pedestal Per Footing
+        # --- Inputs ---
         ped_per_footing = BlankSpinBox(1, 4, initial=1)
-        ped_per_footing.setProperty('class', 'form-value')
-        image_map = {
-            '1': resource_path('images/label_1ped.png'),
-            '2': resource_path('images/label_2ped.png'),
-            '3': resource_path('images/label_3ped.png'),
-            '4': resource_path('images/label_4ped.png')
-        }
-        label = QLabel('Pedestal Per Footing:')
-        label.setProperty('class', 'form-label')
-        form_layout.addWidget(label, 1, 0, 1, 2)
-        form_layout.addWidget(ped_per_footing, 1, 2, 1, 2)
         # noinspection PyUnresolvedReferences
         ped_per_footing.valueChanged.connect(
-            lambda value: update_image(str(value), image_map, footing_img,
-                                               fallback=resource_path('images/label_0ped.png')))
-        self.widgets['n_ped'] = ped_per_footing
-
-        # Total Number of Footing
+            lambda value: update_image(str(value), _FOOTING_IMAGES, footing_img,
+                                       fallback=_FOOTING_IMAGE_FALLBACK))
         n_footing = BlankSpinBox(1, 9_999, 1)
-        n_footing.setProperty('class', 'form-value')
-        label = QLabel('Total Number of Footing:')
-        label.setProperty('class', 'form-label')
-        form_layout.addWidget(label, 2, 0, 1, 2)
-        form_layout.addWidget(n_footing, 2, 2, 1, 2)
-        self.widgets['n_footing'] = n_footing
-
-        # Concrete Cover
         cc = BlankSpinBox(1, 999, 75, suffix=' mm')
-        cc.setProperty('class', 'form-value')
-        label = QLabel('Concrete Cover:')
-        label.setProperty('class', 'form-label')
-        form_layout.addWidget(label, 3, 0, 1, 2)
-        form_layout.addWidget(cc, 3, 2, 1, 2)
-        self.widgets['cc'] = cc
-
-        # Pedestal Width
         ped_width_x = BlankSpinBox(0, 99_999, suffix=' mm')
         ped_width_y = BlankSpinBox(0, 99_999, suffix=' mm')
-        ped_width_x.setProperty('class', 'form-value')
-        ped_width_y.setProperty('class', 'form-value')
         ped_link_checkbox = LinkSpinboxes(ped_width_x, ped_width_y, 'Keep square')
-        label = QLabel('Pedestal Width (Along X)')
-        label.setProperty('class', 'form-label')
-        form_layout.addWidget(label, 4, 0)
-        variable = QLabel('bx')
-        variable.setProperty('class', 'variable-label')
-        form_layout.addWidget(label, 4, 0)
-        form_layout.addWidget(variable, 4, 1)
-        form_layout.addWidget(ped_width_x, 4, 2, 1, 2)
-        label = QLabel('Pedestal Width (Along Y)')
-        label.setProperty('class', 'form-label')
-        form_layout.addWidget(label, 5, 0)
-        variable = QLabel('by')
-        variable.setProperty('class', 'variable-label')
-        form_layout.addWidget(label, 5, 0)
-        form_layout.addWidget(variable, 5, 1)
-        form_layout.addWidget(ped_width_y, 5, 2)
-        form_layout.addWidget(ped_link_checkbox, 5, 3)
-        self.widgets['bx'] = ped_width_x
-        self.widgets['by'] = ped_width_y
-
-        # Pedestal Height
         ped_height = BlankSpinBox(0, 999_999, suffix=' mm')
-        ped_height.setProperty('class', 'form-value')
-        label = QLabel('Pedestal Height')
-        label.setProperty('class', 'form-label')
-        form_layout.addWidget(label, 6, 0)
-        variable = QLabel('h')
-        variable.setProperty('class', 'variable-label')
-        form_layout.addWidget(label, 6, 0)
-        form_layout.addWidget(variable, 6, 1)
-        form_layout.addWidget(ped_height, 6, 2, 1, 2)
-        self.widgets['h'] = ped_height
-
-        # Pad Width
         pad_width_x = BlankSpinBox(0, 999_999, suffix=' mm')
         pad_width_y = BlankSpinBox(0, 999_999, suffix=' mm')
-        pad_width_x.setProperty('class', 'form-value')
-        pad_width_y.setProperty('class', 'form-value')
         pad_link_checkbox = LinkSpinboxes(pad_width_x, pad_width_y, 'Keep square')
-        label = QLabel('Pad Width (Along X)')
-        label.setProperty('class', 'form-label')
-        form_layout.addWidget(label, 7, 0)
-        variable = QLabel('Bx')
-        variable.setProperty('class', 'variable-label')
-        form_layout.addWidget(label, 7, 0)
-        form_layout.addWidget(variable, 7, 1)
-        form_layout.addWidget(pad_width_x, 7, 2, 1, 2)
-        label = QLabel('Pad Width (Along Y)')
-        label.setProperty('class', 'form-label')
-        form_layout.addWidget(label, 8, 0)
-        variable = QLabel('By')
-        variable.setProperty('class', 'variable-label')
-        form_layout.addWidget(label, 8, 0)
-        form_layout.addWidget(variable, 8, 1)
-        form_layout.addWidget(pad_width_y, 8, 2)
-        form_layout.addWidget(pad_link_checkbox, 8, 3)
-        self.widgets['Bx'] = pad_width_x
-        self.widgets['By'] = pad_width_y
-
-        # Pad thickness
         pad_thickness = BlankSpinBox(0, 99_999, suffix=' mm')
-        pad_thickness.setProperty('class', 'form-value')
-        label = QLabel('Pad Thickness')
-        label.setProperty('class', 'form-label')
-        form_layout.addWidget(label, 9, 0)
-        variable = QLabel('t')
-        variable.setProperty('class', 'variable-label')
-        form_layout.addWidget(label, 9, 0)
-        form_layout.addWidget(variable, 9, 1)
-        form_layout.addWidget(pad_thickness, 9, 2, 1, 2)
-        self.widgets['t'] = pad_thickness
+
+        # --- Form rows: (widget key, label, variable, input, extra widget) ---
+        rows = [
+            ('n_ped', 'Pedestal Per Footing:', None, ped_per_footing, None),
+            ('n_footing', 'Total Number of Footing:', None, n_footing, None),
+            ('cc', 'Concrete Cover:', None, cc, None),
+            ('bx', 'Pedestal Width (Along X)', 'bx', ped_width_x, None),
+            ('by', 'Pedestal Width (Along Y)', 'by', ped_width_y, ped_link_checkbox),
+            ('h', 'Pedestal Height', 'h', ped_height, None),
+            ('Bx', 'Pad Width (Along X)', 'Bx', pad_width_x, None),
+            ('By', 'Pad Width (Along Y)', 'By', pad_width_y, pad_link_checkbox),
+            ('t', 'Pad Thickness', 't', pad_thickness, None),
+        ]
+        for row, (key, text, variable, widget, extra) in enumerate(rows, 1):
+            self._add_form_row(form_layout, row, text, widget, variable, extra)
+            self.widgets[key] = widget
 
         # Add layouts and widgets to page
         content_layout.addLayout(form_layout)
@@ -543,6 +750,35 @@ class FoundationDetailsDialog(QDialog):
 
         self.stacked_widget.addWidget(page)
 
+    @staticmethod
+    def _add_form_row(form_layout: QGridLayout, row: int, text: str, widget: QWidget,
+                      variable: str | None = None, extra: QWidget | None = None) -> None:
+        """
+        Adds a labelled input row to the footing form grid.
+
+        Args:
+            form_layout: The grid layout of the footing form.
+            row: The grid row to place the widgets on.
+            text: The text of the row label.
+            widget: The input widget of the row.
+            variable: The variable name shown next to the label, if any.
+            extra: An optional widget placed after the input (e.g. a link checkbox).
+        """
+        label = _form_label(text)
+        widget.setProperty('class', 'form-value')
+        if variable is None:
+            form_layout.addWidget(label, row, 0, 1, 2)
+        else:
+            variable_label = QLabel(variable)
+            variable_label.setProperty('class', 'variable-label')
+            form_layout.addWidget(label, row, 0)
+            form_layout.addWidget(variable_label, row, 1)
+        if extra is None:
+            form_layout.addWidget(widget, row, 2, 1, 2)
+        else:
+            form_layout.addWidget(widget, row, 2)
+            form_layout.addWidget(extra, row, 3)
+
     def create_rsb_page(self) -> None:
         """Builds the UI for the second page (Reinforcement Details)."""
         page = QWidget()
@@ -563,7 +799,7 @@ class FoundationDetailsDialog(QDialog):
             section_layout.setSpacing(0)
 
             # Left Image
-            image_map = {'True': image_path, 'False': resource_path('images/no_top_bar.png')}
+            image_map = {'True': image_path, 'False': _NO_TOP_BAR_IMAGE}
             image_label = get_img(image_map['True'], image_width, image_width)
             section_layout.addWidget(image_label)
 
@@ -575,10 +811,9 @@ class FoundationDetailsDialog(QDialog):
             row_1 = QHBoxLayout()
             row_1.setContentsMargins(0, 0, 0, 0)
             row_1.setSpacing(0)
-            label = QLabel('Diameter:')
-            label.setProperty('class', 'form-label')
+            label = _form_label('Diameter:')
             bar_size = QComboBox()
-            bar_size.addItems(BAR_DIAMETERS)
+            bar_size.setModel(_shared_list_model(BAR_DIAMETERS))
             bar_size.setProperty('class', 'form-value')
             size_policy = bar_size.sizePolicy()
             size_policy.setHorizontalPolicy(QSizePolicy.Policy.Expanding)
@@ -652,7 +887,7 @@ class FoundationDetailsDialog(QDialog):
             input_type.currentTextChanged.connect(update_spinbox_suffix)
             # noinspection PyUnresolvedReferences
             group_box.toggled.connect(lambda checked: update_image(str(checked), image_map, image_label, image_width,
-                                                                   fallback=resource_path('images/no_top_bar.png')))
+                                                                   fallback=_NO_TOP_BAR_IMAGE))
             self.group_box[title] = group_box
             return group_box
 
@@ -664,7 +899,7 @@ class FoundationDetailsDialog(QDialog):
             section_layout.setSpacing(0)
 
             # --- Image (Left side) ---
-            section_layout.addWidget(get_img(resource_path('images/vert_bar.png'), image_width, image_width))
+            section_layout.addWidget(get_img(_VERT_BAR_IMAGE, image_width, image_width))
 
             # --- Container for the right side controls ---
             form_layout = QFormLayout()
@@ -673,35 +908,31 @@ class FoundationDetailsDialog(QDialog):
 
             # Row 0: Diameter
             bar_size = QComboBox()
-            bar_size.addItems(BAR_DIAMETERS)
+            bar_size.setModel(_shared_list_model(BAR_DIAMETERS))
             bar_size.setProperty('class', 'form-value')
             size_policy = bar_size.sizePolicy()
             size_policy.setHorizontalPolicy(QSizePolicy.Policy.Expanding)
             bar_size.setSizePolicy(size_policy)
-            label = QLabel('Diameter:')
-            label.setProperty('class', 'form-label')
+            label = _form_label('Diameter:')
             form_layout.addRow(label, bar_size)
 
             # Row 1: Qty
             qty = BlankSpinBox(0, 99_999, suffix=' pcs')
             qty.setProperty('class', 'form-value')
-            label = QLabel('Quantity:')
-            label.setProperty('class', 'form-label')
+            label = _form_label('Quantity:')
             form_layout.addRow(label, qty)
 
             # Row 2: Hook Calculation
             calculation = QComboBox()
             calculation.addItems(['Automatic', 'Manual'])
             calculation.setProperty('class', 'form-value')
-            label = HoverLabel('Hook Calculation:')
-            label.setProperty('class', 'form-label')
+            label = _form_label('Hook Calculation:', HoverLabel)
             label.mouseEntered.connect(self.show_hook_info)
             label.mouseLeft.connect(self.info_popup.hide)
             form_layout.addRow(label, calculation)
 
             # Row 3: Hook Length (Label)
-            hook_length_label = QLabel('Hook Length:')
-            hook_length_label.setProperty('class', 'form-label')
+            hook_length_label = _form_label('Hook Length:')
             hook_length = BlankSpinBox(0, 99_999, suffix=' mm')
             hook_length.setProperty('class', 'form-value')
             form_layout.addRow(hook_length_label, hook_length)
@@ -736,14 +967,7 @@ class FoundationDetailsDialog(QDialog):
             section_layout.setSpacing(0)
 
             # --- Image (Left side) ---
-            image_map = {  # 'None': resource_path('images/perim_bar_0.png'),
-                '1': resource_path('images/perim_bar_1.png'),
-                '2': resource_path('images/perim_bar_2.png'),
-                '3': resource_path('images/perim_bar_3.png'),
-                '4': resource_path('images/perim_bar_4.png'),
-                '5': resource_path('images/perim_bar_5.png'),
-            }
-            perim_bar_img = get_img(image_map['1'], image_width, image_width)
+            perim_bar_img = get_img(_PERIM_BAR_IMAGES['1'], image_width, image_width)
             section_layout.addWidget(perim_bar_img)
 
             # --- Container for the right side controls ---
@@ -753,10 +977,9 @@ class FoundationDetailsDialog(QDialog):
 
             # Row 0: Diameter
             bar_size = QComboBox()
-            bar_size.addItems(BAR_DIAMETERS)
+            bar_size.setModel(_shared_list_model(BAR_DIAMETERS))
             bar_size.setProperty('class', 'form-value')
-            diameter_label = QLabel('Diameter:')
-            diameter_label.setProperty('class', 'form-label')
+            diameter_label = _form_label('Diameter:')
             form_layout.addRow(diameter_label, bar_size)
 
             # Row 1: Layers
@@ -766,8 +989,7 @@ class FoundationDetailsDialog(QDialog):
             size_policy = layers.sizePolicy()
             size_policy.setHorizontalPolicy(QSizePolicy.Policy.Expanding)
             layers.setSizePolicy(size_policy)
-            layers_label = QLabel('Layers:')
-            layers_label.setProperty('class', 'form-label')
+            layers_label = _form_label('Layers:')
             form_layout.addRow(layers_label, layers)
 
             # --- Add the right side to the main layout ---
@@ -777,8 +999,16 @@ class FoundationDetailsDialog(QDialog):
 
             # noinspection PyUnresolvedReferences
             layers.currentTextChanged.connect(
-                lambda selected_text: update_image(selected_text, image_map, perim_bar_img, image_width,
-                                                   fallback=resource_path('images/perim_bar_0.png')))
+                lambda selected_text: update_image(selected_text, _PERIM_BAR_IMAGES, perim_bar_img, image_width,
+                                                   fallback=_PERIM_BAR_IMAGE_FALLBACK))
+
+            def preload_layer_images():
+                for path in (*_PERIM_BAR_IMAGES.values(), _PERIM_BAR_IMAGE_FALLBACK):
+                    get_img(path, image_width, image_width, return_pixmap=True)
+
+            # Decode the other layer variants right after the dialog is built (pixmaps need the GUI thread),
+            # so that picking a layer count only fetches a cached pixmap
+            QTimer.singleShot(0, preload_layer_images)
             group_box.setChecked(False)
             self.group_box[title] = group_box
             return group_box
@@ -791,7 +1021,7 @@ class FoundationDetailsDialog(QDialog):
             main_layout.setSpacing(0)
 
             # Initialize
-            self.widgets[title] = {'Types': []}
+            self.widgets[title] = {'Types': self._stirrup_rows}
 
             # Spacing section
             spacing_layout = QHBoxLayout()
@@ -818,8 +1048,7 @@ class FoundationDetailsDialog(QDialog):
             form_layout.setSpacing(3)
 
             # Row 0: Start From
-            extent_label = HoverLabel('Start From:')
-            extent_label.setProperty('class', 'form-label')
+            extent_label = _form_label('Start From:', HoverLabel)
             start_from = QComboBox()
             start_from.addItems(['From Face of Pad', 'From Bottom Bar', 'From Top'])
             start_from.setProperty('class', 'form-value')
@@ -828,15 +1057,12 @@ class FoundationDetailsDialog(QDialog):
             form_layout.addRow(extent_label, start_from)
 
             # Row 1: Spacing
-            spacing_label = HoverLabel('Spacing:')
-            spacing_label.setProperty('class', 'form-label')
+            spacing_label = _form_label('Spacing:', HoverLabel)
             spacing = QTextEdit()
             spacing.setProperty('class', 'form-value')
             spacing.setPlaceholderText('Example: 1@50, 5@80, rest@100')
             spacing_label.mouseEntered.connect(self.show_spacing_info)
             spacing_label.mouseLeft.connect(self.info_popup.hide)
-            # noinspection PyUnresolvedReferences
-            spacing.textChanged.connect(self.debounce_timer.start)
             form_layout.addRow(spacing_label, spacing)
             spacing_layout.addLayout(form_layout)
 
@@ -898,8 +1124,10 @@ class FoundationDetailsDialog(QDialog):
             return group_box
 
         # --- Create and add the group boxes ---
-        top_bar_box = create_top_bot_bar_section('Top Bar', resource_path('images/top_bar.png'), RSB_IMAGE_WIDTH)
-        bot_bar_box = create_top_bot_bar_section('Bottom Bar', resource_path('images/bot_bar.png'), RSB_IMAGE_WIDTH)
+        # The sections are built eagerly: they share the one scroll page that holds the Save button, and
+        # validation, get_data and the stirrup canvas hold references to their widgets from __init__ on
+        top_bar_box = create_top_bot_bar_section('Top Bar', _TOP_BAR_IMAGE, RSB_IMAGE_WIDTH)
+        bot_bar_box = create_top_bot_bar_section('Bottom Bar', _BOT_BAR_IMAGE, RSB_IMAGE_WIDTH)
         vert_bar_box = create_vert_bar_section(RSB_IMAGE_WIDTH)
         perim_bar_box = create_perim_bar_section(RSB_IMAGE_WIDTH)
         stirrup_group_box = create_stirrup_group_box(RSB_IMAGE_WIDTH)
@@ -938,9 +1166,6 @@ class FoundationDetailsDialog(QDialog):
         # center_layout.addLayout(v_layout)
         # center_layout.addStretch()
 
-        # Connection to redraw
-        self.connect_stirrup_redraw_signals()
-
         scroll_area = make_scrollable(scroll_content, True)
         scroll_area.setProperty('class', 'scroll-bar')
         scroll_area.setObjectName('scrollBar')
@@ -988,29 +1213,20 @@ class FoundationDetailsDialog(QDialog):
         errors = []
         widgets_with_errors = []
 
-        # --- Get all widgets ---
-        name_widget = self.widgets['name']
-        n_footing_widget = self.widgets['n_footing']
-        cc_widget = self.widgets['cc']
-        bx_widget = self.widgets['bx']
-        by_widget = self.widgets['by']
-        h_widget = self.widgets['h']
-        Bx_widget = self.widgets['Bx']
-        By_widget = self.widgets['By']
-        t_widget = self.widgets['t']
-
-        # --- List of widgets to check for emptiness and reset styles ---
-        all_widgets = [
-            name_widget, n_footing_widget, cc_widget, bx_widget, by_widget,
-            h_widget, Bx_widget, By_widget, t_widget
-        ]
+        # --- Get all widgets (also the ones to check for emptiness and reset styles) ---
+        all_widgets = self._footing_validate_widgets
+        (name_widget, n_footing_widget, cc_widget, bx_widget, by_widget,
+         h_widget, Bx_widget, By_widget, t_widget) = all_widgets
         for widget in all_widgets:
             style_invalid_input(widget, True)
 
+        # Check each field once; the comparison rules below only apply to filled fields
+        empty = {widget: is_widget_empty(widget) for widget in all_widgets}
+
         # 1. All visible input fields must be filled.
         is_empty_found = False
         for widget in all_widgets:
-            if is_widget_empty(widget):
+            if empty[widget]:
                 widgets_with_errors.append(widget)
                 is_empty_found = True
         if is_empty_found:
@@ -1032,26 +1248,26 @@ class FoundationDetailsDialog(QDialog):
             widgets_with_errors.append(name_widget)
 
         # 3. Pedestal Width and pad thickness > 2 * concrete cover.
-        if not is_widget_empty(bx_widget) and not is_widget_empty(cc_widget) and bx <= 2 * cc:
+        if not empty[bx_widget] and not empty[cc_widget] and bx <= 2 * cc:
             errors.append(f'• Pedestal Width X ({bx}mm) must be > 2 × Concrete Cover ({2 * cc}mm).')
             widgets_with_errors.extend([bx_widget, cc_widget])
-        if not is_widget_empty(by_widget) and not is_widget_empty(cc_widget) and by <= 2 * cc:
+        if not empty[by_widget] and not empty[cc_widget] and by <= 2 * cc:
             errors.append(f'• Pedestal Width Y ({by}mm) must be > 2 × Concrete Cover ({2 * cc}mm).')
             widgets_with_errors.extend([by_widget, cc_widget])
-        if not is_widget_empty(t_widget) and not is_widget_empty(cc_widget) and t <= 2 * cc:
+        if not empty[t_widget] and not empty[cc_widget] and t <= 2 * cc:
             errors.append(f'• Pad Thickness ({t}mm) must be > 2 × Concrete Cover ({2 * cc}mm).')
             widgets_with_errors.extend([t_widget, cc_widget])
 
         # 4. Pedestal Height > concrete cover.
-        if not is_widget_empty(h_widget) and not is_widget_empty(cc_widget) and h <= cc:
+        if not empty[h_widget] and not empty[cc_widget] and h <= cc:
             errors.append(f'• Pedestal Height ({h}mm) must be > Concrete Cover ({cc}mm).')
             widgets_with_errors.extend([h_widget, cc_widget])
 
         # 5. Pad Width > (concrete_cover * 2 + ped_width)
-        if not is_widget_empty(Bx_widget) and not is_widget_empty(bx_widget) and not is_widget_empty(cc_widget) and Bx <= (bx + 2 * cc):
+        if not empty[Bx_widget] and not empty[bx_widget] and not empty[cc_widget] and Bx <= (bx + 2 * cc):
             errors.append(f'• Pad Width X ({Bx}mm) must be > Pedestal Width X + 2 × Cover ({bx + 2 * cc}mm).')
             widgets_with_errors.extend([Bx_widget, bx_widget, cc_widget])
-        if not is_widget_empty(By_widget) and not is_widget_empty(by_widget) and not is_widget_empty(cc_widget) and By <= (by + 2 * cc):
+        if not empty[By_widget] and not empty[by_widget] and not empty[cc_widget] and By <= (by + 2 * cc):
             errors.append(f'• Pad Width Y ({By}mm) must be > Pedestal Width Y + 2 × Cover ({by + 2 * cc}mm).')
             widgets_with_errors.extend([By_widget, by_widget, cc_widget])
 
@@ -1069,34 +1285,24 @@ class FoundationDetailsDialog(QDialog):
 
         return True
 
-    def validate_rsb_page(self) -> bool:
-        """Validates all visible inputs on the RSB page with stricter rules. Returns True if valid."""
-        if DEBUG_MODE:
-            return True
+    def _collect_invalid(self) -> tuple[list[str], list[QWidget]]:
+        """
+        Checks the enabled RSB sections without touching any widget styles.
 
+        Returns:
+            The error messages and the widgets to flag; both are empty when the page is valid.
+        """
         errors = []
         widgets_with_errors = []
 
-        # --- Get values from footing page for context ---
-        cc = self.widgets['cc'].value()
-        bx = self.widgets['bx'].value()
-        by = self.widgets['by'].value()
-        Bx = self.widgets['Bx'].value()
-        By = self.widgets['By'].value()
-
-        # --- Reset all styles first ---
-        for section_name in self.group_box:
-            section_widgets = self.widgets.get(section_name, {})
-            if isinstance(section_widgets, dict):
-                for widget in section_widgets.values():
-                    if isinstance(widget, QWidget) and widget.isWidgetType():
-                        style_invalid_input(widget, True)
-            elif isinstance(section_widgets, list): # For stirrup types
-                 for row_dict in section_widgets:
-                     for widget in row_dict.values():
-                         if isinstance(widget, QWidget) and widget.isWidgetType():
-                             style_invalid_input(widget, True)
-
+        # --- Get widgets and values from footing page for context ---
+        (_, _, cc_widget, bx_widget, by_widget,
+         _, Bx_widget, By_widget, _) = self._footing_validate_widgets
+        cc = cc_widget.value()
+        bx = bx_widget.value()
+        by = by_widget.value()
+        Bx = Bx_widget.value()
+        By = By_widget.value()
 
         # --- Iterate through group boxes for validation ---
         for section_name, group_box in self.group_box.items():
@@ -1104,16 +1310,13 @@ class FoundationDetailsDialog(QDialog):
                 continue  # Skip disabled sections
 
             # --- A. Check for general emptiness in visible fields ---
+            section_widgets = self._rsb_validate_plan[section_name]
+            empty = {widget: is_widget_empty(widget) for widget in section_widgets}  # Also reused by the rules
             is_empty_found_in_section = False
-            widgets_in_section = self.widgets.get(section_name, {})
-            # This handles both flat dicts (Vertical Bar) and nested dicts (Top Bar)
-            widgets_to_check = list(widgets_in_section.values()) if isinstance(widgets_in_section, dict) else []
-
-            for widget in widgets_to_check:
-                if isinstance(widget, QWidget) and widget.isWidgetType() and widget.isVisible():
-                    if is_widget_empty(widget):
-                        widgets_with_errors.append(widget)
-                        is_empty_found_in_section = True
+            for widget in section_widgets:
+                if empty[widget] and widget.isVisible():
+                    widgets_with_errors.append(widget)
+                    is_empty_found_in_section = True
             if is_empty_found_in_section:
                  errors.append(f'• A required field in the {section_name} section is empty.')
 
@@ -1127,13 +1330,13 @@ class FoundationDetailsDialog(QDialog):
                 clear_width_x = Bx - 2 * cc
                 clear_width_y = By - 2 * cc
                 # Bars along Y are spaced across Bx
-                if not is_widget_empty(val_x_widget) and val_x_widget.value() >= clear_width_x:
+                if not empty[val_x_widget] and val_x_widget.value() >= clear_width_x:
                     errors.append(f'• {section_name} (Along Y): Spacing ({val_x_widget.value()}mm) must be less than clear pad width X ({clear_width_x}mm).')
-                    widgets_with_errors.extend([val_x_widget, self.widgets['Bx'], self.widgets['cc']])
+                    widgets_with_errors.extend([val_x_widget, Bx_widget, cc_widget])
                 # Bars along X are spaced across By
-                if not is_widget_empty(val_y_widget) and val_y_widget.value() >= clear_width_y:
+                if not empty[val_y_widget] and val_y_widget.value() >= clear_width_y:
                     errors.append(f'• {section_name} (Along X): Spacing ({val_y_widget.value()}mm) must be less than clear pad width Y ({clear_width_y}mm).')
-                    widgets_with_errors.extend([val_y_widget, self.widgets['By'], self.widgets['cc']])
+                    widgets_with_errors.extend([val_y_widget, By_widget, cc_widget])
 
             # 2. Vertical Bar Validation
             elif section_name == 'Vertical Bar':
@@ -1143,29 +1346,45 @@ class FoundationDetailsDialog(QDialog):
                 hook_len_widget = vert_widgets['Hook Length']
 
                 pedestal_core_perimeter = (bx - 2 * cc) * 2 + (by - 2 * cc) * 2
-                if not is_widget_empty(qty_widget) and qty_widget.value() >= pedestal_core_perimeter:
+                if not empty[qty_widget] and qty_widget.value() >= pedestal_core_perimeter:
                     errors.append(f'• Vertical Bar quantity ({qty_widget.value()}) is high; it must be less than the pedestal core perimeter ({pedestal_core_perimeter:.0f}mm).')
-                    widgets_with_errors.extend([qty_widget, self.widgets['bx'], self.widgets['by'], self.widgets['cc']])
+                    widgets_with_errors.extend([qty_widget, bx_widget, by_widget, cc_widget])
 
                 if hook_calc == 'Manual':
                     clear_pad_width_min = min(Bx, By) - 2 * cc
-                    if not is_widget_empty(hook_len_widget) and hook_len_widget.value() >= clear_pad_width_min / 2:
+                    if not empty[hook_len_widget] and hook_len_widget.value() >= clear_pad_width_min / 2:
                         errors.append(f'• Manual Hook Length ({hook_len_widget.value()}mm) must be less than half the clear pad width ({clear_pad_width_min / 2:.0f}mm).')
-                        widgets_with_errors.extend([hook_len_widget, self.widgets['Bx'], self.widgets['By'], self.widgets['cc']])
+                        widgets_with_errors.extend([hook_len_widget, Bx_widget, By_widget, cc_widget])
 
             # 3. Stirrups Validation
             elif section_name == 'Stirrups':
                 spacing_widget = self.widgets['Stirrups']['Spacing']
-                spacing_text = spacing_widget.toPlainText().strip()
-                if not spacing_text:
+                if empty[spacing_widget]:
                      errors.append('• Stirrup Spacing field cannot be empty.')
                      widgets_with_errors.append(spacing_widget)
                 else:
-                    try:
-                        parse_spacing_string(spacing_text)
-                    except (ValueError, TypeError) as e:
-                        errors.append(f'• Invalid Stirrup Spacing format: {e}')
-                        widgets_with_errors.append(spacing_widget)
+                    spacing_text = spacing_widget.toPlainText().strip()
+                    if not _parse_spacing_cached(spacing_text):
+                        # The cache only holds parsed results, so parse again to report why the text is invalid
+                        try:
+                            parse_spacing_string(spacing_text)
+                        except (ValueError, TypeError) as e:
+                            errors.append(f'• Invalid Stirrup Spacing format: {e}')
+                            widgets_with_errors.append(spacing_widget)
+
+        return errors, widgets_with_errors
+
+    def validate_rsb_page(self) -> bool:
+        """Validates all visible inputs on the RSB page with stricter rules. Returns True if valid."""
+        if DEBUG_MODE:
+            return True
+
+        errors, widgets_with_errors = self._collect_invalid()
+
+        # --- Clear flags left over from a previous attempt ---
+        for section_widgets in self._rsb_validate_plan.values():
+            for widget in section_widgets:
+                style_invalid_input(widget, True)
 
         if errors:
             for widget in set(widgets_with_errors):
@@ -1204,157 +1423,69 @@ class FoundationDetailsDialog(QDialog):
                 self.widgets['Vertical Bar']['Diameter']
             )
 
+    def schedule_stirrup_redraw(self, *_) -> None:
+        """Queues a redraw for the next event loop pass so that changes made together result in a single redraw."""
+        self._redraw_timer.start()
+
     def connect_stirrup_redraw_signals(self):
         """Connects all widgets that affect the stirrup drawing to the redraw logic."""
-        # Widgets that affect dimensions
-        dimension_widgets = [
-            self.widgets['h'],
-            self.widgets['bx'],
-            self.widgets['t'],
-            self.widgets['cc'],
-        ]
-        # Widgets that affect rebar sizes
-        rebar_widgets = [
-            self.widgets['Bottom Bar']['Diameter'],
-            self.widgets['Vertical Bar']['Diameter'],
-            self.widgets['Stirrups']['Extent']
-        ]
-
-        for widget in dimension_widgets:
-            widget.valueChanged.connect(self.update_stirrup_drawing)
+        if self._redraw_connections:
+            return  # Already connected; never wire the same widget twice
 
-        for widget in rebar_widgets:
-            widget.currentTextChanged.connect(self.update_stirrup_drawing)
+        # noinspection PyUnresolvedReferences
+        self._redraw_connections = [widget.valueChanged.connect(self.schedule_stirrup_redraw)
+                                    for widget in self._redraw_dimension_widgets]
+        # noinspection PyUnresolvedReferences
+        self._redraw_connections += [widget.currentTextChanged.connect(self.schedule_stirrup_redraw)
+                                     for widget in self._redraw_rebar_widgets]
+        # Typing waits for the longer debounce, so the spacing is parsed and walked once it settles
+        # noinspection PyUnresolvedReferences
+        self._redraw_connections.append(self.widgets['Stirrups']['Spacing'].textChanged.connect(
+            self.debounce_timer.start))
 
     def disconnect_stirrup_redraw_signals(self):
         """Disconnects signals that trigger stirrup redraws to prevent signal storms."""
-        dimension_widgets = [
-            self.widgets['h'],
-            self.widgets['bx'],
-            self.widgets['t'],
-            self.widgets['cc'],
-        ]
-        rebar_widgets = [
-            self.widgets['Bottom Bar']['Diameter'],
-            self.widgets['Vertical Bar']['Diameter'],
-            self.widgets['Stirrups']['Extent']
-        ]
+        for connection in self._redraw_connections:
+            QObject.disconnect(connection)
+        self._redraw_connections.clear()
 
-        for widget in dimension_widgets:
-            try:
-                widget.valueChanged.disconnect(self.update_stirrup_drawing)
-            except TypeError:
-                pass  # Signal was not connected, so we can ignore the error
+    def _show_info_popup(self, text: str) -> None:
+        """
+        Fills the shared info popup and shows it just below and to the right of the cursor.
 
-        for widget in rebar_widgets:
-            try:
-                widget.currentTextChanged.disconnect(self.update_stirrup_drawing)
-            except TypeError:
-                pass  # Signal was not connected, so we can ignore the error
+        Args:
+            text: The rich text to display.
+        """
+        self.info_popup.set_info_text(text)
+        cursor_pos = QCursor.pos()
+        self.info_popup.move(cursor_pos.x() + 15, cursor_pos.y() + 15)
+        self.info_popup.show()
 
     def show_hook_info(self) -> None:
         """Displays an informational popup for the hook calculation method."""
-        # NOTE: You should update the text to reflect the actual standard you are using.
-        # For example, ACI 318 or a local building code.
-        info_text = (
-            '<b>Hook Calculation Method</b>'
-            '<ul><li><b>Automatic:</b> Calculates the required hook length '
-            'based on ACI 318-25 Table 25.3.1 Standard 90° hook geometry for '
-            'development of deformed bars in tension (<i>12d</i><sub>b</sub>) </li>'
-            '<li><b>Manual:</b> Allows you to enter a custom, pre-calculated '
-            'length for the hook.</li></ul>'
-        )
-        self.info_popup.set_info_text(info_text)
-
-        # Position and show the popup
-        cursor_pos = self.cursor().pos()
-        self.info_popup.move(cursor_pos.x() + 15, cursor_pos.y() + 15)
-        self.info_popup.show()
+        self._show_info_popup(_HOOK_INFO_HTML)
 
     def show_spacing_header_info(self) -> None:
         """Displays an informational popup for the stirrup spacing section."""
-        info_text = (
-            """<b>Stirrup Placement Guide</b><br><br>
-This section controls the vertical position and distribution of the stirrup bundles along the pedestal.
-<br><br>
-It's a two-step process:
-<ol>
-    <li><b>Start From:</b> First, select your 'zero' reference point from which all measurements will begin.</li>
-    <li><b>Spacing:</b> Next, enter the series of spacing values. The first value positions the first stirrup relative to your chosen start point.</li>
-</ol>
-Use the diagram on the left to visually confirm that the stirrup placement matches your input."""
-        )
-        self.info_popup.set_info_text(info_text)
-
-        # Position and show the popup
-        cursor_pos = self.cursor().pos()
-        self.info_popup.move(cursor_pos.x() + 15, cursor_pos.y() + 15)
-        self.info_popup.show()
+        self._show_info_popup(_SPACING_HEADER_INFO_HTML)
 
     def show_spacing_extent_info(self) -> None:
         """Displays an informational popup for the stirrup extent."""
-        info_text = (
-            """<b>Spacing Start Point</b><br><br>
-This sets the <b>'zero' reference point</b> for the first measurement in the 'Spacing' field.
-<hr>
-<ul>
-    <li><b>From Face of Pad:</b> 'Zero' is the top face of the footing (pad).</li>
-    <li><b>From Bottom Bar:</b> 'Zero' is at the elevation of the bottom rebar.</li>
-    <li><b>From Top (to Face of Pad):</b> 'Zero' is the top of the pedestal, measuring downwards. Spacing will only be applied within the concrete pedestal.</li>
-</ul>"""
-        )
-        self.info_popup.set_info_text(info_text)
-
-        # Position and show the popup
-        cursor_pos = self.cursor().pos()
-        self.info_popup.move(cursor_pos.x() + 15, cursor_pos.y() + 15)
-        self.info_popup.show()
+        self._show_info_popup(_SPACING_EXTENT_INFO_HTML)
 
     def show_bundle_info(self) -> None:
         """Displays an informational popup for the stirrup bundle."""
-        info_text = (
-            """<b>Understanding the Stirrup Bundle</b><br><br>
-This section defines the combination of stirrups that will be installed together as a single unit.
-<ul>
-    <li><b>Forms One Set:</b> All stirrup shapes you add (e.g., an Outer, a Tall) are considered one complete set.</li>
-    <li><b>Installed as a Group:</b> At each specified height, all stirrups in the set are installed as a single, tightly packed group.</li>
-    <li><b>Spacing Applies to the Group:</b> The spacing you define (e.g., <code>5@100</code>) dictates the vertical distance from the center of one group to the center of the next.</li>
-</ul>
-Think of it as designing a 'kit' of stirrups that gets repeated along the height of the pedestal."""
-        )
-        self.info_popup.set_info_text(info_text)
-
-        # Position and show the popup
-        cursor_pos = self.cursor().pos()
-        self.info_popup.move(cursor_pos.x() + 15, cursor_pos.y() + 15)
-        self.info_popup.show()
+        self._show_info_popup(_BUNDLE_INFO_HTML)
 
     def show_spacing_info(self) -> None:
         """Displays an informational popup for the stirrup spacing format."""
-        info_text = (
-            """<b>Stirrup Spacing Guide</b><br><br>
-Defines stirrup locations relative to your chosen 'Start From' point.
-
-<hr>
-
-<b>Key Principle:</b>
-<p>The <u>first spacing value</u> in your list always positions the <u>first stirrup</u>.</p>
-
-<b>Example: </b> <b><code>5@100, rest@150</code></b></p>
-<ul>
-    <li>The <b>first</b> of the 5 stirrups is placed <b>100mm</b> from the start point.</li>
-    <li>The next 4 are also 100mm apart. The remaining are 150mm apart.</li>"""
-        )
-        self.info_popup.set_info_text(info_text)
-
-        # Position and show the popup
-        cursor_pos = self.cursor().pos()
-        self.info_popup.move(cursor_pos.x() + 15, cursor_pos.y() + 15)
-        self.info_popup.show()
+        self._show_info_popup(_SPACING_INFO_HTML)
 
     def populate_data(self, details: dict):
-        """Fills the form fields with existing data for editing."""
-        self.disconnect_stirrup_redraw_signals()
+        """Fills the form fields with existing data for editing, then redraws the stirrups once."""
+        # Silence the redraw triggers while filling; the connections themselves stay in place
+        blockers = [QSignalBlocker(widget) for widget in
+                    (*self._redraw_dimension_widgets, *self._redraw_rebar_widgets, self.widgets['Stirrups']['Spacing'])]
 
         # Page 1 (Footing Dimensions)
         self.widgets['name'].setText(details.get('name', ''))
@@ -1406,87 +1537,111 @@ Defines stirrup locations relative to your chosen 'Start From' point.
                 self.widgets['Stirrups']['Extent'].setCurrentText(section_data.get('Extent', 'From Face of Pad'))
                 self.widgets['Stirrups']['Spacing'].setPlainText(section_data.get('Spacing', ''))
 
-                # Add and populate new rows from saved data
+                # Add and populate new rows from saved data, repainting the row container once at the end
                 saved_stirrup_types = section_data.get('Types', [])
+                rows_container = self.stirrup_rows_layout.parentWidget()
+                rows_container.setUpdatesEnabled(False)
                 for stirrup_type_data in saved_stirrup_types:
                     self.add_stirrup_row()
-                    row_widgets = self.widgets['Stirrups']['Types'][-1]
+                    row_widgets = self._stirrup_rows[-1]
                     row_widgets['Type'].setCurrentText(stirrup_type_data.get('Type', 'Outer'))
                     row_widgets['Diameter'].setCurrentText(stirrup_type_data.get('Diameter', ''))
                     row_widgets['a_input'].setValue(stirrup_type_data.get('a_input', 0))
+                rows_container.setUpdatesEnabled(True)
 
                 # After populating, ensure at least one row exists.
                 # This handles cases where a user saved an item with no stirrups.
-                if not self.widgets['Stirrups']['Types']:
+                if not self._stirrup_rows:
                     self.add_stirrup_row()
 
-        # Reconnect signals
-        self.connect_stirrup_redraw_signals()
+        for blocker in blockers:
+            blocker.unblock()
+        self.update_stirrup_drawing()
 
     def get_data(self) -> dict:
         """Returns all entered data from both pages as a dictionary."""
-        data = {
-            # Page 1
-            'name': self.widgets['name'].text(),
-            'n_footing': self.widgets['n_footing'].value(),
-            'n_ped': self.widgets['n_ped'].value(),
-            'cc': self.widgets['cc'].value(),
-            'bx': self.widgets['bx'].value(),
-            'by': self.widgets['by'].value(),
-            'h': self.widgets['h'].value(),
-            'Bx': self.widgets['Bx'].value(),
-            'By': self.widgets['By'].value(),
-            't': self.widgets['t'].value(),
-
-            # Page 2
-            'Top Bar': {
-                'Enabled': self.group_box['Top Bar'].isChecked(),
-                'Diameter': self.widgets['Top Bar']['Diameter'].currentText(),
-                'Input Type': self.widgets['Top Bar']['Input Type'].currentText(),
-                'Value Along X': self.widgets['Top Bar']['Value Along X'].value(),
-                'Value Along Y': self.widgets['Top Bar']['Value Along Y'].value(),
-            },
-            'Bottom Bar': {
-                'Enabled': True,
-                'Diameter': self.widgets['Bottom Bar']['Diameter'].currentText(),
-                'Input Type': self.widgets['Bottom Bar']['Input Type'].currentText(),
-                'Value Along X': self.widgets['Bottom Bar']['Value Along X'].value(),
-                'Value Along Y': self.widgets['Bottom Bar']['Value Along Y'].value(),
-            },
-            'Vertical Bar': {
-                'Enabled': True,
-                'Diameter': self.widgets['Vertical Bar']['Diameter'].currentText(),
-                'Quantity': self.widgets['Vertical Bar']['Quantity'].value(),
-                'Hook Calculation': self.widgets['Vertical Bar']['Hook Calculation'].currentText(),
-                'Hook Length': self.widgets['Vertical Bar']['Hook Length'].value(),
-            },
-            'Perimeter Bar': {
-                'Enabled': self.group_box['Perimeter Bar'].isChecked(),
-                'Diameter': self.widgets['Perimeter Bar']['Diameter'].currentText(),
-                'Layers': self.widgets['Perimeter Bar']['Layers'].currentText(),
-            },
-            'Stirrups': {
-                'Enabled': self.group_box['Stirrups'].isChecked(),
-                'Extent': self.widgets['Stirrups']['Extent'].currentText(),
-                'Spacing': self.widgets['Stirrups']['Spacing'].toPlainText(),
-                'Quantity': self.stirrup_canvas.get_qty(),
-                'Types': [
-                    {
-                        'Type': row['Type'].currentText(),
-                        'Diameter': row['Diameter'].currentText(),
-                        'a_input': row['a_input'].value()
-                    }
-                    for row in self.widgets['Stirrups']['Types']
-                ]
-            }
-        }
+        if self.debounce_timer.isActive() or self._redraw_timer.isActive():
+            # Apply the pending redraw now so the stirrup quantity is up to date
+            self.debounce_timer.stop()
+            self._redraw_timer.stop()
+            self.update_stirrup_drawing()
+
+        data = {}
+        for section, key, getter in self._get_data_plan:
+            target = data if section is None else data.setdefault(section, {})
+            target[key] = getter()
         if data['Perimeter Bar']['Enabled']:
             data['Perimeter Bar']['Layers'] = int(data['Perimeter Bar']['Layers'])
         return data
 
 
+    def _build_get_data_plan(self) -> tuple[tuple[str | None, str, Any], ...]:
+        """
+        Binds the value getter of every saved field once, in the order get_data emits them.
+
+        Returns:
+            (section, key, getter) entries; a section of None is a top-level key.
+        """
+        widgets = self.widgets
+        plan = [(None, 'name', widgets['name'].text)]
+        plan += [(None, key, widgets[key].value) for key in ('n_footing', 'n_ped', 'cc', 'bx', 'by', 'h', 'Bx', 'By', 't')]
+
+        for section in ('Top Bar', 'Bottom Bar'):
+            bar = widgets[section]
+            plan += [
+                (section, 'Enabled', self.group_box[section].isChecked if section == 'Top Bar' else lambda: True),
+                (section, 'Diameter', bar['Diameter'].currentText),
+                (section, 'Input Type', bar['Input Type'].currentText),
+                (section, 'Value Along X', bar['Value Along X'].value),
+                (section, 'Value Along Y', bar['Value Along Y'].value),
+            ]
+
+        vert = widgets['Vertical Bar']
+        perim = widgets['Perimeter Bar']
+        stirrups = widgets['Stirrups']
+        plan += [
+            ('Vertical Bar', 'Enabled', lambda: True),
+            ('Vertical Bar', 'Diameter', vert['Diameter'].currentText),
+            ('Vertical Bar', 'Quantity', vert['Quantity'].value),
+            ('Vertical Bar', 'Hook Calculation', vert['Hook Calculation'].currentText),
+            ('Vertical Bar', 'Hook Length', vert['Hook Length'].value),
+            ('Perimeter Bar', 'Enabled', self.group_box['Perimeter Bar'].isChecked),
+            ('Perimeter Bar', 'Diameter', perim['Diameter'].currentText),
+            ('Perimeter Bar', 'Layers', perim['Layers'].currentText),
+            ('Stirrups', 'Enabled', self.group_box['Stirrups'].isChecked),
+            ('Stirrups', 'Extent', stirrups['Extent'].currentText),
+            ('Stirrups', 'Spacing', stirrups['Spacing'].toPlainText),
+            ('Stirrups', 'Quantity', self.stirrup_canvas.get_qty),
+            ('Stirrups', 'Types', self._get_stirrup_types_data),
+        ]
+        return tuple(plan)
+
+    def _get_stirrup_types_data(self) -> list[dict[str, Any]]:
+        """Returns the type, diameter and 'a' dimension of every stirrup row."""
+        return [
+            {
+                'Type': row['Type'].currentText(),
+                'Diameter': row['Diameter'].currentText(),
+                'a_input': row['a_input'].value()
+            }
+            for row in self._stirrup_rows
+        ]
+
     def add_stirrup_row(self) -> None:
         """Creates and adds a new UI row for defining a stirrup type."""
+        if self._stirrup_row_pool:
+            # Reuse a previously removed row instead of building a new one
+            row_widgets = self._stirrup_row_pool.pop()
+            row_widgets['Type'].setCurrentIndex(0)
+            row_widgets['Diameter'].setCurrentIndex(0)
+            row_widgets['a_input'].setValue(0)
+            for key in ('Type', 'Diameter', 'a_input'):
+                style_invalid_input(row_widgets[key], True)
+            row_widgets['Row'].show()
+            self._stirrup_rows.append(row_widgets)
+            self.update_remove_button_state()
+            return
+
         # --- Main container for the row ---
         row_widget = QFrame()
         row_widget.setProperty('class', 'stirrup-row')
@@ -1495,44 +1650,31 @@ Defines stirrup locations relative to your chosen 'Start From' point.
         row_layout.setSpacing(0)
 
         # --- Image (Left) ---
-        image_label = get_img(resource_path('images/stirrup_outer.png'), STIRRUP_ROW_IMAGE_WIDTH, STIRRUP_ROW_IMAGE_WIDTH)
+        image_label = get_img(_STIRRUP_IMAGES['Outer'], STIRRUP_ROW_IMAGE_WIDTH, STIRRUP_ROW_IMAGE_WIDTH)
         row_layout.addWidget(image_label)
 
-        image_map = {
-            'Outer': resource_path('images/stirrup_outer.png'),
-            'Diamond': resource_path('images/stirrup_diamond.png'),
-            'Tall': resource_path('images/stirrup_tall.png'),
-            'Wide': resource_path('images/stirrup_wide.png'),
-            'Octagon': resource_path('images/stirrup_octagon.png'),
-            'Vertical': resource_path('images/stirrup_flat_tall.png'),
-            'Horizontal': resource_path('images/stirrup_flat_wide.png'),
-        }
-
         # --- Form (Right) ---
         form_layout = QFormLayout()
         form_layout.setContentsMargins(0, 0, 0, 0)
         form_layout.setSpacing(3)
         type_combo = QComboBox()
-        type_combo.addItems(image_map.keys())
+        type_combo.setModel(_shared_list_model(_STIRRUP_TYPES))
         type_combo.setProperty('class', 'form-value')
         size_policy = type_combo.sizePolicy()
         size_policy.setHorizontalPolicy(QSizePolicy.Policy.Expanding)
         type_combo.setSizePolicy(size_policy)
 
         dia_combo = QComboBox()
-        dia_combo.addItems(BAR_DIAMETERS_FOR_STIRRUPS)
+        dia_combo.setModel(_shared_list_model(BAR_DIAMETERS_FOR_STIRRUPS))
         dia_combo.setProperty('class', 'form-value')
 
-        a_label = QLabel('a:')
-        a_label.setProperty('class', 'form-label')
+        a_label = _form_label('a:')
         a_input = BlankSpinBox(0, 99_999, suffix=' mm')
         a_input.setProperty('class', 'form-value')
 
-        label = QLabel('Type:')
-        label.setProperty('class', 'form-label')
+        label = _form_label('Type:')
         form_layout.addRow(label, type_combo)
-        label = QLabel('Diameter:')
-        label.setProperty('class', 'form-label')
+        label = _form_label('Diameter:')
         form_layout.addRow(label, dia_combo)
         form_layout.addRow(a_label, a_input)
         row_layout.addLayout(form_layout)
@@ -1546,48 +1688,47 @@ Defines stirrup locations relative to your chosen 'Start From' point.
             'a_label': a_label,
             'a_input': a_input
         }
-        self.widgets['Stirrups']['Types'].append(row_widgets)
+        self._stirrup_rows.append(row_widgets)
 
         # --- Connections ---
-        def update_stirrup_row_visibility(selected_text: str, widgets: dict[str, Any],
-                                          stirrup_type_image_map: dict[str, str]) -> None:
-            """
-            Updates a stirrup row's image and the visibility of its 'a' input field.
-
-            Args:
-                selected_text: The selected stirrup type from the combo box.
-                widgets: A dictionary of the widgets in that specific row.
-                stirrup_type_image_map: A dictionary mapping stirrup types to image paths.
-            """
-            update_image(selected_text, stirrup_type_image_map, widgets['Image'], STIRRUP_ROW_IMAGE_WIDTH,
-                         fallback=resource_path('images/stirrup_none.png'))
-
-            # Update visibility of 'a' input
-            is_visible = selected_text in ['Tall', 'Wide', 'Octagon']
-            widgets['a_label'].setVisible(is_visible)
-            widgets['a_input'].setVisible(is_visible)
-
         # noinspection PyUnresolvedReferences
-        type_combo.currentTextChanged.connect(
-            lambda text: update_stirrup_row_visibility(text, row_widgets, image_map)
-        )
+        type_combo.currentTextChanged.connect(partial(self._update_stirrup_row_visibility, row_widgets=row_widgets))
 
         # --- Set initial state ---
-        update_stirrup_row_visibility(type_combo.currentText(), row_widgets, image_map)
+        self._update_stirrup_row_visibility(type_combo.currentText(), row_widgets)
 
         # --- Add to the main container ---
         self.stirrup_rows_layout.addWidget(row_widget)
         self.update_remove_button_state()
 
+    @staticmethod
+    def _update_stirrup_row_visibility(selected_text: str, row_widgets: dict[str, Any]) -> None:
+        """
+        Updates a stirrup row's image and the visibility of its 'a' input field.
+
+        Args:
+            selected_text: The selected stirrup type from the combo box.
+            row_widgets: A dictionary of the widgets in that specific row.
+        """
+        update_image(selected_text, _STIRRUP_IMAGES, row_widgets['Image'], STIRRUP_ROW_IMAGE_WIDTH,
+                     fallback=_STIRRUP_IMAGE_FALLBACK)
+
+        # Update visibility of 'a' input
+        is_visible = selected_text in ['Tall', 'Wide', 'Octagon']
+        row_widgets['a_label'].setVisible(is_visible)
+        row_widgets['a_input'].setVisible(is_visible)
+
     def update_remove_button_state(self) -> None:
         """Enables or disables the 'remove stirrup row' button based on the row count."""
-        self.remove_stirrup_button.setEnabled(len(self.widgets['Stirrups']['Types']) > 1)
+        self.remove_stirrup_button.setEnabled(len(self._stirrup_rows) > 1)
 
     def remove_stirrup_row(self) -> None:
         """Removes the last stirrup definition row from the UI."""
-        if len(self.widgets['Stirrups']['Types']) > 1:  # Keep at least one row
-            widgets_to_remove = self.widgets['Stirrups']['Types'].pop()
-            widgets_to_remove['Row'].deleteLater()  # Safely delete the widget
+        if len(self._stirrup_rows) > 1:  # Keep at least one row
+            widgets_to_remove = self._stirrup_rows.pop()
+            # Hide the row and keep it for reuse; rows are always removed from and re-added at the end
+            widgets_to_remove['Row'].hide()
+            self._stirrup_row_pool.append(widgets_to_remove)
 
         self.update_remove_button_state()
 
@@ -1624,23 +1765,29 @@ class FoundationItem(QFrame):
         layout.addWidget(self.label)
         layout.addStretch(1)
 
+        # --- Hover buttons, shown and hidden together through one container ---
+        self._hover_group = QWidget()
+        hover_layout = QHBoxLayout(self._hover_group)
+        hover_layout.setContentsMargins(0, 0, 0, 0)
+        hover_layout.setSpacing(0)
+        layout.addWidget(self._hover_group)
+
         # --- Edit Button (Icon) ---
         self.edit_button = HoverButton('')
         self.edit_button.setProperty('class', 'edit-button') # Use your yellow class
         self.edit_button.setToolTip('Edit Foundation')
         # noinspection PyUnresolvedReferences
         self.edit_button.clicked.connect(lambda: self.edit_requested.emit(self))
-        layout.addWidget(self.edit_button)
+        hover_layout.addWidget(self.edit_button)
 
         self.remove_button = HoverButton('')
         self.remove_button.setProperty('class', 'trash-button')
         # noinspection PyUnresolvedReferences
         self.remove_button.clicked.connect(lambda: self.remove_requested.emit(self))
-        layout.addWidget(self.remove_button)
+        hover_layout.addWidget(self.remove_button)
 
         # --- Hide buttons initially ---
-        self.edit_button.hide()
-        self.remove_button.hide()
+        self._hover_group.hide()
 
     def paintEvent(self, event: QPaintEvent) -> None:
         """
@@ -1654,14 +1801,12 @@ class FoundationItem(QFrame):
 
     def enterEvent(self, event: QEvent | None) -> None:
         """Show buttons when the mouse enters the widget."""
-        self.edit_button.show()
-        self.remove_button.show()
+        self._hover_group.show()
         super().enterEvent(event)
 
     def leaveEvent(self, event: QEvent) -> None:
         """Hide buttons when the mouse leaves the widget."""
-        self.edit_button.hide()
-        self.remove_button.hide()
+        self._hover_group.hide()
         super().leaveEvent(event)
 
     def mousePressEvent(self, event) -> None:
@@ -1671,17 +1816,29 @@ class FoundationItem(QFrame):
             self.selected.emit(self)
         super().mousePressEvent(event)
 
+    def _set_selected(self, is_selected: bool) -> None:
+        """
+        Applies the selected or de-selected style, re-polishing only when the state changes.
+
+        Args:
+            is_selected: The new selection state.
+        """
+        if is_selected == self._is_selected:
+            return
+        self._is_selected = is_selected
+        self.setProperty('class', 'list-item list-item-selected' if is_selected else 'list-item')
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+        self.update()
+
     def select(self):
         """Sets the visual state to selected."""
-        self._is_selected = True
-        self.setProperty('class', 'list-item list-item-selected')
-        self.style().polish(self)
+        self._set_selected(True)
 
     def deselect(self):
         """Sets the visual state to de-selected."""
-        self._is_selected = False
-        self.setProperty('class', 'list-item')
-        self.style().polish(self)
+        self._set_selected(False)
 
     def update_details(self, new_details: dict):
         """Updates the item's data and refreshes the label."""
@@ -1711,6 +1868,65 @@ class FoundationItem(QFrame):
         total_vol_one = vol_pad + vol_ped
         return total_vol_one * n_footing
 
+class ExcelWorker(QThread):
+    """
+    Writes the cutting list workbook, runs the purchase optimization and saves the file in a background thread.
+    Only plain data is handed over; all widget access stays on the GUI thread.
+    """
+    generated = Signal(bool, str)  # (Success, Message/Path)
+
+    def __init__(self, save_path: str, cutting_lists: list[tuple[str, list]],
+                 market_lengths: dict[str, list[float]], foundation_vol_breakdown: list[tuple],
+                 optimize: bool) -> None:
+        super().__init__()
+        self.save_path = save_path
+        self.cutting_lists = cutting_lists
+        self.market_lengths = market_lengths
+        self.foundation_vol_breakdown = foundation_vol_breakdown
+        self.optimize = optimize
+
+    def run(self) -> None:
+        try:
+            # Rows are streamed to disk as they are appended; the workbook also starts without a default sheet
+            wb = Workbook(write_only=True)
+
+            # Each foundation is visited once: its sheet is streamed out and its cuts are counted for the
+            # optimizer, so only the per-diameter totals are still needed afterwards.
+            # Lengths are keyed in whole mm, the optimizer's resolution, so near-equal floats share one piece
+            cuts_by_diameter = defaultdict(Counter)
+            dia_codes = {}  # Diameter (mm) -> code, looked up once per distinct diameter
+            for title, grouped_rebars_per_fdn_type in self.cutting_lists:
+                add_sheet_cutting_list(title, grouped_rebars_per_fdn_type, self.market_lengths, wb)
+                if not self.optimize:
+                    continue
+                for bar in grouped_rebars_per_fdn_type:
+                    dia = bar['diameter']
+                    dia_code = dia_codes.get(dia)
+                    if dia_code is None:
+                        dia_code = dia_codes[dia] = get_dia_code(dia)
+                    cuts_by_diameter[dia_code][int(bar['cut_length'] + 0.5)] += bar['quantity']
+            self.cutting_lists = None
+
+            # --- Generate Concrete Purchase Plan Sheet ---
+            if sum(vol for _, vol, _ in self.foundation_vol_breakdown) > 0:
+                add_concrete_plan_to_workbook(wb, self.foundation_vol_breakdown)
+
+            if self.optimize:
+                cuts_by_diameter = {dia: [(q, l / 1000) for l, q in cuts.items()]
+                                    for dia, cuts in cuts_by_diameter.items()}
+
+                purchase_list, cutting_plan = find_optimized_cutting_plan(cuts_by_diameter, self.market_lengths)
+                add_sheet_purchase_plan(wb, purchase_list)
+                add_sheet_cutting_plan(wb, cutting_plan)
+
+            save_workbook(wb, self.save_path)
+            self.generated.emit(True, self.save_path)
+
+        except PermissionError:
+            self.generated.emit(False, 'Please ensure the file is not already open in another program.')
+        except Exception as e:
+            self.generated.emit(False, str(e))
+
 class CuttingListWindow(QMainWindow):
     def __init__(self) -> None:
         """Initializes the main application window and its components."""
@@ -1727,14 +1943,34 @@ class CuttingListWindow(QMainWindow):
 
         # Initialize
         self.scroll_layout = None
+        self._foundation_items: list[FoundationItem] = []  # List items in display order
+        self._foundation_names: set[str] = set()  # Names of the listed foundations, for duplicate checks
         self.detail_area_stack = None
-        self.detail_widgets = {}
+        self.detail_name_label = None
+        self.detail_general_label = None
+        self.detail_reinforcement_label = None
+        self._last_detail: dict[QLabel, str] = {}  # Text last shown in each detail label
         self.current_item = None
-        self.detail_stirrup_types_layout = None
         self.market_lengths_checkboxes = None
+        self._check_state: dict[str, dict[str, bool]] = {}  # Checked state of every checkbox, kept in sync
         self.market_lengths_grid = None
+        self._market_row_backgrounds: dict[str, QFrame] = {}  # Row background strip per visible diameter
         self.current_market_lengths = list(MARKET_LENGTHS)
+        # Lengths in meters, sorted and kept index-aligned with current_market_lengths
+        self._market_lengths_m = [float(length.replace('m', '')) for length in MARKET_LENGTHS]
         self.active_diameters = set(BAR_DIAMETERS) # Default to all
+        self._market_grid_diameters = None  # Diameters the grid rows were last built for (None until first built)
+        # Row/column header buttons map to their diameter/length here, so they all share one slot
+        self._market_row_mapper = QSignalMapper(self)
+        self._market_column_mapper = QSignalMapper(self)
+        # noinspection PyUnresolvedReferences
+        self._market_row_mapper.mappedString.connect(self.toggle_market_row)
+        # noinspection PyUnresolvedReferences
+        self._market_column_mapper.mappedString.connect(self.toggle_market_column)
+        self.excel_worker: ExcelWorker | None = None
+        self.excel_progress: QProgressDialog | None = None
+        self._done_msg: QMessageBox | None = None  # Completion prompt, built on first use
+        self._done_start_over_btn = None
 
         self.create_foundation_entry_page()
         self.create_market_lengths_page()
@@ -1863,8 +2099,7 @@ class CuttingListWindow(QMainWindow):
         self.market_lengths_grid = QGridLayout(grid_frame)
         self.market_lengths_grid.setContentsMargins(0, 0, 0, 0)
         self.market_lengths_grid.setSpacing(0)
-        # Initial drawing of the grid with a default empty state
-        self.redraw_market_lengths_grid({})
+        # The grid itself is built on the first visit to the page (see go_to_market_length_page)
 
         # --- 3. Add Title Row and Grid to the Content Layout ---
         content_layout.addWidget(title_row_container)
@@ -1891,36 +2126,47 @@ class CuttingListWindow(QMainWindow):
         back_button = HoverButton('Back')
         back_button.setProperty('class', 'red-button back-button')
         back_button.clicked.connect(self.go_to_foundation_page)
-        next_button = HoverButton('Generate Excel')
-        next_button.setProperty('class', 'green-button next-button')
-        next_button.clicked.connect(self.generate_excel)
+        self.generate_button = HoverButton('Generate Excel')
+        self.generate_button.setProperty('class', 'green-button next-button')
+        self.generate_button.clicked.connect(self.generate_excel)
         button_layout.addWidget(back_button)
         button_layout.addStretch(0)
-        button_layout.addWidget(next_button)
+        button_layout.addWidget(self.generate_button)
         page_layout.addWidget(bottom_nav)
         self.stacked_widget.addWidget(page)
 
     def add_foundation_item(self) -> None:
         """Opens a dialog to add a new foundation item."""
-        existing_names = []
-        for item in self.findChildren(FoundationItem):
-            if isinstance(item, FoundationItem):
-                existing_names.append(item.data['name'])
-        dialog = FoundationDetailsDialog(parent=self, existing_names=existing_names)
+        dialog = FoundationDetailsDialog(parent=self, existing_names=self._foundation_names)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
             if data['name'].strip():
-                new_item = FoundationItem(data)
-                # noinspection PyUnresolvedReferences
-                new_item.edit_requested.connect(self.edit_foundation_item)
-                # noinspection PyUnresolvedReferences
-                new_item.remove_requested.connect(self.remove_foundation_item)
-                # noinspection PyUnresolvedReferences
-                new_item.selected.connect(self.update_detail_view)
-                self.scroll_layout.insertWidget(self.scroll_layout.count() - 1, new_item)
+                new_item = self._append_foundation_item(data)
                 self.update_detail_view(new_item)
         self.next_button.setEnabled(True)
 
+    def _append_foundation_item(self, data: dict) -> FoundationItem:
+        """
+        Creates a list item for a foundation, wires its signals and adds it to the end of the list.
+
+        Args:
+            data: The foundation details, as returned by FoundationDetailsDialog.get_data().
+
+        Returns:
+            The new FoundationItem.
+        """
+        new_item = FoundationItem(data)
+        # noinspection PyUnresolvedReferences
+        new_item.edit_requested.connect(self.edit_foundation_item)
+        # noinspection PyUnresolvedReferences
+        new_item.remove_requested.connect(self.remove_foundation_item)
+        # noinspection PyUnresolvedReferences
+        new_item.selected.connect(self.update_detail_view)
+        self.scroll_layout.insertWidget(self.scroll_layout.count() - 1, new_item)
+        self._foundation_items.append(new_item)
+        self._foundation_names.add(data['name'])
+        return new_item
+
     def create_detail_panel(self) -> QWidget:
         """Creates a comprehensive, scrollable widget to display all foundation details."""
         # The main container for the entire right panel's content
@@ -1930,11 +2176,13 @@ class CuttingListWindow(QMainWindow):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
-        self.detail_widgets = {'name_header': QLabel('Foundation Details')}  # Reset the dictionary
+        self._last_detail = {}
 
         # --- Main Title ---
-        self.detail_widgets['name_header'].setProperty('class', 'header-1')  # Big, bold title
-        layout.addWidget(self.detail_widgets['name_header'])
+        self.detail_name_label = QLabel('Foundation Details')
+        self.detail_name_label.setProperty('class', 'header-1')  # Big, bold title
+        self.detail_name_label.setTextFormat(Qt.TextFormat.PlainText)  # User-entered name, never markup
+        layout.addWidget(self.detail_name_label)
 
         layout.addSpacing(16)
         separator = QFrame()
@@ -1949,28 +2197,9 @@ class CuttingListWindow(QMainWindow):
         layout.addWidget(gen_info_label, 0, Qt.AlignmentFlag.AlignLeft)
         layout.addSpacing(14)
 
-        form_layout_general = QFormLayout()
-        form_layout_general.setSpacing(0)
-        form_layout_general.setContentsMargins(0, 0, 0, 0)
-        self.detail_widgets['n_footing'] = QLabel()
-        self.detail_widgets['n_ped'] = QLabel()
-        self.detail_widgets['cc'] = QLabel()
-        self.detail_widgets['pad_dims'] = QLabel()
-        self.detail_widgets['pedestal_dims'] = QLabel()
-
-        def add_row(form_layout: Any, label: str, widget_name: str):
-            form_label = QLabel(label)
-            form_label.setProperty('class', 'form-label')
-            form_value = self.detail_widgets[widget_name]
-            form_value.setProperty('class', 'form-value')
-            form_layout.addRow(form_label, form_value)
-
-        add_row(form_layout_general, 'Total Number of Footings:', 'n_footing')
-        add_row(form_layout_general, 'Pedestals per Footing:', 'n_ped')
-        add_row(form_layout_general, 'Concrete Cover:', 'cc')
-        add_row(form_layout_general, 'Pad Dimensions (Bx, By, t):', 'pad_dims')
-        add_row(form_layout_general, 'Pedestal Dims (bx, by, h):', 'pedestal_dims')
-        layout.addLayout(form_layout_general)
+        # Each section is a single rich-text label showing an HTML table, instead of a form layout of label pairs
+        self.detail_general_label = QLabel()
+        layout.addWidget(self.detail_general_label)
 
         layout.addSpacing(21)  # Add some vertical space between sections
 
@@ -1980,33 +2209,17 @@ class CuttingListWindow(QMainWindow):
         layout.addWidget(reinf_detail_label, 0, Qt.AlignmentFlag.AlignLeft)
         layout.addSpacing(14)
 
-        form_layout_rebar = QFormLayout()
-        form_layout_rebar.setSpacing(0)
-        form_layout_rebar.setContentsMargins(0, 0, 0, 0)
-        self.detail_widgets['top_bar'] = QLabel('None')
-        self.detail_widgets['bottom_bar'] = QLabel()
-        self.detail_widgets['vertical_bar'] = QLabel()
-        self.detail_widgets['perimeter_bar'] = QLabel('None')
-        self.detail_widgets['stirrups_summary'] = QLabel('None')
-
-        add_row(form_layout_rebar, 'Top Bar:', 'top_bar')
-        add_row(form_layout_rebar, 'Bottom Bar:', 'bottom_bar')
-        add_row(form_layout_rebar, 'Vertical Bar:', 'vertical_bar')
-        add_row(form_layout_rebar, 'Perimeter Bar:', 'perimeter_bar')
-        add_row(form_layout_rebar, 'Stirrups:', 'stirrups_summary')
-        layout.addLayout(form_layout_rebar)
-
-        # --- Dynamic Layout for Stirrup Types ---
-        # This special layout will hold the list of individual stirrup shapes
-        self.detail_stirrup_types_layout = QVBoxLayout()
-        self.detail_stirrup_types_layout.setContentsMargins(0, 0, 0, 0)  # Indent the list
-        self.detail_stirrup_types_layout.setSpacing(0)
-        layout.addLayout(self.detail_stirrup_types_layout)
+        self.detail_reinforcement_label = QLabel()
+        layout.addWidget(self.detail_reinforcement_label)
 
         layout.addStretch()
 
+        for section_label in (self.detail_general_label, self.detail_reinforcement_label):
+            section_label.setProperty('class', 'detail-table')
+            section_label.setTextFormat(Qt.TextFormat.RichText)
+
         # --- Set properties for all created labels ---
-        for widget in self.detail_widgets.values():
+        for widget in (self.detail_name_label, self.detail_general_label, self.detail_reinforcement_label):
             widget.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
             widget.setWordWrap(True)
 
@@ -2016,14 +2229,7 @@ class CuttingListWindow(QMainWindow):
 
     def get_current_checkbox_states(self) -> dict:
         """Captures the checked state of all checkboxes into a simple dictionary."""
-        states = {}
-        if not self.market_lengths_checkboxes:
-            return {}
-        for dia, lengths_dict in self.market_lengths_checkboxes.items():
-            states[dia] = {}
-            for length, cb_widget in lengths_dict.items():
-                states[dia][length] = cb_widget.isChecked()
-        return states
+        return {dia: dict(lengths_dict) for dia, lengths_dict in self._check_state.items()}
 
     def redraw_market_lengths_grid(self, previous_states: dict):
         """
@@ -2032,109 +2238,221 @@ class CuttingListWindow(QMainWindow):
         if self.market_lengths_grid is None:
             return
 
-        # Clear all existing widgets from the grid
+        # Suspend painting so the whole rebuild costs a single repaint and layout pass
+        grid_frame = self.market_lengths_grid.parentWidget()
+        grid_frame.setUpdatesEnabled(False)
+
+        # Clear all existing widgets from the grid; unparented, they are freed as soon as the
+        # references below are dropped instead of piling up as deferred deletes
         while self.market_lengths_grid.count():
-            item = self.market_lengths_grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+            widget = self.market_lengths_grid.takeAt(0).widget()
+            if widget is not None:
+                widget.setParent(None)
 
         self.market_lengths_checkboxes = {}
-
-        def create_cell(widget, is_header=False, is_alternate=False, x=0, y=0):
-            cell = QFrame()
-            cell.setAutoFillBackground(True)
-            cell_layout = QHBoxLayout(cell)
-            cell_layout.setContentsMargins(0, 0, 0, 0)
-            cell_layout.setSpacing(0)
-            if isinstance(widget, QPushButton):
-                cell_layout.addWidget(widget)
-            else:
-                cell_layout.addStretch()
-                cell_layout.addWidget(widget)
-                cell_layout.addStretch()
-            style_class = 'grid-cell'
-            if is_header: style_class += ' header-cell'
-            if is_alternate: style_class += ' alternate-row-cell'
-            if x == 0 and y > 0:
-                style_class += ' header-column-cell'
-            elif y == 0 and x > 0:
-                style_class += ' header-row-cell'
-            elif x == 0 and y == 0:
-                style_class += ' header-corner-cell'
-            else:
-                style_class += ' non-header-cell'
-            cell.setProperty('class', style_class)
-            return cell
+        self._check_state = {}
+        self._market_row_backgrounds = {}
+        self._market_grid_diameters = set(self.active_diameters)
 
         # Re-create Top-Left Header
         toggle_all_btn = HoverButton('Diameter')
         toggle_all_btn.setToolTip('Toggle All Checkboxes')
         toggle_all_btn.setProperty('class', 'clickable-header')
         toggle_all_btn.clicked.connect(self.toggle_all_market_checkboxes)
-        self.market_lengths_grid.addWidget(create_cell(toggle_all_btn, is_header=True, x=0, y=0), 0, 0)
+        self.market_lengths_grid.addWidget(self._create_grid_cell(toggle_all_btn, _GRID_CORNER_CELL), 0, 0)
 
         # Re-create Column Headers
         for col, length in enumerate(self.current_market_lengths):
-            btn = HoverButton(length)
-            btn.setProperty('class', 'clickable-header clickable-column-header')
-            btn.clicked.connect(lambda checked, l=length: self.toggle_market_column(l))
-            self.market_lengths_grid.addWidget(create_cell(btn, is_header=True, x=0, y=col + 1), 0, col + 1)
-
-        # Re-create Rows (FILTERED)
-        visual_row_index = 0
-        for dia in BAR_DIAMETERS:
-            # FILTER LOGIC: Skip if not in active set
-            if dia not in self.active_diameters:
-                continue
+            self.market_lengths_grid.addWidget(self._create_length_header_cell(length), 0, col + 1)
 
-            visual_row_index += 1
-            is_alternate_row = visual_row_index % 2 == 1
+        # Re-create Rows (FILTERED to the active diameters)
+        visible_diameters = [dia for dia in BAR_DIAMETERS if dia in self.active_diameters]
+        columns = tuple(enumerate(self.current_market_lengths, 1))  # (grid column, length), shared by every row
+        for row, dia in enumerate(visible_diameters, 1):
+            header_class, background_class = _GRID_ROW_CLASSES[row % 2]
             self.market_lengths_checkboxes[dia] = {}
+            self._check_state[dia] = {}
+            row_states = previous_states.get(dia, {})
 
             # Row Header
             btn = HoverButton(dia)
             btn.setProperty('class', 'clickable-header clickable-row-header')
-            btn.clicked.connect(lambda checked, d=dia: self.toggle_market_row(d))
-            self.market_lengths_grid.addWidget(
-                create_cell(btn, is_header=True, is_alternate=is_alternate_row, x=visual_row_index, y=0),
-                visual_row_index, 0)
+            btn.clicked.connect(self._market_row_mapper.map)
+            self._market_row_mapper.setMapping(btn, dia)
+            self.market_lengths_grid.addWidget(self._create_grid_cell(btn, header_class), row, 0)
+
+            # One background strip behind the row's checkboxes instead of a wrapper widget per cell
+            if columns:
+                row_background = QFrame()
+                row_background.setAutoFillBackground(True)
+                row_background.setProperty('class', background_class)
+                self.market_lengths_grid.addWidget(row_background, row, 1, 1, len(columns))
+                self._market_row_backgrounds[dia] = row_background
 
             # Checkboxes
-            for col, length in enumerate(self.current_market_lengths):
-                cb = QCheckBox()
-                cb.setProperty('class', 'check-box')
-                is_checked = previous_states.get(dia, {}).get(length, False)
-                cb.setChecked(is_checked)
-                self.market_lengths_checkboxes[dia][length] = cb
+            for col, length in columns:
                 self.market_lengths_grid.addWidget(
-                    create_cell(cb, is_alternate=is_alternate_row, x=visual_row_index, y=col + 1),
-                    visual_row_index, col + 1)
+                    self._create_market_checkbox(dia, length, row_states.get(length, False)),
+                    row, col, Qt.AlignmentFlag.AlignCenter)
 
         # If no diameters are active, show a placeholder message in grid
-        if visual_row_index == 0:
+        if not visible_diameters:
             lbl = QLabel('No diameters required based on current inputs.')
             self.market_lengths_grid.addWidget(lbl, 1, 0, 1, len(self.current_market_lengths) + 1)
 
+        grid_frame.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _create_grid_cell(widget, style_class: str) -> QFrame:
+        """Wraps a market lengths header widget in a styled grid cell."""
+        cell = QFrame()
+        # Class first, so the cell and its child are polished once, with their final style, when shown
+        cell.setProperty('class', style_class)
+        cell.setAutoFillBackground(True)
+        cell_layout = QHBoxLayout(cell)
+        cell_layout.setContentsMargins(0, 0, 0, 0)
+        cell_layout.setSpacing(0)
+        if isinstance(widget, QPushButton):
+            cell_layout.addWidget(widget)
+        else:
+            cell_layout.addStretch()
+            cell_layout.addWidget(widget)
+            cell_layout.addStretch()
+        return cell
+
+    def _create_length_header_cell(self, length: str) -> QFrame:
+        """Creates the clickable column header cell for a market length."""
+        btn = HoverButton(length)
+        btn.setProperty('class', 'clickable-header clickable-column-header')
+        btn.clicked.connect(self._market_column_mapper.map)
+        self._market_column_mapper.setMapping(btn, length)
+        return self._create_grid_cell(btn, _GRID_COLUMN_HEADER_CELL)
+
+    def _create_market_checkbox(self, dia: str, length: str, is_checked: bool) -> QCheckBox:
+        """Creates and registers the checkbox for one diameter and market length."""
+        cb = QCheckBox()
+        cb.setProperty('class', 'check-box')
+        cb.setChecked(is_checked)
+        # noinspection PyUnresolvedReferences
+        cb.toggled.connect(lambda checked, d=dia, l=length: self._check_state[d].__setitem__(l, checked))
+        self.market_lengths_checkboxes[dia][length] = cb
+        self._check_state[dia][length] = is_checked
+        return cb
+
+    def _set_market_checkboxes(self, cells, is_checked: bool) -> None:
+        """
+        Sets the given checkboxes, writing the shadow state directly instead of through their toggled signals.
+        Painting is suspended on the grid meanwhile, so a bulk toggle repaints once.
+
+        Args:
+            cells: Iterable of (diameter, length) pairs.
+            is_checked: The new checked state.
+        """
+        grid_frame = self.market_lengths_grid.parentWidget()
+        grid_frame.setUpdatesEnabled(False)
+        for dia, length in cells:
+            if self._check_state[dia][length] == is_checked:
+                continue
+            self._check_state[dia][length] = is_checked
+            cb = self.market_lengths_checkboxes[dia][length]
+            with QSignalBlocker(cb):
+                cb.setChecked(is_checked)
+        grid_frame.setUpdatesEnabled(True)
+
+    def _shift_market_columns(self, first_col: int, offset: int) -> None:
+        """
+        Moves every grid cell from a column onwards sideways, leaving the row backgrounds in place.
+
+        Args:
+            first_col: The first grid column to move.
+            offset: How many columns to move by (negative moves left).
+        """
+        grid = self.market_lengths_grid
+        row_backgrounds = set(self._market_row_backgrounds.values())
+        moves = []
+        for i in range(grid.count()):
+            item = grid.itemAt(i)
+            row, col, _, _ = grid.getItemPosition(i)
+            if col >= first_col and item.widget() not in row_backgrounds:
+                moves.append((item.widget(), row, col, item.alignment()))
+        for widget, row, col, alignment in moves:
+            grid.removeWidget(widget)
+            grid.addWidget(widget, row, col + offset, alignment)
+
+    def _update_market_row_backgrounds(self) -> None:
+        """Stretches the row backgrounds over the current number of market length columns."""
+        for row, row_background in enumerate(self._market_row_backgrounds.values(), 1):
+            self.market_lengths_grid.removeWidget(row_background)
+            self.market_lengths_grid.addWidget(row_background, row, 1, 1, len(self.current_market_lengths))
+
+    def _insert_market_length_column(self, length: str) -> None:
+        """
+        Adds the header and checkboxes for a market length already inserted in current_market_lengths,
+        keeping every existing cell.
+
+        Args:
+            length: The new market length, e.g. '8m'.
+        """
+        if not self.market_lengths_checkboxes or len(self.current_market_lengths) == 1:
+            # No rows or no columns to extend yet, so the layout is rebuilt instead
+            self.redraw_market_lengths_grid(self.get_current_checkbox_states())
+            return
+
+        grid_frame = self.market_lengths_grid.parentWidget()
+        grid_frame.setUpdatesEnabled(False)
+        col = self.current_market_lengths.index(length) + 1
+        self._shift_market_columns(col, 1)
+        self.market_lengths_grid.addWidget(self._create_length_header_cell(length), 0, col)
+        for row, dia in enumerate(self.market_lengths_checkboxes, 1):
+            self.market_lengths_grid.addWidget(self._create_market_checkbox(dia, length, False),
+                                               row, col, Qt.AlignmentFlag.AlignCenter)
+            # Keep each row's checkboxes in column order
+            row_checkboxes = self.market_lengths_checkboxes[dia]
+            self.market_lengths_checkboxes[dia] = {l: row_checkboxes[l] for l in self.current_market_lengths}
+            row_state = self._check_state[dia]
+            self._check_state[dia] = {l: row_state[l] for l in self.current_market_lengths}
+        self._update_market_row_backgrounds()
+        grid_frame.setUpdatesEnabled(True)
+
+    def _remove_market_length_column(self, length: str, col: int) -> None:
+        """
+        Deletes the header and checkboxes of a market length already removed from current_market_lengths.
+
+        Args:
+            length: The removed market length.
+            col: The grid column it occupied.
+        """
+        if not self.market_lengths_checkboxes or not self.current_market_lengths:
+            self.redraw_market_lengths_grid(self.get_current_checkbox_states())
+            return
+
+        grid_frame = self.market_lengths_grid.parentWidget()
+        grid_frame.setUpdatesEnabled(False)
+        header_cell = self.market_lengths_grid.itemAtPosition(0, col).widget()
+        self.market_lengths_grid.removeWidget(header_cell)
+        header_cell.setParent(None)
+        for dia, lengths_dict in self.market_lengths_checkboxes.items():
+            del self._check_state[dia][length]
+            cb = lengths_dict.pop(length)
+            self.market_lengths_grid.removeWidget(cb)
+            cb.setParent(None)
+        self._shift_market_columns(col + 1, -1)
+        self._update_market_row_backgrounds()
+        grid_frame.setUpdatesEnabled(True)
+
     def toggle_all_market_checkboxes(self):
         """Toggles the state of every checkbox in the market lengths grid."""
         # Do nothing if the grid is empty
         if not self.market_lengths_checkboxes or not BAR_DIAMETERS or not self.current_market_lengths:
             return
 
-        # Determine the new state by checking the first checkbox
-        try:
-            first_dia = BAR_DIAMETERS[0]
-            first_len = self.current_market_lengths[0]
-            first_checkbox = self.market_lengths_checkboxes[first_dia][first_len]
-            new_state = not first_checkbox.isChecked()
-        except (IndexError, KeyError):
-            # If the grid is somehow malformed, default to checking all
-            new_state = True
+        # Determine the new state from the first checkbox; if its row is hidden, default to checking all
+        first_len = self.current_market_lengths[0]
+        new_state = not self._check_state.get(BAR_DIAMETERS[0], {}).get(first_len, False)
 
         # Apply the new state to all checkboxes
-        for dia_dict in self.market_lengths_checkboxes.values():
-            for checkbox in dia_dict.values():
-                checkbox.setChecked(new_state)
+        self._set_market_checkboxes(
+            ((dia, length) for dia, lengths_dict in self._check_state.items() for length in lengths_dict), new_state)
 
     def add_market_length(self):
         """Prompts the user for a new market length and redraws the grid."""
@@ -2171,11 +2489,11 @@ class CuttingListWindow(QMainWindow):
             if new_length > 0:
                 new_length_str = f'{new_length:.0f}m' if int(new_length) == new_length else f'{new_length:.1f}m'
 
-                if new_length_str not in self.current_market_lengths:
-                    saved_states = self.get_current_checkbox_states()
-                    self.current_market_lengths.append(new_length_str)
-                    self.current_market_lengths.sort(key=lambda s: float(s.replace('m', '')))
-                    self.redraw_market_lengths_grid(saved_states)
+                index = bisect_left(self._market_lengths_m, new_length)
+                if index == len(self._market_lengths_m) or self._market_lengths_m[index] != new_length:
+                    self._market_lengths_m.insert(index, new_length)
+                    self.current_market_lengths.insert(index, new_length_str)
+                    self._insert_market_length_column(new_length_str)
                 else:
                     # You can apply the same principle to QMessageBox
                     msg_box = QMessageBox(self)
@@ -2208,23 +2526,21 @@ class CuttingListWindow(QMainWindow):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             length_to_remove = dialog.textValue()
             if length_to_remove:
-                # --- SAVE STATE BEFORE REDRAWING ---
-                saved_states = self.get_current_checkbox_states()
-                self.current_market_lengths.remove(length_to_remove)
-                # --- PASS SAVED STATE TO REDRAW METHOD ---
-                self.redraw_market_lengths_grid(saved_states)
+                index = self.current_market_lengths.index(length_to_remove)
+                del self.current_market_lengths[index]
+                del self._market_lengths_m[index]
+                self._remove_market_length_column(length_to_remove, index + 1)
 
     def toggle_market_row(self, dia: str) -> None:
         """Toggles all checkboxes in a given market length row."""
-        row_cbs = self.market_lengths_checkboxes[dia]
-        if not row_cbs: return
+        row_state = self._check_state[dia]
+        if not row_state: return
 
         if not self.current_market_lengths: return
         first_len = self.current_market_lengths[0]
-        new_state = not row_cbs[first_len].isChecked()
+        new_state = not row_state[first_len]
 
-        for cb in row_cbs.values():
-            cb.setChecked(new_state)
+        self._set_market_checkboxes([(dia, length) for length in row_state], new_state)
 
     def toggle_market_column(self, length: str) -> None:
         """Toggles active checkboxes in a column."""
@@ -2233,37 +2549,20 @@ class CuttingListWindow(QMainWindow):
         first_visible = next((d for d in BAR_DIAMETERS if d in self.active_diameters), None)
         if not first_visible: return
 
-        new_state = not self.market_lengths_checkboxes[first_visible][length].isChecked()
+        new_state = not self._check_state[first_visible][length]
 
-        for dia in self.active_diameters:
-            if dia in self.market_lengths_checkboxes:
-                self.market_lengths_checkboxes[dia][length].setChecked(new_state)
+        self._set_market_checkboxes([(dia, length) for dia in self.active_diameters if dia in self._check_state],
+                                    new_state)
 
     def get_all_foundation_data(self) -> list[dict]:
         """
-        Iterates through the layout and collects the .data dictionary from
-        every FoundationItem widget.
+        Collects the .data dictionary from every FoundationItem, in list order.
 
         Returns:
             A list of dictionaries, where each dictionary contains all the
             details for one foundation type.
         """
-        all_data = []
-        # A QLayout's items are accessed by index.
-        for i in range(self.scroll_layout.count()):
-            # itemAt() returns a QLayoutItem, which is a wrapper.
-            layout_item = self.scroll_layout.itemAt(i)
-
-            # We need to get the actual widget from the layout item.
-            widget = layout_item.widget()
-
-            # IMPORTANT: Check if the widget is a FoundationItem.
-            # This safely ignores the stretch/spacer at the end of the layout,
-            # which has no .data attribute and would otherwise cause a crash.
-            if isinstance(widget, FoundationItem):
-                all_data.append(widget.data)
-
-        return all_data
+        return [item.data for item in self._foundation_items]
 
     def update_detail_view(self, item: FoundationItem):
         """Updates the right panel with ALL details of the selected item."""
@@ -2274,19 +2573,20 @@ class CuttingListWindow(QMainWindow):
         self.current_item.select()
         data = item.data
 
+        # Coalesce the label updates below into a single repaint
+        self.detail_area_stack.setUpdatesEnabled(False)
+
         # --- Populate General & Dimensions ---
-        self.detail_widgets['name_header'].setText(data.get('name', 'N/A'))
-        self.detail_widgets['n_footing'].setText(f'{data.get('n_footing', 0):,.0f}')
-        self.detail_widgets['n_ped'].setText(f'{data.get('n_ped', 0):,.0f}')
-        self.detail_widgets['cc'].setText(f'{data.get('cc', 0):,.0f} mm')
+        self._set_detail_text(self.detail_name_label, data.get('name', 'N/A'))
         pad_dims_text = f'{data.get('Bx', 0):,.0f} x {data.get('By', 0):,.0f} x {data.get('t', 0):,.0f} mm'
-        self.detail_widgets['pad_dims'].setText(pad_dims_text)
         ped_dims_text = f'{data.get('bx', 0):,.0f} x {data.get('by', 0):,.0f} x {data.get('h', 0):,.0f} mm'
-        self.detail_widgets['pedestal_dims'].setText(ped_dims_text)
-
-        # --- Helper function for styling disabled text ---
-        def format_disabled(text):
-            return f"<i><font color='#A7A6A6'>{text}</font></i>"
+        self._set_detail_text(self.detail_general_label, _detail_table_html([
+            ('Total Number of Footings:', f'{data.get('n_footing', 0):,.0f}'),
+            ('Pedestals per Footing:', f'{data.get('n_ped', 0):,.0f}'),
+            ('Concrete Cover:', f'{data.get('cc', 0):,.0f} mm'),
+            ('Pad Dimensions (Bx, By, t):', pad_dims_text),
+            ('Pedestal Dims (bx, by, h):', ped_dims_text),
+        ]))
 
         # --- Populate Top Bar ---
         top_bar_data = data['Top Bar']
@@ -2295,9 +2595,9 @@ class CuttingListWindow(QMainWindow):
                 details = f'{top_bar_data['Value Along X']} pcs (Along X), {top_bar_data['Value Along Y']} pcs (Along Y)'
             else:  # Spacing
                 details = f'@{top_bar_data['Value Along X']} mm (Along X), @{top_bar_data['Value Along Y']} mm (Along Y)'
-            self.detail_widgets['top_bar'].setText(f'{top_bar_data['Diameter']} | {details}')
+            top_bar = f'{top_bar_data['Diameter']} | {details}'
         else:
-            self.detail_widgets['top_bar'].setText(format_disabled('Not Used'))
+            top_bar = _NOT_USED_HTML
 
         # --- Populate Bottom Bar ---
         bot_bar_data = data['Bottom Bar']
@@ -2306,9 +2606,9 @@ class CuttingListWindow(QMainWindow):
                 details = f'{bot_bar_data['Value Along X']} pcs (Along X), {bot_bar_data['Value Along Y']} pcs (Along Y)'
             else:  # Spacing
                 details = f'@{bot_bar_data['Value Along X']} mm (Along X), @{bot_bar_data['Value Along Y']} mm (Along Y)'
-            self.detail_widgets['bottom_bar'].setText(f'{bot_bar_data['Diameter']} | {details}')
+            bottom_bar = f'{bot_bar_data['Diameter']} | {details}'
         else:
-            self.detail_widgets['bottom_bar'].setText(format_disabled('Not Used'))
+            bottom_bar = _NOT_USED_HTML
 
         # --- Populate Vertical Bar ---
         vert_bar_data = data['Vertical Bar']
@@ -2318,57 +2618,66 @@ class CuttingListWindow(QMainWindow):
                 hook_details += f': {vert_bar_data['Hook Length']} mm'
             hook_details += ')'
             details = f'{vert_bar_data['Quantity']} pcs | {vert_bar_data['Diameter']} {hook_details}'
-            self.detail_widgets['vertical_bar'].setText(details)
+            vertical_bar = details
         else:
-            self.detail_widgets['vertical_bar'].setText(format_disabled('Not Used'))
+            vertical_bar = _NOT_USED_HTML
 
         # --- Populate Perimeter Bar ---
         perim_bar_data = data['Perimeter Bar']
         if perim_bar_data['Enabled']:
             layers = perim_bar_data.get('Layers', '1')
-            self.detail_widgets['perimeter_bar'].setText(f'{layers} Layer(s) | {perim_bar_data['Diameter']}')
+            perimeter_bar = f'{layers} Layer(s) | {perim_bar_data['Diameter']}'
         else:
-            self.detail_widgets['perimeter_bar'].setText(format_disabled('Not Used'))
+            perimeter_bar = _NOT_USED_HTML
 
         # --- Populate Stirrups ---
         stirrup_data = data['Stirrups']
-        # Clear previous stirrup type labels
-        while self.detail_stirrup_types_layout.count():
-            child = self.detail_stirrup_types_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
+        type_texts = []
         if stirrup_data['Enabled']:
             summary = f'{stirrup_data['Quantity']} total sets, starting from <b>{stirrup_data['Extent']}</b>'
             summary += f'<br>Spacing: <code>{stirrup_data['Spacing']}</code>'
-            self.detail_widgets['stirrups_summary'].setText(summary)
+            stirrups_summary = summary
 
-            # Dynamically add a label for each stirrup type in the bundle
             for stirrup_type in stirrup_data.get('Types', []):
                 type_text = f'• {stirrup_type['Type']}: {stirrup_type['Diameter']}'
                 if stirrup_type['Type'] in ['Tall', 'Wide', 'Octagon']:
                     type_text += f' (a: {stirrup_type['a_input']} mm)'
-
-                type_label = QLabel(type_text)
-                type_label.setProperty('class', 'form-value')
-                type_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-                self.detail_stirrup_types_layout.addWidget(type_label)
+                type_texts.append(type_text)
         else:
-            self.detail_widgets['stirrups_summary'].setText(format_disabled('Not Used'))
+            stirrups_summary = _NOT_USED_HTML
+
+        self._set_detail_text(self.detail_reinforcement_label, _detail_table_html([
+            ('Top Bar:', top_bar),
+            ('Bottom Bar:', bottom_bar),
+            ('Vertical Bar:', vertical_bar),
+            ('Perimeter Bar:', perimeter_bar),
+            ('Stirrups:', stirrups_summary),
+        ], tuple(type_texts)))
 
         # Switch the stacked widget to show the details
         self.detail_area_stack.setCurrentIndex(1)
+        self.detail_area_stack.setUpdatesEnabled(True)
+
+    def _set_detail_text(self, label: QLabel, text: str) -> None:
+        """
+        Sets the text of a detail label, skipping labels that already show it.
+
+        Args:
+            label: One of the detail panel labels.
+            text: The text to show.
+        """
+        if self._last_detail.get(label) != text:
+            self._last_detail[label] = text
+            label.setText(text)
 
     def edit_foundation_item(self, item: FoundationItem) -> None:
         """Opens a dialog to edit an existing foundation item."""
-        existing_names = []
-        for item in self.findChildren(FoundationItem):
-            if isinstance(item, FoundationItem):
-                existing_names.append(item.data['name'])
-        dialog = FoundationDetailsDialog(existing_details=item.data, parent=self, existing_names=existing_names)
+        dialog = FoundationDetailsDialog(existing_details=item.data, parent=self, existing_names=self._foundation_names)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             new_data = dialog.get_data()
             if new_data['name'].strip():
+                self._foundation_names.discard(item.data['name'])
+                self._foundation_names.add(new_data['name'])
                 item.update_details(new_data)
                 self.update_detail_view(item)
 
@@ -2378,16 +2687,17 @@ class CuttingListWindow(QMainWindow):
         remaining item.
         """
         was_selected = (item == self.current_item)
-        index = self.scroll_layout.indexOf(item)
+        index = self._foundation_items.index(item)
 
         # Remove the widget from the layout and schedule it for deletion
+        del self._foundation_items[index]
+        self._foundation_names.discard(item.data['name'])
         self.scroll_layout.removeWidget(item)
         item.deleteLater()
 
         # If the deleted item was the selected one, decide what to select next
         if was_selected:
-            # The count of actual FoundationItem widgets (excluding the final stretch)
-            remaining_items_count = self.scroll_layout.count() - 1
+            remaining_items_count = len(self._foundation_items)
 
             if remaining_items_count > 0:
                 # Determine the index of the new item to select.
@@ -2397,9 +2707,7 @@ class CuttingListWindow(QMainWindow):
                 # Ensure the index is not out of bounds if the last item was removed
                 new_index = min(new_index, remaining_items_count - 1)
 
-                new_item_to_select = self.scroll_layout.itemAt(new_index).widget()
-                if isinstance(new_item_to_select, FoundationItem):
-                    self.update_detail_view(new_item_to_select)
+                self.update_detail_view(self._foundation_items[new_index])
             else:
                 # No items left, so show the placeholder
                 self.current_item = None
@@ -2496,18 +2804,11 @@ class CuttingListWindow(QMainWindow):
             corrected_data = temp_dialog.get_data()
 
             # 4. Create the FoundationItem with the corrected data.
-            new_item = FoundationItem(corrected_data)
+            new_item = self._append_foundation_item(corrected_data)
 
             # 5. Clean up the temporary dialog (optional, but good practice)
             temp_dialog.deleteLater()
 
-            # noinspection PyUnresolvedReferences
-            new_item.edit_requested.connect(self.edit_foundation_item)
-            # noinspection PyUnresolvedReferences
-            new_item.remove_requested.connect(self.remove_foundation_item)
-            # noinspection PyUnresolvedReferences
-            new_item.selected.connect(self.update_detail_view)
-            self.scroll_layout.insertWidget(self.scroll_layout.count() - 1, new_item)
             if not first_item:
                 first_item = new_item
 
@@ -2521,10 +2822,12 @@ class CuttingListWindow(QMainWindow):
         # 1. Clear all foundation items from the list
         # We loop until only the stretch item (count = 1) is left.
         while self.scroll_layout.count() > 1:
-            layout_item = self.scroll_layout.takeAt(0)
-            if layout_item.widget():
-                # Remove the widget from the layout and schedule it for deletion
-                layout_item.widget().deleteLater()
+            widget = self.scroll_layout.takeAt(0).widget()
+            if widget is not None:
+                # Remove the widget from the layout; it is freed once the item list below lets go of it
+                widget.setParent(None)
+        self._foundation_items.clear()
+        self._foundation_names.clear()
 
         # 2. Reset the detail view to the placeholder
         self.current_item = None
@@ -2532,9 +2835,8 @@ class CuttingListWindow(QMainWindow):
 
         # 3. Reset all checkboxes on the market lengths page
         if self.market_lengths_checkboxes:
-            for dia_dict in self.market_lengths_checkboxes.values():
-                for checkbox in dia_dict.values():
-                    checkbox.setChecked(False)
+            self._set_market_checkboxes(
+                ((dia, length) for dia, lengths_dict in self._check_state.items() for length in lengths_dict), False)
 
         # 4. Switch back to the first page
         self.stacked_widget.setCurrentIndex(0)
@@ -2562,13 +2864,38 @@ class CuttingListWindow(QMainWindow):
         # 2. Determine used diameters
         self.active_diameters = self.get_used_diameters(all_data)
 
-        # 3. Save current states, then redraw with filter
-        current_states = self.get_current_checkbox_states()
-        self.redraw_market_lengths_grid(current_states)
+        # 3. Save current states, then redraw with filter; the grid already matches if the diameters are unchanged
+        if self.active_diameters != self._market_grid_diameters:
+            current_states = self.get_current_checkbox_states()
+            self.redraw_market_lengths_grid(current_states)
 
         self.stacked_widget.setCurrentIndex(1)
         self.setFocus()
 
+    def show_completion_prompt(self) -> None:
+        """
+        Asks whether to start over or close after a file was generated.
+        The message box is built on first use and reused afterwards.
+        """
+        if self._done_msg is None:
+            self._done_msg = QMessageBox(self)
+            self._done_msg.setWindowTitle('Generation Complete')
+            self._done_msg.setText('The cutting list has been generated and saved.')
+            self._done_msg.setInformativeText('What would you like to do next?')
+            self._done_msg.setIcon(QMessageBox.Icon.Question)
+
+            # Keep the existing button setup, we will style them via QSS
+            self._done_start_over_btn = self._done_msg.addButton('Start Over', QMessageBox.ButtonRole.ResetRole)
+            self._done_msg.addButton('Close Program', QMessageBox.ButtonRole.RejectRole)
+        self._done_msg.setDefaultButton(self._done_start_over_btn)
+
+        self._done_msg.exec()
+
+        if self._done_msg.clickedButton() == self._done_start_over_btn:
+            self.reset_application()
+        else:
+            self.close()
+
     def generate_excel(self):
         all_data = self.get_all_foundation_data()
         if not all_data:
@@ -2582,8 +2909,9 @@ class CuttingListWindow(QMainWindow):
 
         required_diameters = self.get_used_diameters(all_data)
         market_lengths = {}
-        for dia_code, lengths in self.market_lengths_checkboxes.items():
-            available_lengths = [float(l.replace('m', '')) for l, cb in lengths.items() if cb.isChecked()]
+        length_m = dict(zip(self.current_market_lengths, self._market_lengths_m))
+        for dia_code, lengths in self._check_state.items():
+            available_lengths = [length_m[l] for l, is_checked in lengths.items() if is_checked]
             if available_lengths:
                 market_lengths[dia_code] = available_lengths
 
@@ -2610,26 +2938,28 @@ class CuttingListWindow(QMainWindow):
             proceed_with_optimization = False
 
         # Initialize
-        total_concrete_vol_m3 = 0.0
         foundation_vol_breakdown = []
-        all_results = []
+        cutting_lists = []
         splicing_ok = True
-        wb = Workbook()
+
+        # Foundation types often repeat the same detailing under another name; compile each detailing once
+        rebars_by_signature = {}
 
         for data in all_data:
-            rebars_per_fdn_type = compile_rebar(data)
-            all_results.append(rebars_per_fdn_type)
-            grouped_rebars_per_fdn_type = process_rebar_input(rebars_per_fdn_type)
-            wb, proceed = add_sheet_cutting_list(data['name'], grouped_rebars_per_fdn_type, market_lengths, wb)
+            signature = _rebar_signature(data)
+            if signature not in rebars_by_signature:
+                rebars_by_signature[signature] = _compile_grouped_rebars(data)
+            # Shared results are only read from here on
+            grouped_rebars_per_fdn_type = rebars_by_signature[signature]
+            cutting_lists.append((data['name'], grouped_rebars_per_fdn_type))
 
             # We temporarily create an item wrapper to calculate volume easily
             temp_item = FoundationItem(data)
             vol = temp_item.calculate_volume()
             temp_item.deleteLater()
-            total_concrete_vol_m3 += vol
             foundation_vol_breakdown.append((data['name'], vol, data['n_footing']))
 
-            if not proceed:
+            if requires_splicing(grouped_rebars_per_fdn_type, market_lengths):
                 splicing_ok = False
                 msg_box = QMessageBox(self)
                 # Give this a specific name for more detailed styling
@@ -2647,33 +2977,7 @@ class CuttingListWindow(QMainWindow):
                 if msg_box.exec() == QMessageBox.StandardButton.No:
                     return
 
-        # --- Generate Concrete Purchase Plan Sheet ---
-        if total_concrete_vol_m3 > 0:
-            add_concrete_plan_to_workbook(wb, foundation_vol_breakdown)
-
-        if proceed_with_optimization and splicing_ok:
-            cuts_by_diameter = {}
-            for bar in process_rebar_input(all_results):
-                dia = get_dia_code(bar['diameter'])
-                if dia not in cuts_by_diameter:
-                    cuts_by_diameter[dia] = {}
-
-                length = bar['cut_length']
-                quantity = bar['quantity']
-
-                if length in cuts_by_diameter[dia]:
-                    cuts_by_diameter[dia][length] += quantity
-                else:
-                    cuts_by_diameter[dia][length] = quantity
-            for key, value in cuts_by_diameter.items():
-                cuts_by_diameter[key] = [(q, l / 1000) for l, q in value.items()]
-
-            purchase_list, cutting_plan = find_optimized_cutting_plan(cuts_by_diameter, market_lengths)
-            wb = add_sheet_purchase_plan(wb, purchase_list)
-            wb = add_sheet_cutting_plan(wb, cutting_plan)
-
-        # --- Save and Open the Excel File ---
-        wb = delete_blank_worksheets(wb)
+        # --- Ask for the Save Path, then Build and Save in the Background ---
         save_path, _ = QFileDialog.getSaveFileName(
             self, 'Save Cutting List As', 'rebar_cutting_schedule.xlsx',
             'Excel Files (*.xlsx);;All Files (*)'
@@ -2681,47 +2985,67 @@ class CuttingListWindow(QMainWindow):
         if not save_path:
             return
 
-        try:
-            wb.save(save_path)
-        except PermissionError:
+        self.excel_progress = QProgressDialog('Generating the cutting list...', None, 0, 0, self)
+        self.excel_progress.setWindowTitle('Generating Excel')
+        self.excel_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.excel_progress.setMinimumDuration(0)
+        self.excel_progress.show()
+
+        # Keep reference to worker so it doesn't get garbage collected
+        self.excel_worker = ExcelWorker(save_path, cutting_lists, market_lengths,
+                                        foundation_vol_breakdown, proceed_with_optimization and splicing_ok)
+        # noinspection PyUnresolvedReferences
+        self.excel_worker.generated.connect(partial(self.on_excel_generated, self.excel_worker))
+        # generated is emitted from inside run(), so only release the worker once its thread has returned
+        # noinspection PyUnresolvedReferences
+        self.excel_worker.finished.connect(partial(self._release_excel_worker, self.excel_worker))
+        # The progress dialog can still be dismissed with Esc, so block a second run until this one is done
+        self.generate_button.setEnabled(False)
+        self.excel_worker.start()
+
+    def _release_excel_worker(self, worker: ExcelWorker) -> None:
+        """
+        Deletes an Excel worker after its thread has finished.
+
+        Args:
+            worker: The finished worker; the reference is only dropped if no newer run replaced it.
+        """
+        worker.deleteLater()
+        if self.excel_worker is worker:
+            self.excel_worker = None
+            self.generate_button.setEnabled(True)
+
+    def on_excel_generated(self, worker: ExcelWorker, success: bool, result: str) -> None:
+        """
+        Handles the end of the background Excel generation.
+
+        Args:
+            worker: The worker that generated the workbook.
+            success: Whether the workbook was written and saved.
+            result: The saved file path, or the error message.
+        """
+        self.excel_progress.close()
+        self.excel_progress.deleteLater()
+        self.excel_progress = None
+        save_path = worker.save_path
+
+        if not success:
             err_box = QMessageBox(self)
             err_box.setIcon(QMessageBox.Icon.Critical)
             err_box.setWindowTitle('Save Error')
             err_box.setText(f'Could not save the file to {os.path.basename(save_path)}.')
-            err_box.setInformativeText('Please ensure the file is not already open in another program.')
+            err_box.setInformativeText(result)
             err_box.exec()
             return
 
-        try:
-            if sys.platform == 'win32':
-                os.startfile(save_path)
-            elif sys.platform == 'darwin':
-                subprocess.call(['open', save_path])
-            else:
-                subprocess.call(['xdg-open', save_path])
-        except Exception as e:
-            print(f'Could not open file automatically: {e}')
+        # Hand the file to the default viewer without waiting for it to start
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(save_path)):
+            log.warning('Could not open file automatically: %s', save_path)
 
-        # Refactor the final prompt
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle('Generation Complete')
-        msg_box.setText('The cutting list has been generated and saved.')
-        msg_box.setInformativeText('What would you like to do next?')
-        msg_box.setIcon(QMessageBox.Icon.Question)
-
-        # Keep the existing button setup, we will style them via QSS
-        start_over_btn = msg_box.addButton('Start Over', QMessageBox.ButtonRole.ResetRole)
-        msg_box.addButton('Close Program', QMessageBox.ButtonRole.RejectRole)
-        msg_box.setDefaultButton(start_over_btn)
-
-        msg_box.exec()
-
-        if msg_box.clickedButton() == start_over_btn:
-            self.reset_application()
-        else:
-            self.close()
+        self.show_completion_prompt()
 
 if __name__ == '__main__':
+    configure_logging()
     sys.excepthook = global_exception_hook
     app = QApplication(sys.argv)
     wheel_event_filter = GlobalWheelEventFilter()
@@ -10,7 +10,7 @@ from app_cutting_list import CuttingListWindow
 from app_optimal_purchase import OptimalPurchaseWindow
 from app_timeline import TimelineWindow
 from constants import LOGO_MAP, VERSION
-from utils import load_stylesheet, resource_path, GlobalWheelEventFilter, HoverButton
+from utils import load_stylesheet, resource_path, GlobalWheelEventFilter, HoverButton, configure_logging
 
 
 class FadeOverlay(QWidget):
@@ -445,6 +445,7 @@ class LauncherWindow(QMainWindow):
         self._launch_app(TimelineWindow)
 
 if __name__ == '__main__':
+    configure_logging()
     app = QApplication(sys.argv)
 
     # Apply Global Filters and Styles
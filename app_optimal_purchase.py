@@ -1,20 +1,23 @@
+import logging
 import sys
 import os
-import subprocess
+from collections import Counter, defaultdict
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QStackedWidget, QLabel, QComboBox, QGridLayout, QFrame,
     QCheckBox, QScrollArea, QMessageBox, QFileDialog, QInputDialog, QPushButton, QDialog, QDialogButtonBox
 )
-from PyQt6.QtGui import QCursor, QIcon
-from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtGui import QCursor, QIcon, QDesktopServices
+from PyQt6.QtCore import Qt, QPoint, QUrl
 from openpyxl import Workbook
 from utils import (load_stylesheet, parse_nested_dict, global_exception_hook,
                    InfoPopup, HoverLabel, BlankSpinBox, HoverButton, resource_path,
-                   style_invalid_input, GlobalWheelEventFilter, BlankDoubleSpinBox)
+                   style_invalid_input, GlobalWheelEventFilter, BlankDoubleSpinBox, configure_logging)
 from rebar_optimizer import find_optimized_cutting_plan
 from constants import BAR_DIAMETERS, MARKET_LENGTHS, DEBUG_MODE, LOGO_MAP
-from excel_writer import add_sheet_purchase_plan, add_sheet_cutting_plan, delete_blank_worksheets
+from excel_writer import add_sheet_purchase_plan, add_sheet_cutting_plan, save_workbook
+
+log = logging.getLogger(__name__)
 
 class OptimalPurchaseWindow(QMainWindow):
     def __init__(self):
@@ -30,6 +33,7 @@ class OptimalPurchaseWindow(QMainWindow):
         self.market_lengths_checkboxes = {}
         self.cutting_lengths = {'Diameter': [], 'Cutting Length': [], 'Quantity': [], 'Rows': []}
         self.current_market_lengths = list(MARKET_LENGTHS)
+        self._market_length_m: dict[str, float] = {}  # Parsed value of each grid column label, e.g. '6m' -> 6.0
         self.cutting_rows_layout = None
         self.remove_cutting_button = None
         self.summary_labels = {}
@@ -37,6 +41,8 @@ class OptimalPurchaseWindow(QMainWindow):
         self.market_lengths_grid = None
         self.parsed_cutting_lengths = {}
         self.active_diameters = set(BAR_DIAMETERS) # Default to all
+        self._done_msg: QMessageBox | None = None  # Completion prompt, built on first use
+        self._done_start_over_btn = None
 
         self.info_popup = InfoPopup(self)
 
@@ -282,6 +288,7 @@ class OptimalPurchaseWindow(QMainWindow):
                 item.widget().deleteLater()
 
         self.market_lengths_checkboxes = {}
+        self._market_length_m = {length: float(length.replace('m', '')) for length in self.current_market_lengths}
 
         def create_cell(widget, is_header=False, is_alternate=False, x=0, y=0):
             cell = QFrame()
@@ -545,7 +552,7 @@ class OptimalPurchaseWindow(QMainWindow):
         required_diameters = self.get_used_diameters()
         market_lengths = {}
         for dia_code, lengths in self.market_lengths_checkboxes.items():
-            available_lengths = [float(l.replace('m', '')) for l, cb in lengths.items() if cb.isChecked()]
+            available_lengths = [self._market_length_m[l] for l, cb in lengths.items() if cb.isChecked()]
             if available_lengths:
                 market_lengths[dia_code] = available_lengths
 
@@ -699,6 +706,30 @@ class OptimalPurchaseWindow(QMainWindow):
             # Otherwise, let the default event handling proceed
             super().keyPressEvent(event)
 
+    def show_completion_prompt(self) -> None:
+        """
+        Asks whether to start over or close after a file was generated.
+        The message box is built on first use and reused afterwards.
+        """
+        if self._done_msg is None:
+            self._done_msg = QMessageBox(self)
+            self._done_msg.setWindowTitle('Generation Complete')
+            self._done_msg.setText('The purchase plan has been generated and saved.')
+            self._done_msg.setInformativeText('What would you like to do next?')
+            self._done_msg.setIcon(QMessageBox.Icon.Question)
+
+            # Keep the existing button setup, we will style them via QSS
+            self._done_start_over_btn = self._done_msg.addButton('Start Over', QMessageBox.ButtonRole.ResetRole)
+            self._done_msg.addButton('Close Program', QMessageBox.ButtonRole.RejectRole)
+        self._done_msg.setDefaultButton(self._done_start_over_btn)
+
+        self._done_msg.exec()
+
+        if self._done_msg.clickedButton() == self._done_start_over_btn:
+            self.reset_application()
+        else:
+            self.close()
+
     def generate_excel(self):
         self.parsed_cutting_lengths = parse_nested_dict(self.cutting_lengths)
         if not DEBUG_MODE and (not self.validate_market_length_page()):
@@ -706,30 +737,26 @@ class OptimalPurchaseWindow(QMainWindow):
 
         market_lengths = {}
         for dia_code, lengths in self.market_lengths_checkboxes.items():
-            available_lengths = [float(l.replace('m', '')) for l, cb in lengths.items() if cb.isChecked()]
+            available_lengths = [self._market_length_m[l] for l, cb in lengths.items() if cb.isChecked()]
             if available_lengths:
                 market_lengths[dia_code] = available_lengths
 
-        wb = Workbook()
-        cuts_by_diameter = {}
+        # Rows are streamed to disk as they are appended; the workbook also starts without a default sheet
+        wb = Workbook(write_only=True)
+        # Total quantity per cut length, per diameter
+        cuts_by_diameter = defaultdict(Counter)
         for dia, length, quantity in zip(self.parsed_cutting_lengths['Diameter'],
                                          self.parsed_cutting_lengths['Cutting Length'],
                                          self.parsed_cutting_lengths['Quantity']):
-            if dia not in cuts_by_diameter:
-                cuts_by_diameter[dia] = {length: quantity}
-            elif length in cuts_by_diameter[dia]:
-                cuts_by_diameter[dia][length] += quantity
-            else:
-                cuts_by_diameter[dia][length] = quantity
-        for key, value in cuts_by_diameter.items():
-            cuts_by_diameter[key] = [(q, l / 1000) for l, q in value.items()]
+            cuts_by_diameter[dia][length] += quantity
+        cuts_by_diameter = {dia: [(q, l / 1000) for l, q in cuts.items()]
+                            for dia, cuts in cuts_by_diameter.items()}
 
         purchase_list, cutting_plan = find_optimized_cutting_plan(cuts_by_diameter, market_lengths)
         wb = add_sheet_purchase_plan(wb, purchase_list)
         wb = add_sheet_cutting_plan(wb, cutting_plan)
 
         # --- 4. Save and Open the Excel File ---
-        wb = delete_blank_worksheets(wb)
         save_path, _ = QFileDialog.getSaveFileName(
             self, 'Save Cutting List As', 'rebar_purchase_plan.xlsx',
             'Excel Files (*.xlsx);;All Files (*)'
@@ -738,7 +765,7 @@ class OptimalPurchaseWindow(QMainWindow):
             return
 
         try:
-            wb.save(save_path)
+            save_workbook(wb, save_path)
         except PermissionError:
             err_box = QMessageBox(self)
             err_box.setIcon(QMessageBox.Icon.Critical)
@@ -748,37 +775,15 @@ class OptimalPurchaseWindow(QMainWindow):
             err_box.exec()
             return
 
-        try:
-            if sys.platform == 'win32':
-                os.startfile(save_path)
-            elif sys.platform == 'darwin':
-                subprocess.call(['open', save_path])
-            else:
-                subprocess.call(['xdg-open', save_path])
-        except Exception as e:
-            print(f'Could not open file automatically: {e}')
-
-        # Refactor the final prompt
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle('Generation Complete')
-        msg_box.setText('The purchase plan has been generated and saved.')
-        msg_box.setInformativeText('What would you like to do next?')
-        msg_box.setIcon(QMessageBox.Icon.Question)
-
-        # Keep the existing button setup, we will style them via QSS
-        start_over_btn = msg_box.addButton('Start Over', QMessageBox.ButtonRole.ResetRole)
-        msg_box.addButton('Close Program', QMessageBox.ButtonRole.RejectRole)
-        msg_box.setDefaultButton(start_over_btn)
+        # Hand the file to the default viewer without waiting for it to start
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(save_path)):
+            log.warning('Could not open file automatically: %s', save_path)
 
-        msg_box.exec()
-
-        if msg_box.clickedButton() == start_over_btn:
-            self.reset_application()
-        else:
-            self.close()
+        self.show_completion_prompt()
         return
 
 if __name__ == '__main__':
+    configure_logging()
     sys.excepthook = global_exception_hook
     app = QApplication(sys.argv)
     wheel_event_filter = GlobalWheelEventFilter()
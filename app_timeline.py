@@ -17,7 +17,7 @@ from PyQt6.QtCore import Qt, QDate, QThread, pyqtSignal, QSize
 from excel_writer import create_schedule_sheet
 from utils import (
     load_stylesheet, global_exception_hook,
-    HoverButton, resource_path, GlobalWheelEventFilter, BlankDoubleSpinBox
+    HoverButton, resource_path, GlobalWheelEventFilter, BlankDoubleSpinBox, configure_logging
 )
 from constants import LOGO_MAP, DEBUG_MODE
 
@@ -1034,6 +1034,7 @@ class TimelineWindow(QMainWindow):
 
 
 if __name__ == '__main__':
+    configure_logging()
     sys.excepthook = global_exception_hook
     app = QApplication(sys.argv)
     app.installEventFilter(GlobalWheelEventFilter())
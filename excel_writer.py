@@ -11,16 +11,22 @@ from openpyxl.drawing.xdr import XDRPositiveSize2D, XDRPoint2D
 from openpyxl.utils.units import pixels_to_EMU, cm_to_EMU
 from PIL import Image as PILImage
 from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.drawing.image import Image
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import coordinate_to_tuple
 from openpyxl.comments import Comment
 from typing import Any
-import collections
+import logging
+import os
 from utils import get_dia_code, resource_path
 from rebar_optimizer import find_optimized_cutting_plan
 from datetime import timedelta
 
+log = logging.getLogger(__name__)
+
 # 1. Save the original to_tree method to preserve standard functionality
 _original_to_tree = ChartSpace.to_tree
 
@@ -49,6 +55,110 @@ def _patched_to_tree(self, tagname=None, idx=None, namespace=None):
 # 4. Apply the patch to the class
 ChartSpace.to_tree = _patched_to_tree
 
+# --- Shared Sheet Styles ---
+# Built once at import and reused by every sheet writer instead of being rebuilt per call or per cell.
+_WHITE_SIDE = Side(style='thin', color='FFFFFF')
+_BLACK_SIDE = Side(style='thin', color='404040')
+_THICK_BLACK_SIDE = Side(style='thick', color='404040')
+_TITLE_FONT = Font(name='Calibri', size=16, bold=True)
+_HEADER_FONT = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
+_WARNING_FONT = Font(color='FF0000')
+# Flags the rows of a diameter whose plan came from a time-limited solve over generated patterns
+_NOT_PROVEN_COMMENT = 'Best plan found within the solver time limit.\nA cheaper or less wasteful plan may exist.'
+_HEADER_FILL = PatternFill(start_color='404040', end_color='404040', fill_type='solid')
+_ALTER_ROW_FILL = PatternFill(start_color='F3F3F3', end_color='F3F3F3', fill_type='solid')
+_TITLE_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+_CELL_ALIGNMENT = Alignment(horizontal='center', vertical='center', wrap_text=True)
+_LEFT_ALIGNMENT = Alignment(horizontal='left', vertical='center', wrap_text=True)
+_CELL_BORDER = Border(left=_BLACK_SIDE, right=_BLACK_SIDE, top=_BLACK_SIDE, bottom=_BLACK_SIDE)
+_HEADER_BORDER = Border(left=_WHITE_SIDE, right=_WHITE_SIDE, top=_BLACK_SIDE, bottom=_BLACK_SIDE)
+_HEADER_LEFT_BORDER = Border(left=_BLACK_SIDE, top=_BLACK_SIDE, right=_WHITE_SIDE, bottom=_BLACK_SIDE)
+_HEADER_RIGHT_BORDER = Border(left=_WHITE_SIDE, top=_BLACK_SIDE, right=_BLACK_SIDE, bottom=_BLACK_SIDE)
+_DIMENSION_BORDER = Border(left=_THICK_BLACK_SIDE, bottom=_BLACK_SIDE, top=_BLACK_SIDE, right=_BLACK_SIDE)
+
+_SAVE_BUFFER_SIZE = 2 * 1024 * 1024  # bytes
+
+# Named styles of the rebar sheet data cells: name -> (border, alignment, number format); each also gets an ' Alt'
+# variant for the shaded alternate rows
+_TABLE_STYLES = {
+    'Table Cell': (_CELL_BORDER, _CELL_ALIGNMENT, 'General'),
+    'Table Count': (_CELL_BORDER, _CELL_ALIGNMENT, '#,##0'),
+    'Table Length': (_CELL_BORDER, _CELL_ALIGNMENT, '#,##0" mm"'),
+    'Table Dimension': (_DIMENSION_BORDER, _CELL_ALIGNMENT, '#,##0" mm"'),
+    'Table Text': (_CELL_BORDER, _LEFT_ALIGNMENT, 'General'),
+}
+
+
+def _styled_cell(ws, value=None, font: Font = None, fill: PatternFill = None, border: Border = None,
+                 alignment: Alignment = None, number_format: str = None) -> Cell:
+    """
+    Creates a styled cell to be written with ws.append(), as needed by write-only worksheets.
+
+    Args:
+        ws: The worksheet the cell will be appended to.
+        value: The cell value.
+        font, fill, border, alignment, number_format: Styles to apply; None leaves the default.
+
+    Returns:
+        The unattached cell.
+    """
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if border is not None:
+        cell.border = border
+    if alignment is not None:
+        cell.alignment = alignment
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+
+def _add_table_styles(wb: Workbook) -> None:
+    """
+    Registers the rebar sheet data cell styles on the workbook, once.
+    Assigning a named style sets all of a cell's formatting in one lookup instead of one per attribute.
+
+    Args:
+        wb: The workbook the rebar sheets are written to.
+    """
+    for name, (border, alignment, number_format) in _TABLE_STYLES.items():
+        for style_name, fill in ((name, PatternFill()), (f'{name} Alt', _ALTER_ROW_FILL)):
+            if style_name not in wb.named_styles:
+                wb.add_named_style(NamedStyle(name=style_name, font=DEFAULT_FONT, fill=fill, border=border,
+                                              alignment=alignment, number_format=number_format))
+
+def _table_cell(ws, value, style_name: str) -> Cell:
+    """Creates a cell with one of the _TABLE_STYLES named styles, to be written with ws.append()."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style_name
+    return cell
+
+def _append_title_and_headers(ws, title: str, headers: list[str]) -> None:
+    """
+    Appends the merged title row and the dark header row shared by the rebar sheets.
+
+    Column widths must already be set, since a write-only sheet writes them out with its first row.
+
+    Args:
+        ws: The worksheet, still empty.
+        title: The sheet title shown in row 1.
+        headers: The column headers for row 2.
+    """
+    ws.merged_cells.add(get_range(1, 1, 1, len(headers)))
+    ws.row_dimensions[1].height = 30
+    ws.append([_styled_cell(ws, title, font=_TITLE_FONT, alignment=_TITLE_ALIGNMENT)])
+
+    header_cells = [_styled_cell(ws, header_text, font=_HEADER_FONT, fill=_HEADER_FILL, border=_HEADER_BORDER,
+                                 alignment=_CELL_ALIGNMENT) for header_text in headers]
+    # Apply black border to left and right outer edges
+    header_cells[0].border = _HEADER_LEFT_BORDER
+    header_cells[-1].border = _HEADER_RIGHT_BORDER
+    ws.row_dimensions[2].height = 25
+    ws.append(header_cells)
+
 def excel_col_width_to_px(width: float | None) -> int:
     """
     Approximates the conversion of an openpyxl column width to pixels.
@@ -87,8 +197,7 @@ def center_img(img: Image, cell_ref: str, ws: Worksheet) -> Image:
     Returns:
         The Image object with its anchor property set.
     """
-    cell = ws[cell_ref]
-    row, col = cell.row, cell.column
+    row, col = coordinate_to_tuple(cell_ref)  # Parsed from the reference so write-only sheets work too
 
     # --- cumulative Y offset ---
     row_heights = [
@@ -157,69 +266,60 @@ def get_canonical_representation(bar: dict[str, Any]) -> tuple[str, tuple]:
         key = tuple(dims.get(k, 0) for k in sorted(dims.keys()))
         return shape, key
 
+def _iter_bars(rebar_config: dict[str, Any]):
+    """
+    Yields (bar type, bar) for every bar of one compiled foundation, without copying the bar dicts.
+    """
+    for bar_type, data in rebar_config.items():
+        if bar_type in ['Top Bar', 'Bottom Bar', 'Perimeter Bar']:
+            if 'bar_in_x_direction' in data:
+                yield bar_type, data['bar_in_x_direction']
+            if 'bar_in_y_direction' in data:
+                yield bar_type, data['bar_in_y_direction']
+        elif bar_type == 'Vertical Bar':
+            yield bar_type, data
+        elif bar_type == 'Stirrups':
+            for stirrup in data:
+                yield bar_type, stirrup
+
 def process_rebar_input(rebar_config: dict[str, Any] | list[dict[str, Any]]) -> list[dict[str, Any]]:
     """
     Flattens the input dictionary and groups identical bars by shape, dimensions, AND diameter.
     """
-    flat_list = []
     if isinstance(rebar_config, dict):
-        for bar_type, data in rebar_config.items():
-            if bar_type in ['Top Bar', 'Bottom Bar', 'Perimeter Bar']:
-                if 'bar_in_x_direction' in data:
-                    flat_list.append({'bar_type': bar_type, **data['bar_in_x_direction']})
-                if 'bar_in_y_direction' in data:
-                    flat_list.append({'bar_type': bar_type, **data['bar_in_y_direction']})
-            elif bar_type == 'Vertical Bar':
-                flat_list.append({'bar_type': bar_type, **data})
-            elif bar_type == 'Stirrups':
-                for stirrup in data:
-                    flat_list.append({'bar_type': bar_type, **stirrup})
+        rebar_configs = [rebar_config]
     elif isinstance(rebar_config, list):
-        for rebar_config_instance in rebar_config:
-            for bar_type, data in rebar_config_instance.items():
-                if bar_type in ['Top Bar', 'Bottom Bar', 'Perimeter Bar']:
-                    if 'bar_in_x_direction' in data:
-                        flat_list.append({'bar_type': bar_type, **data['bar_in_x_direction']})
-                    if 'bar_in_y_direction' in data:
-                        flat_list.append({'bar_type': bar_type, **data['bar_in_y_direction']})
-                elif bar_type == 'Vertical Bar':
-                    flat_list.append({'bar_type': bar_type, **data})
-                elif bar_type == 'Stirrups':
-                    for stirrup in data:
-                        flat_list.append({'bar_type': bar_type, **stirrup})
+        rebar_configs = rebar_config
     else:
         raise TypeError(f'Invalid rebar_config type. Expected dict or list, got {type(rebar_config)}')
 
-    grouped_bars = collections.OrderedDict()
-    for bar in flat_list:
-        canonical_shape, dim_key = get_canonical_representation(bar)
-        group_key = (canonical_shape, bar['diameter'], dim_key)
-
-        if group_key not in grouped_bars:
-            grouped_bars[group_key] = {
-                'original_shape': bar['shape'],
-                'bar_types': {bar['bar_type']},
-                'quantity': 0,
-                'diameter': bar['diameter'],
-                'cut_length': bar['total_cut_length_mm'],
-                'shape_dimensions': bar['shape_dimensions']
-            }
-
-        grouped_bars[group_key]['quantity'] += bar['quantity']
-        grouped_bars[group_key]['bar_types'].add(bar['bar_type'])
-
-    processed_list = []
-    for data in grouped_bars.values():
-        processed_list.append({
-            'shape': data['original_shape'],
-            'bar_type': ',\n'.join(sorted(list(data['bar_types']))),
-            'quantity': data['quantity'],
-            'diameter': data['diameter'],
-            'cut_length': data['cut_length'],
-            'shape_dimensions': data['shape_dimensions']
-        })
-
-    return processed_list
+    # Each group's output row is built once, from the first bar in it; later bars only add to it
+    grouped_bars = {}
+    bar_types = {}
+    for rebar_config_instance in rebar_configs:
+        for bar_type, bar in _iter_bars(rebar_config_instance):
+            canonical_shape, dim_key = get_canonical_representation(bar)
+            group_key = (canonical_shape, bar['diameter'], dim_key)
+
+            group = grouped_bars.get(group_key)
+            if group is None:
+                grouped_bars[group_key] = {
+                    'shape': bar['shape'],
+                    'bar_type': None,  # Joined from bar_types below
+                    'quantity': bar['quantity'],
+                    'diameter': bar['diameter'],
+                    'cut_length': bar['total_cut_length_mm'],
+                    'shape_dimensions': bar['shape_dimensions']
+                }
+                bar_types[group_key] = {bar_type}
+            else:
+                group['quantity'] += bar['quantity']
+                bar_types[group_key].add(bar_type)
+
+    for group_key, group in grouped_bars.items():
+        group['bar_type'] = ',\n'.join(sorted(bar_types[group_key]))
+
+    return list(grouped_bars.values())
 
 def create_excel_cutting_list(rebar_config: dict[str, Any],
                               cuts_by_diameter: dict,
@@ -399,164 +499,93 @@ def create_excel_cutting_list(rebar_config: dict[str, Any],
         add_sheet_purchase_plan(wb, purchase_list)
         add_sheet_cutting_plan(wb, cutting_plan)
     wb.save(output_filename)
-    print(f'Excel sheet {output_filename} has been created successfully.')
+    log.info('Excel sheet %s has been created successfully.', output_filename)
+
+def _flag_not_proven(cell: Cell) -> None:
+    """Marks the diameter cell of a row whose plan is not proven optimal."""
+    cell.font = _WARNING_FONT
+    cell.comment = Comment(_NOT_PROVEN_COMMENT, '✨rs_uy', height=100, width=200)
 
 def add_sheet_purchase_plan(wb, purchase_list) -> Workbook:
+    if not purchase_list:
+        return wb
     ws = wb.create_sheet('Rebar Purchase')
 
-    # --- Styles ---
-    white_side = Side(style='thin', color='FFFFFF')
-    black_side = Side(style='thin', color='404040')
-    title_font = Font(name='Calibri', size=16, bold=True)
-    header_font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
-    header_fill = PatternFill(start_color='404040', end_color='404040', fill_type='solid')
-    alter_row_fill = PatternFill(start_color='F3F3F3', end_color='F3F3F3', fill_type='solid')
-    cell_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    border = Border(left=black_side, right=black_side, top=black_side, bottom=black_side)
-    header_border = Border(left=white_side, right=white_side, top=black_side, bottom=black_side)
-
     # --- Static and Dynamic Headers ---
-    headers = purchase_list[0].keys()
-
-    # --- Title ---
-    ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=len(headers))
-    title_cell = ws['A1']
-    title_cell.value = 'Purchase Qty by Length & Diameter'
-    title_cell.font = title_font
-    title_cell.alignment = Alignment(horizontal='center', vertical='center')
-    ws.row_dimensions[1].height = 30
-
-    # --- Headers ---
-    for col_num, header_text in enumerate(headers, 1):
-        cell = ws.cell(row=2, column=col_num, value=header_text)
-        cell.font = header_font
-        cell.alignment = cell_alignment
-        cell.fill = header_fill
-        cell.border = header_border
-
-    # Apply black border to left and right outer edges
-    cell = ws.cell(row=2, column=1)
-    cell.border = Border(left=black_side, top=black_side, right=white_side, bottom=black_side)
-    cell = ws.cell(row=2, column=len(headers))
-    cell.border = Border(left=white_side, top=black_side, right=black_side, bottom=black_side)
+    headers = [key for key in purchase_list[0] if key != 'Proven Optimal']
 
     # --- Column Widths ---
     ws.column_dimensions['A'].width = 20
-    ws.row_dimensions[2].height = 25
 
-    for item in purchase_list:
-        ws.append(list(item.values()))
+    # --- Title and Headers ---
+    _append_title_and_headers(ws, 'Purchase Qty by Length & Diameter', headers)
 
-    for current_row in range(3, 3 + len(purchase_list)):
+    _add_table_styles(wb)
+    column_styles = ['Table Cell'] + ['Table Count'] * (len(headers) - 1)
+    for current_row, item in enumerate(purchase_list, 3):
         ws.row_dimensions[current_row].height = 25
-
-        for col_num in range(1, len(headers) + 1):
-            cell = ws.cell(row=current_row, column=col_num)
-
-            if cell.value == 0:
-                cell.value = ''
-
-            # Alternating BG Color Fill
-            if current_row % 2 == 0:
-                cell.fill = alter_row_fill
-            cell.alignment = cell_alignment
-
-            # Borders
-            cell.border = border
-
-            # Number Format
-            if col_num >= 2:
-                cell.number_format = '#,##0'
+        # Alternating BG Color Fill
+        style_suffix = ' Alt' if current_row % 2 == 0 else ''
+        row_cells = [
+            _table_cell(ws, '' if item[key] == 0 else item[key], style_name + style_suffix)
+            for key, style_name in zip(headers, column_styles)
+        ]
+        if not item.get('Proven Optimal', True):
+            _flag_not_proven(row_cells[0])
+        ws.append(row_cells)
     return wb
 
 def add_sheet_cutting_plan(wb, cutting_plan) -> Workbook:
+    if not cutting_plan:
+        return wb
     ws = wb.create_sheet('Cutting Plan')
 
-    # --- Styles ---
-    white_side = Side(style='thin', color='FFFFFF')
-    black_side = Side(style='thin', color='404040')
-    title_font = Font(name='Calibri', size=16, bold=True)
-    header_font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
-    header_fill = PatternFill(start_color='404040', end_color='404040', fill_type='solid')
-    alter_row_fill = PatternFill(start_color='F3F3F3', end_color='F3F3F3', fill_type='solid')
-    cell_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    border = Border(left=black_side, right=black_side, top=black_side, bottom=black_side)
-    header_border = Border(left=white_side, right=white_side, top=black_side, bottom=black_side)
-
     # --- Static and Dynamic Headers ---
     headers = ['Diameter', 'Quantity', 'Length', 'Cuts', 'Detailed Instructions']
 
-    # --- Title ---
-    ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=len(headers))
-    title_cell = ws['A1']
-    title_cell.value = 'Cutting Plan'
-    title_cell.font = title_font
-    title_cell.alignment = Alignment(horizontal='center', vertical='center')
-    ws.row_dimensions[1].height = 30
-
-    # --- Headers ---
-    for col_num, header_text in enumerate(headers, 1):
-        cell = ws.cell(row=2, column=col_num, value=header_text)
-        cell.font = header_font
-        cell.alignment = cell_alignment
-        cell.fill = header_fill
-        cell.border = header_border
-
-    # Apply black border to left and right outer edges
-    cell = ws.cell(row=2, column=1)
-    cell.border = Border(left=black_side, top=black_side, right=white_side, bottom=black_side)
-    cell = ws.cell(row=2, column=len(headers))
-    cell.border = Border(left=white_side, top=black_side, right=black_side, bottom=black_side)
-
     # --- Column Widths ---
     ws.column_dimensions['E'].width = 70
     ws.column_dimensions['D'].width = 15
-    ws.row_dimensions[2].height = 25
-    col_map = {i:header for i, header in enumerate(headers, 1)}
-    for current_row in range(3, 3 + len(cutting_plan)):
+
+    # --- Title and Headers ---
+    _append_title_and_headers(ws, 'Cutting Plan', headers)
+
+    _add_table_styles(wb)
+    column_styles = ['Table Cell'] * 4 + ['Table Text']  # Detailed Instructions are left aligned
+
+    for current_row, data in enumerate(cutting_plan, 3):
         ws.row_dimensions[current_row].height = 50
 
-        for col_num in range(1, len(headers) + 1):
-            data = cutting_plan[current_row - 3]
-            if col_num < 3:
-                cell = ws.cell(row=current_row, column=col_num, value=data[col_map[col_num]])
-            elif col_map[col_num] == 'Length':
-                cell = ws.cell(row=current_row, column=col_num, value=f'{data[col_map[col_num]]}m')
-            elif col_map[col_num] == 'Cuts':
-                # get cuts
-                cuts = '\n'.join(data['Cut Per RSB'])
-                cell = ws.cell(row=current_row, column=col_num, value=cuts)
-            else: # col_num == 'Detailed Instructions':
-                # get detailed instructions
-                qty = data['Quantity']
-                length = data['Length']
-                dia = data['Diameter']
-                cuts = [cut.replace('x', '×') for cut in data['Cut Per RSB']]
-                # Cut each of the 4 pcs of 13.5m Ø10 bars into 4×2.095m and 3×1.695m lengths.
-                if len(cuts) > 2:
-                    cuts = cuts[:-1] + ['and ' + cuts[-1]]
-                    cuts = ', '.join(cuts)
-                elif len(cuts) == 2:
-                    cuts = ' and '.join(cuts)
-                else:
-                    cuts = cuts[0]
+        # get detailed instructions
+        qty = data['Quantity']
+        length = data['Length']
+        dia = data['Diameter']
+        cuts = [cut.replace('x', '×') for cut in data['Cut Per RSB']]
+        # Cut each of the 4 pcs of 13.5m Ø10 bars into 4×2.095m and 3×1.695m lengths.
+        if len(cuts) > 2:
+            cuts = cuts[:-1] + ['and ' + cuts[-1]]
+            cuts = ', '.join(cuts)
+        elif len(cuts) == 2:
+            cuts = ' and '.join(cuts)
+        else:
+            cuts = cuts[0]
 
-                if qty > 1:
-                    value = f'  Cut each of the {qty}pcs of {length}m RSB ({dia}) into {cuts} lengths.'
-                else:
-                    value = f'  Cut 1pc of {length}m RSB ({dia}) into {cuts} lengths.'
-                cell = ws.cell(row=current_row, column=col_num, value=value)
+        if qty > 1:
+            instructions = f'  Cut each of the {qty}pcs of {length}m RSB ({dia}) into {cuts} lengths.'
+        else:
+            instructions = f'  Cut 1pc of {length}m RSB ({dia}) into {cuts} lengths.'
 
-            # Alternating BG Color Fill
-            if current_row % 2 == 0:
-                cell.fill = alter_row_fill
-            if col_num == 5:
-                cell.alignment = Alignment(horizontal='left', vertical='center', wrap_text=True)
-            else:
-                cell.alignment = cell_alignment
+        values = [dia, qty, f'{length}m', '\n'.join(data['Cut Per RSB']), instructions]
 
-            # Borders
-            cell.border = border
+        # Alternating BG Color Fill
+        style_suffix = ' Alt' if current_row % 2 == 0 else ''
+        row_cells = [
+            _table_cell(ws, value, style_name + style_suffix)
+            for value, style_name in zip(values, column_styles)
+        ]
+        if not data.get('Proven Optimal', True):
+            _flag_not_proven(row_cells[0])
+        ws.append(row_cells)
     return wb
 
 def add_sheet_cutting_list(title: str, rebar_config: list[dict[str, Any]],
@@ -564,61 +593,27 @@ def add_sheet_cutting_list(title: str, rebar_config: list[dict[str, Any]],
     """
     Generates a formatted Excel rebar cutting list from a rebar configuration dictionary.
     """
-    ws = wb.create_sheet(f'{title} Cutting List')
     proceed_purchase_plan = True
+    # Write-only workbooks start without sheets, so a foundation without rebars simply adds none
+    if not rebar_config:
+        return wb, proceed_purchase_plan
+    ws = wb.create_sheet(f'{title} Cutting List')
 
-    max_legs = 0
-    if rebar_config:
-        max_legs = max(len(bar['shape_dimensions']) for bar in rebar_config)
+    max_legs = max(len(bar['shape_dimensions']) for bar in rebar_config)
 
     # This list comprehension is creating the dictionary keys 'A', 'B', etc., which is fine.
     dimension_headers = [chr(ord('A') + i) for i in range(max_legs)]
 
-    # --- Styles ---
-    white_side = Side(style='thin', color='FFFFFF')
-    black_side = Side(style='thin', color='404040')
-    thick_black_side = Side(style='thick', color='404040')
-    title_font = Font(name='Calibri', size=16, bold=True)
-    header_font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
-    header_fill = PatternFill(start_color='404040', end_color='404040', fill_type='solid')
-    alter_row_fill = PatternFill(start_color='F3F3F3', end_color='F3F3F3', fill_type='solid')
-    cell_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    border = Border(left=black_side, right=black_side, top=black_side, bottom=black_side)
-    header_border = Border(left=white_side, right=white_side, top=black_side, bottom=black_side)
-
     # --- Static and Dynamic Headers ---
     static_headers = ['Illustration', 'Bar Type', 'Diameter', 'Quantity', 'Cut Length']
     all_headers = static_headers + dimension_headers
 
-    # --- Title ---
-    ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=len(static_headers) + max_legs)
-    title_cell = ws['A1']
-    title_cell.value = f'{title} Rebar Cutting and Bending Schedule'
-    title_cell.font = title_font
-    title_cell.alignment = Alignment(horizontal='center', vertical='center')
-    ws.row_dimensions[1].height = 30
-
-    # --- Headers ---
-    for col_num, header_text in enumerate(all_headers, 1):
-        cell = ws.cell(row=2, column=col_num, value=header_text)
-        cell.font = header_font
-        cell.alignment = cell_alignment
-        cell.fill = header_fill
-        cell.border = header_border
-
-    # Apply black border to left and right outer edges
-    cell = ws.cell(row=2, column=1)
-    cell.border = Border(left=black_side, top=black_side, right=white_side, bottom=black_side)
-    cell = ws.cell(row=2, column=len(all_headers))
-    cell.border = Border(left=white_side, top=black_side, right=black_side, bottom=black_side)
-
     # --- Column Widths ---
     ws.column_dimensions['A'].width = 15
     ws.column_dimensions['B'].width = 25
     ws.column_dimensions['C'].width = 15
     ws.column_dimensions['D'].width = 10
     ws.column_dimensions['E'].width = 18
-    ws.row_dimensions[2].height = 25
 
     num_static_cols = len(static_headers)
     for i in range(max_legs):
@@ -627,6 +622,9 @@ def add_sheet_cutting_list(title: str, rebar_config: list[dict[str, Any]],
         col_letter = get_col_letter_cached(col_idx)
         ws.column_dimensions[col_letter].width = 12
 
+    # --- Title and Headers ---
+    _append_title_and_headers(ws, f'{title} Rebar Cutting and Bending Schedule', all_headers)
+
     shape_to_image_map = {
         'straight': 'straight.png',
         'U': 'u.png',
@@ -641,9 +639,12 @@ def add_sheet_cutting_list(title: str, rebar_config: list[dict[str, Any]],
     }
 
     # --- Data Rows ---
-    current_row = 3
-    for bar in rebar_config:
+    _add_table_styles(wb)
+    # Shape Dimensions start at column 6, behind a thick left border
+    column_styles = ['Table Cell'] * 4 + ['Table Length', 'Table Dimension'] + ['Table Length'] * (max_legs - 1)
+    for current_row, bar in enumerate(rebar_config, 3):
         ws.row_dimensions[current_row].height = 75
+        illustration = None
 
         # Use the map to get the correct image filename
         image_filename = shape_to_image_map.get(bar['shape'])
@@ -668,9 +669,9 @@ def add_sheet_cutting_list(title: str, rebar_config: list[dict[str, Any]],
                 ws.add_image(center_img(img, f'A{current_row}', ws))
 
             except FileNotFoundError:
-                ws.cell(row=current_row, column=1, value='No Image')
+                illustration = 'No Image'
         else:
-            ws.cell(row=current_row, column=1, value='No Image')
+            illustration = 'No Image'
 
         try:
             val = bar['diameter']
@@ -680,7 +681,7 @@ def add_sheet_cutting_list(title: str, rebar_config: list[dict[str, Any]],
             diameter_str = f'{bar['diameter']:.1f} mm'
 
         data_to_write = [
-            None,
+            illustration,
             bar['bar_type'],
             diameter_str,  # Use the newly formatted string
             bar['quantity'],
@@ -690,11 +691,11 @@ def add_sheet_cutting_list(title: str, rebar_config: list[dict[str, Any]],
         for letter in dimension_headers:
             data_to_write.append(bar['shape_dimensions'].get(letter, '-'))
 
-        for col_num, value in enumerate(data_to_write, 1):
-            if value is None:
-                cell = ws.cell(row=current_row, column=col_num)
-            else:
-                cell = ws.cell(row=current_row, column=col_num, value=value)
+        # Alternating BG Color Fill
+        style_suffix = ' Alt' if current_row % 2 == 0 else ''
+        row_cells = []
+        for col_num, (value, style_name) in enumerate(zip(data_to_write, column_styles), 1):
+            cell = _table_cell(ws, value, style_name + style_suffix)
 
             if col_num == 5:  # Cutlength
                 dia_code = get_dia_code(bar['diameter'])
@@ -703,35 +704,39 @@ def add_sheet_cutting_list(title: str, rebar_config: list[dict[str, Any]],
                     max_length = max(market_lengths[dia_code])
                     if value > max_length * 1000:
                         proceed_purchase_plan = False
-                        cell.font = Font(color='FF0000')
+                        cell.font = _WARNING_FONT
                         cell.comment = Comment(
                             f'Splicing required.\nCutting length exceeds available market length of {max_length:}m.',
                             '✨rs_uy', height=150, width=200)
                 else:
                     # This case handles when validation is bypassed or no lengths are available.
                     proceed_purchase_plan = False
-                    cell.font = Font(color='FF0000')
+                    cell.font = _WARNING_FONT
                     cell.comment = Comment(
                         f'No market length selected for this diameter ({dia_code}).\nCannot proceed with purchase plan analysis.',
                         '✨rs_uy', height=150, width=200)
 
-            # Alternating BG Color Fill
-            if current_row % 2 == 0:
-                cell.fill = alter_row_fill
-            cell.alignment = cell_alignment
+            row_cells.append(cell)
+        ws.append(row_cells)
 
-            # Borders
-            cell.border = border
-            if col_num == 6:  #Shape Dimensions
-                cell.border = Border(left=thick_black_side, bottom=black_side, top=black_side, right=black_side)
+    return wb, proceed_purchase_plan
 
-            # Number Format
-            if col_num >= 5:
-                cell.number_format = '#,##0" mm"'
+def requires_splicing(rebar_config: list[dict[str, Any]], market_lengths: dict[str, list]) -> bool:
+    """
+    Checks the cut lengths the same way add_sheet_cutting_list flags them, without writing a sheet.
 
-        current_row += 1
+    Args:
+        rebar_config: The grouped rebars of one foundation type, as from process_rebar_input().
+        market_lengths: Available market lengths (m) per diameter code.
 
-    return wb, proceed_purchase_plan
+    Returns:
+        True if a cut is longer than every market length of its diameter, or its diameter has none.
+    """
+    for bar in rebar_config:
+        lengths = market_lengths.get(get_dia_code(bar['diameter']))
+        if not lengths or round(bar['cut_length'], 1) > max(lengths) * 1000:
+            return True
+    return False
 
 def add_concrete_plan_to_workbook(wb: Workbook, breakdown: list):
     """
@@ -756,68 +761,55 @@ def add_concrete_plan_to_workbook(wb: Workbook, breakdown: list):
     thin_border = Border(left=Side(style='thin'), right=Side(style='thin'),
                          top=Side(style='thin'), bottom=Side(style='thin'))
 
+    # Column widths
+    ws.column_dimensions['A'].width = 20
+    ws.column_dimensions['B'].width = 20
+    ws.column_dimensions['C'].width = 20
+    ws.column_dimensions['D'].width = 20
+
+    def header_row(headers: list[str]) -> list:
+        cells = [_styled_cell(ws, h, font=header_font, fill=header_fill, border=header_border,
+                              alignment=center_align) for h in headers]
+        # Apply black border to left and right outer edges
+        cells[0].border = Border(left=black_side, top=black_side, right=white_side, bottom=black_side)
+        cells[-1].border = Border(left=white_side, top=black_side, right=black_side, bottom=black_side)
+        return cells
+
     # =========================================================
     # SECTION 1: VOLUME BREAKDOWN
     # =========================================================
-    ws.merge_cells('A1:D1')
-    cell = ws['A1']
-    cell.value = 'Concrete Volume Breakdown'
-    cell.font = title_font
-    cell.alignment = Alignment(horizontal='center', vertical='center')
+    ws.merged_cells.add('A1:D1')
     ws.row_dimensions[1].height = 30
+    ws.append([_styled_cell(ws, 'Concrete Volume Breakdown', font=title_font,
+                            alignment=Alignment(horizontal='center', vertical='center'))])
 
-    ws['A2'] = 'Foundation Type'
-    ws['B2'] = 'Vol. Per Footing'
-    ws['C2'] = 'Quantity'
-    ws['D2'] = 'Vol. Per Type'
     ws.row_dimensions[2].height = 25
-    for col in ['A', 'B', 'C', 'D']:
-        c = ws[f'{col}2']
-        c.font = header_font
-        c.fill = header_fill
-        c.alignment = center_align
-        c.border = header_border
-
-    # Apply black border to left and right outer edges
-    cell = ws.cell(row=2, column=1)
-    cell.border = Border(left=black_side, top=black_side, right=white_side, bottom=black_side)
-    cell = ws.cell(row=2, column=4)
-    cell.border = Border(left=white_side, top=black_side, right=black_side, bottom=black_side)
+    ws.append(header_row(['Foundation Type', 'Vol. Per Footing', 'Quantity', 'Vol. Per Type']))
 
     row_idx = 3
     for name, vol, n_footing in breakdown:
         vol_per_footing = vol / n_footing
-        ws[f'A{row_idx}'] = name
-        ws[f'B{row_idx}'] = vol_per_footing
-        ws[f'C{row_idx}'] = n_footing
-        ws[f'D{row_idx}'] = f'=B{row_idx}*C{row_idx}'
-
-        ws[f'B{row_idx}'].number_format = f'#,##0.00" m³"'
-        ws[f'D{row_idx}'].number_format = f'#,##0.00" m³"'
-        ws[f'A{row_idx}'].border = thin_border
-        ws[f'B{row_idx}'].border = thin_border
-        ws[f'C{row_idx}'].border = thin_border
-        ws[f'D{row_idx}'].border = thin_border
-        if row_idx %2==0:
-            ws[f'A{row_idx}'].fill = alter_row_fill
-            ws[f'B{row_idx}'].fill = alter_row_fill
-            ws[f'C{row_idx}'].fill = alter_row_fill
-            ws[f'D{row_idx}'].fill = alter_row_fill
+        fill = alter_row_fill if row_idx % 2 == 0 else None
+        ws.append([
+            _styled_cell(ws, name, fill=fill, border=thin_border),
+            _styled_cell(ws, vol_per_footing, fill=fill, border=thin_border, number_format='#,##0.00" m³"'),
+            _styled_cell(ws, n_footing, fill=fill, border=thin_border),
+            _styled_cell(ws, f'=B{row_idx}*C{row_idx}', fill=fill, border=thin_border,
+                         number_format='#,##0.00" m³"'),
+        ])
         row_idx += 1
 
     # Total Row
     total_vol_row = row_idx
-    ws.merge_cells(f'A{row_idx}:C{row_idx}')
-    ws[f'A{total_vol_row}'] = 'Total Volume'
-    ws[f'D{total_vol_row}'].value = f'=sum(D3:D{total_vol_row-1})'
-    ws[f'A{total_vol_row}'].font = Font(bold=True)
-    ws[f'D{total_vol_row}'].font = Font(bold=True)
-    ws[f'A{total_vol_row}'].border = thin_border
-    ws[f'B{total_vol_row}'].border = thin_border
-    ws[f'C{total_vol_row}'].border = thin_border
-    ws[f'D{total_vol_row}'].border = thin_border
-    ws[f'A{total_vol_row}'].alignment = Alignment(horizontal='right')
-    ws[f'D{total_vol_row}'].number_format = f'#,##0.00" m³"'
+    ws.merged_cells.add(f'A{total_vol_row}:C{total_vol_row}')
+    ws.append([
+        _styled_cell(ws, 'Total Volume', font=Font(bold=True), border=thin_border,
+                     alignment=Alignment(horizontal='right')),
+        _styled_cell(ws, border=thin_border),
+        _styled_cell(ws, border=thin_border),
+        _styled_cell(ws, f'=sum(D3:D{total_vol_row-1})', font=Font(bold=True), border=thin_border,
+                     number_format='#,##0.00" m³"'),
+    ])
 
     # Store reference to total volume cell (e.g., 'B10')
     ref_total_vol = f'D{total_vol_row}'
@@ -826,13 +818,12 @@ def add_concrete_plan_to_workbook(wb: Workbook, breakdown: list):
     # SECTION 2: EDITABLE MIX PARAMETERS
     # =========================================================
     param_start_row = total_vol_row + 2
+    ws.append([])
 
-    ws.merge_cells(f'A{param_start_row}:B{param_start_row}')
-    cell = ws[f'A{param_start_row}']
-    cell.value = 'Mix Design Parameters'
-    cell.font = title_font
-    cell.alignment = Alignment(horizontal='center', vertical='center')
+    ws.merged_cells.add(f'A{param_start_row}:B{param_start_row}')
     ws.row_dimensions[param_start_row].height = 30
+    ws.append([_styled_cell(ws, 'Mix Design Parameters', font=title_font,
+                            alignment=Alignment(horizontal='center', vertical='center'))])
 
     # Parameter Labels and Default Values
     # (Label, Default Value, Key for reference)
@@ -846,26 +837,20 @@ def add_concrete_plan_to_workbook(wb: Workbook, breakdown: list):
         ('Dry Volume Factor', 1.54, 'factor'),
         ('Wastage Multiplier', 1.05, 'waste'),
     ]
+    param_formats = {'Bag Weight': '#,##0" kg"', 'Cement Density': '#,##0" kg/m³"'}
 
     # Dictionary to store cell addresses for formulas
     refs = {}
 
     current_row = param_start_row + 1
     for label, val, key in params:
-        # Label
-        ws[f'A{current_row}'] = label
-        ws[f'A{current_row}'].border = thin_border
-
-        # Value (Input)
-        c = ws[f'B{current_row}']
-        c.value = val
-        c.alignment = center_align
-        c.border = thin_border
-        c.fill = input_fill  # Highlight as editable
-        if label == 'Bag Weight':
-            c.number_format = '#,##0" kg"'
-        elif label == 'Cement Density':
-            c.number_format = f'#,##0" kg/m³"'
+        ws.append([
+            # Label
+            _styled_cell(ws, label, border=thin_border),
+            # Value (Input), highlighted as editable
+            _styled_cell(ws, val, fill=input_fill, border=thin_border, alignment=center_align,
+                         number_format=param_formats.get(label)),
+        ])
         # Save address (e.g., 'B15')
         refs[key] = f'B{current_row}'
 
@@ -875,28 +860,15 @@ def add_concrete_plan_to_workbook(wb: Workbook, breakdown: list):
     # SECTION 3: MATERIAL ESTIMATION (FORMULAS)
     # =========================================================
     est_row = current_row + 1
-    ws.merge_cells(f'A{est_row}:B{est_row}')
-    cell = ws[f'A{est_row}']
-    cell.value = 'Materials for Purchase'
-    cell.font = title_font
-    cell.alignment = Alignment(horizontal='center', vertical='center')
+    ws.append([])
+
+    ws.merged_cells.add(f'A{est_row}:B{est_row}')
     ws.row_dimensions[est_row].height = 30
+    ws.append([_styled_cell(ws, 'Materials for Purchase', font=title_font,
+                            alignment=Alignment(horizontal='center', vertical='center'))])
 
-    headers = ['Material', 'Quantity']
     ws.row_dimensions[est_row + 1].height = 25
-    for i, h in enumerate(headers, 1):
-        c = ws.cell(row=est_row + 1, column=i)
-        c.value = h
-        c.font = header_font
-        c.fill = header_fill
-        c.alignment = center_align
-        c.border = header_border
-
-    # Apply black border to left and right outer edges
-    cell = ws.cell(row=est_row + 1, column=1)
-    cell.border = Border(left=black_side, top=black_side, right=white_side, bottom=black_side)
-    cell = ws.cell(row=est_row + 1, column=2)
-    cell.border = Border(left=white_side, top=black_side, right=black_side, bottom=black_side)
+    ws.append(header_row(['Material', 'Quantity']))
 
     # --- FORMULA CONSTRUCTION ---
     # 1. Total Ratio Sum = (Rc + Rs + Rg)
@@ -938,54 +910,48 @@ def add_concrete_plan_to_workbook(wb: Workbook, breakdown: list):
 
     r = est_row + 2
     for mat, formula, unit, note in materials:
-        # Name
-        ws.cell(row=r, column=1, value=mat).border = thin_border
-
-        # Formula Cell
-        c = ws.cell(row=r, column=2)
-        c.value = formula  # Write the Excel formula string
-        c.number_format = f'#,##0.00" {unit}"'
-        c.alignment = center_align
-        c.border = thin_border
-
-        # Note
-        # ws.cell(row=r, column=3, value=note).border = thin_border
-
-        if r%2==0:
-            for i in range(len(headers)):
-                c = ws.cell(row=r, column=i + 1)
-                c.fill = alter_row_fill
+        fill = alter_row_fill if r % 2 == 0 else None
+        ws.append([
+            # Name
+            _styled_cell(ws, mat, fill=fill, border=thin_border),
+            # Formula Cell
+            _styled_cell(ws, formula, fill=fill, border=thin_border, alignment=center_align,
+                         number_format=f'#,##0.00" {unit}"'),
+            # Note
+            # _styled_cell(ws, note, border=thin_border),
+        ])
         r += 1
 
     # Add Footer Note
-    cell = ws.cell(row=r, column=1, value='Note: Modify values in yellow cells to update quantities automatically.')
-    cell.font = Font(name='Calibri', size=10, color='5D5D5D')
+    ws.append([_styled_cell(ws, 'Note: Modify values in yellow cells to update quantities automatically.',
+                            font=Font(name='Calibri', size=10, color='5D5D5D'))])
 
-    # Column widths
-    ws.column_dimensions['A'].width = 20
-    ws.column_dimensions['B'].width = 20
-    ws.column_dimensions['C'].width = 20
-    ws.column_dimensions['D'].width = 20
-
-def delete_blank_worksheets(wb: Workbook) -> Workbook:
+def save_workbook(wb: Workbook, save_path: str) -> None:
     """
-    Deletes all blank worksheets from an Excel workbook.
+    Saves the workbook through a large write buffer into a temporary file, then moves it onto the target.
+
+    The xlsx zip is written as many small chunks per XML part; a 2 MiB buffer coalesces them into few
+    disk writes, which matters most on slow or network drives. Writing beside the target and replacing it
+    at the end leaves an existing file untouched if anything fails on the way.
 
     Args:
         wb: the Excel workbook.
-    """
-    sheets_to_delete = []
-
-    for sheet in wb.worksheets:
-        # Check if the sheet contains any data
-        # max_row and max_column will be 1 if the sheet is empty
-        if sheet.max_row == 1 and sheet.max_column == 1 and sheet.cell(row=1, column=1).value is None:
-            sheets_to_delete.append(sheet)
-
-    for sheet in sheets_to_delete:
-        wb.remove(sheet)
+        save_path: the destination file path.
 
-    return wb
+    Raises:
+        PermissionError: if the destination cannot be written, e.g. it is open in another program.
+    """
+    tmp_path = save_path + '.part'
+    try:
+        with open(tmp_path, 'wb', buffering=_SAVE_BUFFER_SIZE) as f:
+            wb.save(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, save_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 @lru_cache(maxsize=256)
 def get_col_letter_cached(col_idx):
@@ -1756,8 +1722,8 @@ def create_input_actual_sheet(wb, data, _col_left_table, _row_top_table, rows_pe
         ws.add_image(img)
 
     except FileNotFoundError:
-        print(f'Could not find image at {img_path}')
+        log.warning('Could not find image at %s', img_path)
     except Exception as e:
-        print(f'Error adding timeline image: {e}')
+        log.warning('Error adding timeline image: %s', e)
 
     return ws
\ No newline at end of file
@@ -1,8 +1,24 @@
 import pulp
+import numpy as np
+from scipy.optimize import linprog
+from bisect import bisect_left, insort
+from collections import Counter
+from math import gcd, prod
 from typing import Any
+import logging
 import sys
 import os
 
+# Above this many candidate patterns per stock, patterns are generated by column generation instead of enumerated
+MAX_ENUMERATED_PATTERNS = 50_000
+MAX_PRICING_ROUNDS = 200
+# Seconds allowed for the integer solve over generated patterns; proving optimality there can take minutes
+GENERATED_PATTERNS_TIME_LIMIT = 10
+# Largest purchase, in units of the gcd of the stock lengths, for which the greedy shortcut builds its bound tables
+MAX_GREEDY_BOUND_UNITS = 100_000
+
+log = logging.getLogger(__name__)
+
 
 def mm(x_m: float) -> int:
     """
@@ -112,6 +128,242 @@ def build_patterns_all_stocks(piece_lengths: list[float], piece_qty: list[int],
 
     return patterns_by_stock
 
+def best_knapsack_pattern(weights: np.ndarray, values: np.ndarray, max_counts: np.ndarray,
+                          capacity: int) -> tuple[tuple, float]:
+    """
+    Solves the bounded knapsack used to price new patterns, vectorized over all capacities with NumPy.
+    Each piece count is split into binary chunks (1, 2, 4, ...) so the problem becomes a 0/1 knapsack.
+
+    Args:
+        weights: Integer weight of each piece (mm).
+        values: Value of one copy of each piece.
+        max_counts: Maximum copies of each piece.
+        capacity: Integer capacity (mm).
+
+    Returns:
+        The best counts tuple and its total value.
+    """
+    best = np.zeros(capacity + 1)
+    steps = []  # (piece index, copies, weight, taken mask over capacities >= weight) in the order they were applied
+    bounds = np.minimum(max_counts, np.floor_divide(capacity, weights))
+    for i, (w, v, ub) in enumerate(zip(weights.tolist(), values.tolist(), bounds.tolist())):
+        chunk = 1
+        while ub > 0:
+            copies = min(chunk, ub)
+            ub -= copies
+            chunk *= 2
+            chunk_w = w * copies
+            # The candidate row is a new array, so the table can be updated in place afterwards
+            candidate = best[:-chunk_w] + v * copies
+            taken = candidate > best[chunk_w:]
+            np.maximum(best[chunk_w:], candidate, out=best[chunk_w:])
+            steps.append((i, copies, chunk_w, taken))
+
+    counts = [0] * len(weights)
+    remaining = capacity
+    for i, copies, chunk_w, taken in reversed(steps):
+        if remaining >= chunk_w and taken[remaining - chunk_w]:
+            counts[i] += copies
+            remaining -= chunk_w
+    return tuple(counts), float(best[capacity])
+
+def generate_patterns(piece_lengths: list[float], piece_qty: list[int],
+                      stock_lengths: list[float], kerf: float = 0.0) -> dict:
+    """
+    Builds a reduced pattern set by column generation (Gilmore-Gomory) instead of enumerating every pattern.
+    The LP relaxation of the cutting stock problem is solved in-process with HiGHS using the current patterns; its
+    demand duals then price a bounded knapsack per stock length, and any pattern with negative reduced cost is added
+    until none is left.
+
+    Returns:
+        A dict stock_mm -> list of (counts_tuple, used_with_kerf_mm), the same shape as build_patterns_all_stocks.
+    """
+    piece_mm = [mm(x) for x in piece_lengths]
+    stock_mm = sorted([mm(x) for x in stock_lengths])
+    kerf_mm = mm(kerf)
+    n_pieces = len(piece_mm)
+    # A kerf follows every piece but the last, so each piece weighs length + kerf against a stock of length + kerf
+    weights = np.asarray(piece_mm, dtype=np.int64) + kerf_mm
+    max_counts = np.asarray(piece_qty, dtype=np.int64)
+    cost_weight = max(stock_mm) + 2  # Same objective as solve_with_pulp: (max + 1) * purchased + waste
+
+    def pattern_used(counts):
+        return sum(c * pl for c, pl in zip(counts, piece_mm)) + max(0, sum(counts) - 1) * kerf_mm
+
+    # Start from one homogeneous pattern per piece and stock so that the LP is feasible
+    patterns_by_stock = {s: [] for s in stock_mm}
+    seen_by_stock = {s: set() for s in stock_mm}
+    for s in stock_mm:
+        n_fits = np.minimum(max_counts, np.floor_divide(s + kerf_mm, weights)).tolist()
+        for i, n_fit in enumerate(n_fits):
+            if n_fit > 0:
+                counts = tuple(n_fit if k == i else 0 for k in range(n_pieces))
+                patterns_by_stock[s].append((counts, pattern_used(counts)))
+                seen_by_stock[s].add(counts)
+
+    demand = -max_counts  # Demand rows as -counts . y <= -qty
+    for _ in range(MAX_PRICING_ROUNDS):
+        columns = [(s, counts, used) for s, patt_list in patterns_by_stock.items() for counts, used in patt_list]
+        costs = [cost_weight * s - used for s, _, used in columns]
+        neg_counts = -np.asarray([counts for _, counts, _ in columns], dtype=np.int64).T
+        result = linprog(costs, A_ub=neg_counts, b_ub=demand, bounds=(0, None), method='highs')
+        if result.status != 0:
+            break
+        duals = -result.ineqlin.marginals  # Marginals are taken against -qty, so negate them
+
+        # Reduced cost of a pattern a on stock s is cost_weight * s + kerf - sum((w_i + dual_i) * a_i)
+        values = weights + duals
+        added = False
+        for s in stock_mm:
+            counts, value = best_knapsack_pattern(weights, values, max_counts, s + kerf_mm)
+            if any(counts) and cost_weight * s + kerf_mm - value < -1e-6 and counts not in seen_by_stock[s]:
+                patterns_by_stock[s].append((counts, pattern_used(counts)))
+                seen_by_stock[s].add(counts)
+                added = True
+        if not added:
+            break
+
+    return {s: patt_list for s, patt_list in patterns_by_stock.items() if patt_list}
+
+def count_pattern_bound(piece_lengths: list[float], piece_qty: list[int], stock_lengths: list[float]) -> int:
+    """
+    Returns an upper bound on the number of patterns enumerate_patterns would visit for the longest stock.
+    """
+    longest = max(mm(x) for x in stock_lengths)
+    lengths_mm = np.asarray([mm(pl) for pl in piece_lengths], dtype=np.int64)
+    bounds = np.minimum(np.asarray(piece_qty, dtype=np.int64), np.floor_divide(longest, lengths_mm))
+    return prod(b + 1 for b in bounds.tolist())
+
+def min_purchasable_mm(total_mm: int, stock_mm: list[int]) -> int:
+    """
+    Returns the smallest total of whole stock lengths that covers total_mm, a lower bound on any purchase.
+    Reachable totals are found by an unbounded subset-sum over the stock lengths, in units of their gcd.
+    """
+    unit = gcd(*stock_mm)
+    sizes = sorted({s // unit for s in stock_mm})
+    target = -(-total_mm // unit)
+    limit = target + sizes[-1]  # Some multiple of the longest stock always lands in [target, limit]
+    reachable = np.zeros(limit + 1, dtype=bool)
+    reachable[0] = True
+    for size in sizes:
+        # Blocks are processed in order, so each one already includes the copies added to the block before it
+        for start in range(size, limit + 1, size):
+            end = min(start + size, limit + 1)
+            reachable[start:end] |= reachable[start - size:end - size]
+    return (target + int(np.argmax(reachable[target:]))) * unit
+
+def min_leftover_mm(purchased_mm: int, stock_mm: list[int], piece_mm: list[int], piece_qty: list[int]) -> int:
+    """
+    Returns the least waste of any purchase totalling exactly purchased_mm, a lower bound on the waste term of
+    solve_with_pulp. No pattern fills a bar beyond the best knapsack fill of its stock, so the bound is the cheapest
+    mix of stock lengths adding up to purchased_mm, each costing its unavoidable leftover.
+    """
+    weights = np.asarray(piece_mm, dtype=np.int64)
+    max_counts = np.asarray(piece_qty, dtype=np.int64)
+    unit = gcd(*stock_mm)
+    target = purchased_mm // unit
+    leftover = np.full(target + 1, np.inf)
+    leftover[0] = 0
+    for s in sorted(set(stock_mm)):
+        size = s // unit
+        _, best_fill = best_knapsack_pattern(weights, weights, max_counts, s)
+        # Blocks in order, as in min_purchasable_mm, so a stock length can be bought any number of times
+        for start in range(size, target + 1, size):
+            end = min(start + size, target + 1)
+            np.minimum(leftover[start:end], leftover[start - size:end - size] + (s - best_fill),
+                       out=leftover[start:end])
+    return int(leftover[target])
+
+def greedy_cutting_plan(piece_lengths: list[float], piece_qty: list[int],
+                        stock_lengths: list[float]) -> dict[str, Any] | None:
+    """
+    Packs the pieces best-fit decreasing into each stock length in turn, without kerf, then cuts every bar from the
+    shortest stock that still holds its pieces, and fills the leftovers with extra pieces as the waste term of
+    solve_with_pulp does. A plan is only returned when its purchased length equals min_purchasable_mm and its waste
+    equals min_leftover_mm, which makes it optimal for both objectives of solve_with_pulp.
+
+    Returns:
+        A solution dict in the shape of solve_with_pulp, or None when no packing reaches both bounds or the bound
+        tables would exceed MAX_GREEDY_BOUND_UNITS.
+    """
+    piece_mm = [mm(x) for x in piece_lengths]
+    stock_mm = sorted({mm(x) for x in stock_lengths})
+    n_pieces = len(piece_mm)
+    total_mm = sum(q * pl for q, pl in zip(piece_qty, piece_mm))
+    if not total_mm or not stock_mm:
+        return None
+    if total_mm // gcd(*stock_mm) > MAX_GREEDY_BOUND_UNITS:
+        return None  # Odd stock lengths shrink the gcd, and the bound tables grow past what the shortcut saves
+    bound = min_purchasable_mm(total_mm, stock_mm)
+    least_waste = None  # Computed once a packing reaches the purchase bound
+    order = sorted(range(n_pieces), key=lambda i: piece_mm[i], reverse=True)
+    weights = np.asarray(piece_mm, dtype=np.int64)
+
+    for s in stock_mm:
+        if piece_mm[order[0]] > s:
+            continue
+        bin_counts = []
+        free = []  # Sorted (remaining mm, bin index)
+        for i in order:
+            pl = piece_mm[i]
+            for _ in range(piece_qty[i]):
+                pos = bisect_left(free, (pl, -1))
+                if pos < len(free):
+                    remaining, idx = free.pop(pos)
+                else:
+                    remaining, idx = s, len(bin_counts)
+                    bin_counts.append([0] * n_pieces)
+                bin_counts[idx][i] += 1
+                insort(free, (remaining - pl, idx))
+
+        # Shortest stock holding each bar's pieces
+        bars = [(stock_mm[bisect_left(stock_mm, s - remaining)], idx) for remaining, idx in free]
+        if sum(stock for stock, _ in bars) != bound:
+            continue
+
+        bars_per_pattern = Counter((stock, tuple(bin_counts[idx])) for stock, idx in bars)
+        patterns = Counter()
+        for (stock, counts), quantity in bars_per_pattern.items():
+            # Longest fill of the leftover with extra pieces, within the same per-pattern counts the solver allows
+            remaining = stock - sum(c * pl for c, pl in zip(counts, piece_mm))
+            spare = np.asarray(piece_qty, dtype=np.int64) - counts
+            extra, _ = best_knapsack_pattern(weights, weights, spare, remaining)
+            patterns[stock, tuple(c + e for c, e in zip(counts, extra))] += quantity
+
+        total_used_mm = sum(quantity * sum(c * pl for c, pl in zip(counts, piece_mm))
+                            for (_, counts), quantity in patterns.items())
+        if least_waste is None:
+            least_waste = min_leftover_mm(bound, stock_mm, piece_mm, piece_qty)
+        if bound - total_used_mm != least_waste:
+            continue  # The solver may fill the leftovers better
+
+        purchases = []
+        produced = [0] * n_pieces
+        for (stock, counts), quantity in patterns.items():
+            used = sum(c * pl for c, pl in zip(counts, piece_mm))
+            purchases.append({
+                'stock_length_m': m(stock),
+                'pattern_counts': counts,
+                'used_length_m': m(used),
+                'waste_m': m(stock - used),
+                'quantity': quantity
+            })
+            for i in range(n_pieces):
+                produced[i] += counts[i] * quantity
+
+        return {
+            'status': 'Optimal',
+            'proven_optimal': True,
+            'total_purchased_m': m(bound),
+            'total_used_m': m(total_used_mm),
+            'total_waste_m': m(bound - total_used_mm),
+            'purchases': purchases,
+            'produced_counts': produced,
+            'demand_counts': piece_qty,
+        }
+
+    return None
+
 def solve_with_pulp(piece_lengths: list[float], piece_qty: list[int],
                     stock_lengths: list[float], kerf: float = 0.0, verbose: bool = False) -> dict[str, Any]:
     """
@@ -120,7 +372,12 @@ def solve_with_pulp(piece_lengths: list[float], piece_qty: list[int],
     """
     piece_mm = [mm(x) for x in piece_lengths]
     stock_mm = [mm(x) for x in stock_lengths]
-    patterns_by_stock = build_patterns_all_stocks(piece_lengths, piece_qty, stock_lengths, kerf)
+    enumerate_all = count_pattern_bound(piece_lengths, piece_qty, stock_lengths) <= MAX_ENUMERATED_PATTERNS
+    if enumerate_all:
+        # Small inputs: every pattern is enumerated, so the integer program below is exact
+        patterns_by_stock = build_patterns_all_stocks(piece_lengths, piece_qty, stock_lengths, kerf)
+    else:
+        patterns_by_stock = generate_patterns(piece_lengths, piece_qty, stock_lengths, kerf)
 
     # Flatten patterns for easy indexing
     pattern_index = []
@@ -163,7 +420,9 @@ def solve_with_pulp(piece_lengths: list[float], piece_qty: list[int],
 
     # Solve the problem
     # solver = pulp.PULP_CBC_CMD(path=get_solver_path(), msg=verbose)
-    solver = pulp.COIN_CMD(path=get_solver_path(), msg=verbose)  # Resolves pulp error on a different windows
+    time_limit = None if enumerate_all else GENERATED_PATTERNS_TIME_LIMIT
+    # Resolves pulp error on a different windows
+    solver = pulp.COIN_CMD(path=get_solver_path(), msg=verbose, timeLimit=time_limit)
     prob.solve(solver)
 
     if pulp.LpStatus[prob.status] != 'Optimal':
@@ -194,6 +453,8 @@ def solve_with_pulp(piece_lengths: list[float], piece_qty: list[int],
 
     solution = {
         'status': 'Optimal',
+        # Generated patterns are only a subset, and a time-limited solve may stop at its best plan so far
+        'proven_optimal': enumerate_all and prob.sol_status == pulp.LpSolutionOptimal,
         'total_purchased_m': m(final_total_purchased_mm),
         'total_used_m': m(final_total_used_mm),
         'total_waste_m': m(final_total_purchased_mm - final_total_used_mm),
@@ -205,6 +466,12 @@ def solve_with_pulp(piece_lengths: list[float], piece_qty: list[int],
 
 def find_optimized_cutting_plan(demands: dict[str, list[tuple]], stocks: dict[str, list[float]], kerf: float = 0.0,
                                 verbose: bool = False):
+    """
+    Builds the purchase list and cutting plan for every bar diameter.
+    Small inputs are solved exactly. Inputs with too many patterns to enumerate are solved over generated patterns
+    within GENERATED_PATTERNS_TIME_LIMIT, so their plans are good but not proven optimal; the rows of such a
+    diameter carry 'Proven Optimal': False so the workbook can flag them.
+    """
     cutting_plan = []
     purchase_list = []
     all_available_stocks = sorted(list(set(l for stock_list in stocks.values() for l in stock_list)))
@@ -214,12 +481,19 @@ def find_optimized_cutting_plan(demands: dict[str, list[tuple]], stocks: dict[st
         piece_qty = [q for (q, l) in piecelist]
         piece_lengths = [l for (q, l) in piecelist]
 
-        result = solve_with_pulp(piece_lengths, piece_qty, stocks[size], kerf=kerf, verbose=verbose)
+        result = None
+        if not kerf:
+            # A greedy plan that reaches both lower bounds is already optimal, so the solver can be skipped
+            result = greedy_cutting_plan(piece_lengths, piece_qty, stocks[size])
+        if result is None:
+            result = solve_with_pulp(piece_lengths, piece_qty, stocks[size], kerf=kerf, verbose=verbose)
 
         if result['status'] != 'Optimal':
             cutting_plan.append({'Error': result['message'], 'Diameter': size, 'Length': None, 'Quantity': None})
-            print(f'Could not find optimal solution for diameter {size}: {result['message']}')
+            log.warning('Could not find optimal solution for diameter %s: %s', size, result['message'])
             continue
+        if not result['proven_optimal']:
+            log.warning('Cutting plan for diameter %s is the best found, but not proven optimal', size)
 
         row: dict[str, int | float | str] = {'Diameter': size}
         row.update({f'{l:.1f}m': 0 for l in all_available_stocks})
@@ -234,7 +508,8 @@ def find_optimized_cutting_plan(demands: dict[str, list[tuple]], stocks: dict[st
             cut = [(q, l) for q, l in zip(res['pattern_counts'], piece_lengths) if q > 0]
             cut_per_rsb = [f'{q}x{int(l * 1000 + 0.5) / 1000:0.3f}m' for q, l in cut]
             cutting_plan.append({'Diameter': size, 'Quantity': quantity, 'Length': res['stock_length_m'],
-                                 'Cut Per RSB': cut_per_rsb})
+                                 'Cut Per RSB': cut_per_rsb, 'Proven Optimal': result['proven_optimal']})
+        row['Proven Optimal'] = result['proven_optimal']
         purchase_list.append(row)
 
     purchase_list = sorted(purchase_list, key=lambda item: item['Diameter'])
@@ -6,9 +6,11 @@ from PyQt6.QtWidgets import (
     QLineEdit, QComboBox, QTextEdit, QCheckBox, QScrollArea, QStackedWidget, QAbstractSpinBox
 )
 import traceback
+from functools import lru_cache
 from PyQt6.QtGui import QPixmap, QCursor, QEnterEvent, QPainter, QColor
 from PyQt6.QtCore import Qt, QEvent, pyqtSignal, QObject, QPropertyAnimation, QEasingCurve, QPoint, \
     QParallelAnimationGroup
+import logging
 import re
 from typing import Literal
 import os
@@ -367,6 +369,25 @@ def load_stylesheet(filename):
 
     return processed_stylesheet
 
+@lru_cache(maxsize=64)
+def _cached_scaled_pixmap(path: str, width: int, height: int) -> QPixmap:
+    """
+    Loads an image file and scales it, decoding each path and size combination only once.
+
+    Args:
+        path: The file path of the image.
+        width: The target width for scaling.
+        height: The target height for scaling.
+
+    Returns:
+        The scaled QPixmap, or a null QPixmap if the image could not be loaded.
+    """
+    pixmap = QPixmap(path)
+    if pixmap.isNull():
+        return pixmap
+    return pixmap.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio,
+                         Qt.TransformationMode.SmoothTransformation)
+
 def get_img(path: str, width: int, height: int, class_name: str = 'image-container',
             alignment: Qt.AlignmentFlag = None, return_pixmap: bool = False) -> QLabel | QPixmap:
     """
@@ -383,25 +404,24 @@ def get_img(path: str, width: int, height: int, class_name: str = 'image-contain
     Returns:
         A configured QLabel or the raw QPixmap.
     """
+    # Scaling can also theoretically fail, e.g., with a MemoryError on huge images
+    try:
+        pixmap = _cached_scaled_pixmap(path, width, height)
+        error_text = f'Image {path} not found or could not be loaded.'
+    except MemoryError:
+        pixmap = QPixmap()
+        error_text = f'Not enough memory to scale the image {path}.'
+    if return_pixmap:
+        return pixmap
+
     container = QLabel()
     container.setProperty('class', class_name)
     if alignment is not None:
         container.setAlignment(alignment)
-    pixmap = QPixmap(path)
     if pixmap.isNull():
-        if return_pixmap:
-            return pixmap
-        container.setText(f'Image {path} not found or could not be loaded.')
+        container.setText(error_text)
     else:
-        # Scaling can also theoretically fail, e.g., with a MemoryError on huge images
-        try:
-            scaled_pixmap = pixmap.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio,
-                                          Qt.TransformationMode.SmoothTransformation)
-            if return_pixmap:
-                return scaled_pixmap
-            container.setPixmap(scaled_pixmap)
-        except MemoryError:
-            container.setText(f'Not enough memory to scale the image {path}.')
+        container.setPixmap(pixmap)
     return container
 
 def update_image(selected_text: str, image_map: dict[str, str], update_this_object: QLabel, width: int | None = None,
@@ -425,7 +445,7 @@ def update_image(selected_text: str, image_map: dict[str, str], update_this_obje
     if pixmap.isNull():
         update_this_object.setText(f'Image path {path} not found.')
     else:
-        update_this_object.setPixmap(get_img(path, width, width, return_pixmap=True))
+        update_this_object.setPixmap(pixmap)
 
 def toggle_obj_visibility(selected_text: str, target_text: str, objs: QWidget | list[QWidget], hide_when_target: bool = False) -> None:
     """
@@ -471,11 +491,16 @@ def is_widget_empty(widget: QWidget) -> bool:
     elif isinstance(widget, QLineEdit):
         return not widget.text().strip()
     elif isinstance(widget, QTextEdit):
-        return not widget.toPlainText().strip()
+        # An empty document is answered without building the plain text copy
+        return widget.document().isEmpty() or not widget.toPlainText().strip()
     # For other widgets like QComboBox, we assume a selection is always valid if visible.
     return False
 
 
+# Precompiled tokenizers for parse_spacing_string, which runs on every spacing edit
+_SPACING_ENTRY_SEP_RE = re.compile(r'\s*,\s*')
+_SPACING_VALUE_SEP_RE = re.compile(r'\s*(?:@|at)\s*', re.IGNORECASE)
+
 def parse_spacing_string(text: str) -> list[tuple[float]]:
     """
     Parses a spacing string into a list of tuples, enforcing strict validation.
@@ -499,13 +524,13 @@ def parse_spacing_string(text: str) -> list[tuple[float]]:
         raise TypeError('Input must be a string.')
 
     results = []
-    entries = re.split(r'\s*,\s*', text.strip())
+    entries = _SPACING_ENTRY_SEP_RE.split(text.strip())
 
     for entry in entries:
         if not entry:
             continue
 
-        parts = re.split(r'\s*(?:@|at)\s*', entry, flags=re.IGNORECASE)
+        parts = _SPACING_VALUE_SEP_RE.split(entry)
         if len(parts) != 2 or not parts[0] or not parts[1]:
             raise ValueError(
                 f'Invalid format in {entry}. Each part must use @ or at to separate a value and a number.')
@@ -601,6 +626,7 @@ def parse_nested_dict(data: dict[str, Any]) -> dict[str, Any]:
 
     return recurse(data)
 
+@lru_cache(maxsize=128)
 def get_bar_dia(code: int | str, system: Literal['ph', 'soft_metric', 'imperial'] = 'ph') -> float:
     if isinstance(code, str) and code.startswith('#'):
         code = int(code[1:])
@@ -651,6 +677,7 @@ def get_bar_dia(code: int | str, system: Literal['ph', 'soft_metric', 'imperial'
             f'Invalid bar sizing scheme {system}. Valid choices are ph, soft_metric, and imperial.')
     return bar_sizes[code]
 
+@lru_cache(maxsize=128)
 def get_dia_code(mm: int | float, system: Literal['ph', 'soft_metric', 'imperial'] = 'ph') -> str:
     if system == 'imperial':
         rebar_code = {9.525: '#3', 12.7: '#4', 15.875: '#5', 19.05: '#6', 22.225: '#7',
@@ -698,6 +725,14 @@ def safe_parse_to_num(text: str) -> float:
         # Re-raise with a more specific message if needed, or let the caller handle it.
         raise ValueError(f'Could not convert {text} to integer.')
 
+def configure_logging() -> None:
+    """
+    Shows module diagnostics on the console when running from source.
+    Frozen builds are windowed with no console, so they are left unconfigured.
+    """
+    if __debug__ and not getattr(sys, 'frozen', False):
+        logging.basicConfig(level=logging.INFO, format='%(levelname)s %(name)s: %(message)s')
+
 def global_exception_hook(exc_type, exc_value, exc_traceback):
     """
     Catches any unhandled exceptions, extracts detailed location info,
@@ -743,10 +778,12 @@ def global_exception_hook(exc_type, exc_value, exc_traceback):
     if not QApplication.instance():
         error_app.quit()
 
+@lru_cache(maxsize=128)
 def resource_path(relative_path: str) -> str:
     """
     Universal resource locator.
     Works for: Dev, PyInstaller (OneFile/Dir), Nuitka (OneFile/Dir).
+    The bundle location is fixed for the life of the process, so results are cached.
     """
     try:
         # PyInstaller creates a temp folder and stores path in _MEIPASS